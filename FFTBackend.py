@@ -0,0 +1,221 @@
+"""
+FFT backends used by Image and Mixer.
+
+The backend is picked with set_backend(name, precision) or the IMAGE_MIXER_FFT_BACKEND and
+IMAGE_MIXER_FFT_PRECISION environment variables. Backends whose package isn't installed fall back to NumPy.
+"""
+import atexit
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+PRECISIONS = {
+    "double": (np.float64, np.complex128),
+    "single": (np.float32, np.complex64),
+}
+
+
+class NumpyBackend:
+    name = "numpy"
+
+    def __init__(self, precision="double", threads=None):
+        """
+        :param precision: "double" (float64/complex128) or "single" (float32/complex64)
+        :param threads: ignored, NumPy transforms are single threaded
+        """
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision {precision!r}, expected one of {list(PRECISIONS)}")
+        self.precision = precision
+        self.real_dtype, self.complex_dtype = PRECISIONS[precision]
+
+    def fft2(self, a, axes=(-2, -1)):
+        return np.fft.fft2(self._complex_input(a), axes=axes).astype(self.complex_dtype, copy=False)
+
+    def ifft2(self, a, axes=(-2, -1)):
+        return np.fft.ifft2(self._complex_input(a), axes=axes).astype(self.complex_dtype, copy=False)
+
+    def rfft2(self, a, axes=(-2, -1)):
+        return np.fft.rfft2(self._real_input(a), axes=axes).astype(self.complex_dtype, copy=False)
+
+    def irfft2(self, a, s, axes=(-2, -1)):
+        return np.fft.irfft2(self._complex_input(a), s=s, axes=axes).astype(self.real_dtype, copy=False)
+
+    def _real_input(self, a):
+        return np.asarray(a, dtype=self.real_dtype)
+
+    def _complex_input(self, a):
+        a = np.asarray(a)
+        if np.iscomplexobj(a):
+            return a.astype(self.complex_dtype, copy=False)
+        return a.astype(self.real_dtype, copy=False)
+
+
+class ScipyBackend(NumpyBackend):
+    """scipy.fft, multithreaded, and it computes single precision transforms natively"""
+    name = "scipy"
+
+    def __init__(self, precision="double", threads=None):
+        """
+        :param threads: number of threads per transform, defaults to all CPUs
+        """
+        super().__init__(precision)
+        import scipy.fft
+        self.fft = scipy.fft
+        self.workers = threads or -1
+
+    def fft2(self, a, axes=(-2, -1)):
+        return self.fft.fft2(self._complex_input(a), axes=axes, workers=self.workers)
+
+    def ifft2(self, a, axes=(-2, -1)):
+        return self.fft.ifft2(self._complex_input(a), axes=axes, workers=self.workers)
+
+    def rfft2(self, a, axes=(-2, -1)):
+        return self.fft.rfft2(self._real_input(a), axes=axes, workers=self.workers)
+
+    def irfft2(self, a, s, axes=(-2, -1)):
+        return self.fft.irfft2(self._complex_input(a), s=s, axes=axes, workers=self.workers)
+
+
+class PyFFTWBackend(NumpyBackend):
+    """
+    FFTW through pyFFTW. The most recently used plans are cached per (transform, shape, dtype, axes) and the
+    accumulated wisdom is saved at exit, so later runs skip the planning. A plan owns its input and output buffers,
+    so each one runs for one thread at a time.
+    """
+    name = "pyfftw"
+    default_wisdom_file = os.path.join(os.path.expanduser("~"), ".cache", "image_mixer", "fftw_wisdom.pickle")
+
+    def __init__(self, precision="double", threads=None, planner_effort="FFTW_MEASURE", wisdom_file=None,
+                 max_plans=32):
+        """
+        :param threads: number of threads per transform, defaults to the number of CPUs
+        :param planner_effort: FFTW planner flag, FFTW_MEASURE pays a one time planning cost per shape
+        :param wisdom_file: where the FFTW wisdom is loaded from and saved to, None for the default location
+        :param max_plans: plans kept, with their buffers, before the least recently used one is dropped. Replanning
+            a dropped one is quick, its wisdom is kept
+        """
+        super().__init__(precision)
+        import pyfftw
+        import pyfftw.builders
+        self.pyfftw = pyfftw
+        self.threads = threads or os.cpu_count() or 1
+        self.planner_effort = planner_effort
+        self.wisdom_file = wisdom_file or PyFFTWBackend.default_wisdom_file
+        self.max_plans = max_plans
+        # key -> (plan, lock held while the plan runs), least recently used first
+        self.plans = OrderedDict()
+        self.plans_lock = threading.Lock()
+        self.__load_wisdom()
+        _wisdom_files.add(self.wisdom_file)
+
+    def fft2(self, a, axes=(-2, -1)):
+        return self.__execute("fft2", self._complex_input(a), axes)
+
+    def ifft2(self, a, axes=(-2, -1)):
+        return self.__execute("ifft2", self._complex_input(a), axes)
+
+    def rfft2(self, a, axes=(-2, -1)):
+        return self.__execute("rfft2", self._real_input(a), axes)
+
+    def irfft2(self, a, s, axes=(-2, -1)):
+        return self.__execute("irfft2", self._complex_input(a), axes, tuple(s))
+
+    def __execute(self, transform, a, axes, s=None):
+        key = (transform, a.shape, a.dtype.str, tuple(axes), s)
+        with self.plans_lock:
+            entry = self.plans.get(key)
+            if entry is None:
+                logger.debug(f"Planning {transform} for shape {a.shape} ({a.dtype})")
+                builder = getattr(self.pyfftw.builders, transform)
+                kwargs = {"s": s} if s is not None else {}
+                plan = builder(self.pyfftw.empty_aligned(a.shape, a.dtype), axes=axes, threads=self.threads,
+                               planner_effort=self.planner_effort, **kwargs)
+                entry = self.plans[key] = (plan, threading.Lock())
+                while len(self.plans) > self.max_plans:
+                    # a thread running the evicted plan keeps its own reference to it
+                    self.plans.popitem(last=False)
+            else:
+                self.plans.move_to_end(key)
+        plan, lock = entry
+        with lock:
+            # the plan reuses its output buffer on every call
+            return plan(a).copy()
+
+    def __load_wisdom(self):
+        if not os.path.exists(self.wisdom_file):
+            return
+        try:
+            with open(self.wisdom_file, "rb") as file:
+                self.pyfftw.import_wisdom(pickle.load(file))
+        except Exception as e:
+            logger.warning(f"Could not load FFTW wisdom from {self.wisdom_file}: {e}")
+
+    def save_wisdom(self):
+        PyFFTWBackend.write_wisdom(self.pyfftw, self.wisdom_file)
+
+    @staticmethod
+    def write_wisdom(pyfftw, wisdom_file):
+        try:
+            os.makedirs(os.path.dirname(wisdom_file), exist_ok=True)
+            with open(wisdom_file, "wb") as file:
+                pickle.dump(pyfftw.export_wisdom(), file)
+        except Exception as e:
+            logger.warning(f"Could not save FFTW wisdom to {wisdom_file}: {e}")
+
+
+# wisdom files of the PyFFTWBackends created, the wisdom itself is process wide
+_wisdom_files = set()
+
+
+@atexit.register
+def _save_wisdom():
+    """Save the FFTW wisdom once at exit, to each wisdom file in use"""
+    if not _wisdom_files:
+        return
+    import pyfftw
+    for wisdom_file in _wisdom_files:
+        PyFFTWBackend.write_wisdom(pyfftw, wisdom_file)
+
+
+BACKENDS = {
+    NumpyBackend.name: NumpyBackend,
+    ScipyBackend.name: ScipyBackend,
+    PyFFTWBackend.name: PyFFTWBackend,
+}
+
+_backend = None
+
+
+def set_backend(name="numpy", precision="double", threads=None):
+    """
+    Select the FFT backend used by Image and Mixer, falling back to NumPy if its package isn't installed
+    :param name: "numpy", "scipy" or "pyfftw"
+    :param precision: "double" or "single"
+    :param threads: threads per transform of the multithreaded backends, None for one per CPU. Use 1 in the
+        processes of a pool, which already keeps every CPU busy
+    :return: the backend now in use
+    """
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown FFT backend {name!r}, expected one of {list(BACKENDS)}")
+    try:
+        _backend = BACKENDS[name](precision, threads)
+    except ImportError as e:
+        logger.warning(f"FFT backend {name!r} is not available ({e}), falling back to numpy")
+        _backend = NumpyBackend(precision)
+    logger.info(f"Using the {_backend.name} FFT backend in {_backend.precision} precision")
+    return _backend
+
+
+def get_backend():
+    if _backend is None:
+        set_backend(os.environ.get("IMAGE_MIXER_FFT_BACKEND", "numpy"),
+                    os.environ.get("IMAGE_MIXER_FFT_PRECISION", "double"))
+    return _backend
@@ -1,50 +1,399 @@
+from collections import OrderedDict
+from itertools import count
+import threading
+
 import numpy as np
 from PIL import Image as PILImage
 
-from logger_config import setup_logger
+import FFTBackend
+from Instrumentation import get_instrumentation
+from logger_config import array_range, setup_logger
 
 logger = setup_logger(__name__)
 
 
 class Image:
-    def __init__(self, image_data):
+    # source of the version numbers, unique across all images
+    _versions = count()
+    ft_components = ("Magnitude", "Phase", "Real", "Imaginary")
+    # size -> (pixels, spectrum) shared by the placeholder images
+    _placeholders = {}
+    # the pyramid stops once the larger side of a level would be smaller than this
+    pyramid_min_size = 64
+    # images derived by at_size at sizes other than a pyramid level, kept per source image
+    resized_cache_size = 2
+
+    def __init__(self, image_data, real_fft=False, spectrum=None, size=None):
+        """
+        The spectrum is only computed when it is first needed, at whatever size the image has by then.
+        :param image_data: 2D array of gray levels, or (channels, height, width) array of a color image
+        :param real_fft: keep only the Hermitian half spectrum (rfft2, unshifted) instead of the full shifted one.
+            Halves the transform time and spectrum memory, the full spectrum is derived on demand.
+        :param spectrum: precomputed spectrum of image_data to skip the FFT, in the layout selected by real_fft
+        :param size: (width, height) to resize image_data to before anything else
+        """
+        if size is not None and image_data.shape[-2:] != (size[1], size[0]):
+            image_data = Image.resize_pixels(image_data, size)
+            spectrum = None
+        self.real_fft = real_fft
         self.image_data = image_data
         self.modified_image_data = image_data.copy()
-        ft = np.fft.fft2(image_data)
-        self.ft = np.fft.fftshift(ft)
-        self.modified_ft = self.ft.copy()
-        self.size = image_data.shape
+        # (height, width), whatever the number of channels
+        self.size = image_data.shape[-2:]
+        self.__spectrum = spectrum
+        # None while no edit touched the spectrum, the original one is used as is
+        self.__modified_spectrum = None
+        self.__reset_edit_state()
+        self.__reset_pyramid()
+
+    def __reset_edit_state(self):
+        """Cached data of the incremental brightness/contrast path, only valid for the current image_data"""
+        self.__histogram = None
+        self.__spectrum_buffer = None
+        self.__applied_contrast = None
+        # base_version changes with image_data, version with any edit of the modified data or spectrum
+        self.base_version = next(Image._versions)
+        self.version = self.base_version
+        # component -> (plane key, float plane, min and max outside the DC bin)
+        self.__ft_planes = {}
+        # component -> (version, (min, max), uint8 plane)
+        self.__ft_images = {}
+        # (brightness, contrast) of the last changeBrightnessContrast, None after any other edit
+        self.edit = (0, 1)
+
+    def __reset_pyramid(self):
+        """Images derived from image_data and the original spectrum, see level and at_size"""
+        # level index - 1 -> Image
+        self.__levels = []
+        # (height, width) -> Image, least recently used first
+        self.__resized = OrderedDict()
+        # the GUI thread and the mixing thread both take images at some size of the viewports' images
+        self.__pyramid_lock = threading.RLock()
+
+    def __edited(self, known_gain=False):
+        self.version = next(Image._versions)
+        self.edit = None
+        if not known_gain:
+            self.__applied_contrast = None
+
+    @property
+    def channels(self):
+        """Number of color channels, 1 for a grayscale image"""
+        return self.image_data.shape[0] if self.image_data.ndim == 3 else 1
+
+    @property
+    def stored_ft(self):
+        """
+        The spectrum of the original image as it is stored: the unshifted half spectrum in real FFT mode,
+        else the full shifted one. Computed on first access, for all the channels of a color image in one batched
+        transform over the last two axes.
+        """
+        if self.__spectrum is None:
+            fft = FFTBackend.get_backend()
+            with get_instrumentation().span("fft", ("fft",), shape=self.size, real_fft=self.real_fft,
+                                            backend=fft.name, precision=fft.precision) as span:
+                if self.real_fft:
+                    self.__spectrum = fft.rfft2(self.image_data)
+                else:
+                    self.__spectrum = np.fft.fftshift(fft.fft2(self.image_data), axes=(-2, -1))
+                span.attributes["fft_shape"] = self.__spectrum.shape
+                span.stage("fft", self.__spectrum.nbytes)
+        return self.__spectrum
+
+    @property
+    def stored_modified_ft(self):
+        """The edited spectrum, in the same layout as stored_ft"""
+        if self.__modified_spectrum is None:
+            return self.stored_ft
+        return self.__modified_spectrum
+
+    def __writable_modified_spectrum(self):
+        if self.__modified_spectrum is None:
+            self.__modified_spectrum = self.stored_ft.copy()
+        return self.__modified_spectrum
+
+    @property
+    def half_ft(self):
+        """The unshifted half spectrum of the original image in real FFT mode, else None"""
+        return self.stored_ft if self.real_fft else None
+
+    @property
+    def modified_half_ft(self):
+        """The unshifted half spectrum of the edited image in real FFT mode, else None"""
+        return self.stored_modified_ft if self.real_fft else None
+
+    @property
+    def ft(self):
+        """The full, shifted spectrum of the original image"""
+        if self.real_fft:
+            return Image.full_spectrum(self.stored_ft, self.size[1])
+        return self.stored_ft
+
+    @property
+    def modified_ft(self):
+        """The full, shifted spectrum of the edited image"""
+        if self.real_fft:
+            return Image.full_spectrum(self.stored_modified_ft, self.size[1])
+        return self.stored_modified_ft
+
+    def __dc_index(self):
+        if self.real_fft:
+            return ..., 0, 0
+        return (...,) + tuple(x // 2 for x in self.size)
+
+    @staticmethod
+    def full_spectrum(half_ft, width):
+        """
+        Rebuild the full, shifted spectrum from the half spectrum of a real image
+        :param half_ft: output of rfft2, shape (..., height, width // 2 + 1)
+        :param width: width of the original image
+        """
+        height, half_width = half_ft.shape[-2:]
+        full = np.empty(half_ft.shape[:-1] + (width,), dtype=half_ft.dtype)
+        full[..., :half_width] = half_ft
+        # real input => F[k, l] = conj(F[-k, -l])
+        rows = -np.arange(height) % height
+        cols = -np.arange(half_width, width) % width
+        full[..., half_width:] = np.conj(half_ft[..., rows[:, None], cols])
+        return np.fft.fftshift(full, axes=(-2, -1))
 
     def resize(self, new_size):
         """
         Resize the image to a new size
         :param new_size: (width, height)
         """
-        self.image_data = np.array(PILImage.fromarray(self.image_data).resize(new_size))
+        self.image_data = Image.resize_pixels(self.image_data, new_size)
         self.modified_image_data = self.image_data.copy()
-        ft = np.fft.fft2(self.modified_image_data)
-        self.ft = np.fft.fftshift(ft)
-        self.modified_ft = self.ft.copy()
-        self.size = self.image_data.shape
+        self.size = self.image_data.shape[-2:]
+        self.__spectrum = None
+        self.__modified_spectrum = None
+        self.__reset_edit_state()
+        self.__reset_pyramid()
+
+    @staticmethod
+    def resize_pixels(pixels, size):
+        """
+        :param pixels: 2D gray levels or (channels, height, width) color pixels
+        :param size: (width, height)
+        """
+        if pixels.ndim == 2:
+            return np.array(PILImage.fromarray(pixels).resize(size))
+        resized = PILImage.fromarray(np.ascontiguousarray(np.moveaxis(pixels, 0, -1))).resize(size)
+        return np.ascontiguousarray(np.moveaxis(np.array(resized), -1, 0))
+
+    @staticmethod
+    def to_interleaved(pixels):
+        """(height, width, channels) view of color pixels as PIL and QImage expect them, gray levels unchanged"""
+        if pixels.ndim == 2:
+            return pixels
+        return np.ascontiguousarray(np.moveaxis(pixels, 0, -1))
+
+    @property
+    def level_shapes(self):
+        """
+        (height, width) of every level of the pyramid, from this image (level 0) down, each level halving the
+        previous one until its larger side would be under pyramid_min_size
+        """
+        height, width = self.size
+        shapes = [(height, width)]
+        while min(height, width) >= 2 and max(height, width) // 2 >= Image.pyramid_min_size:
+            height, width = height // 2, width // 2
+            shapes.append((height, width))
+        return shapes
+
+    def level(self, index):
+        """
+        The pyramid level at 1/2^index of this image's resolution, built on first access without decoding or
+        transforming anything: the pixels are averaged 2x2 from the level above, the spectrum is the low
+        frequencies of this image's original spectrum. Levels are unedited, see at_size.
+        """
+        if index == 0:
+            return self
+        shapes = self.level_shapes
+        if not 0 < index < len(shapes):
+            raise IndexError(f"Level {index} out of range, the pyramid has {len(shapes)} levels")
+        with self.__pyramid_lock:
+            while len(self.__levels) < index:
+                above = self.level(len(self.__levels))
+                shape = shapes[len(self.__levels) + 1]
+                self.__levels.append(Image(Image.reduce_pixels(above.image_data), self.real_fft,
+                                           spectrum=self.__resampled_spectrum(shape)))
+                logger.debug("Pyramid level %s of %s built", shape, self.size)
+            return self.__levels[index - 1]
+
+    def level_for(self, size):
+        """
+        :param size: (width, height)
+        :return: index of the smallest level at least that large along both axes, 0 if none is
+        """
+        width, height = size
+        fitting = [i for i, shape in enumerate(self.level_shapes) if shape[0] >= height and shape[1] >= width]
+        return fitting[-1] if fitting else 0
+
+    def at_size(self, size, brightness=0, contrast=1):
+        """
+        This image at another size, from the pyramid level that fits it (see level_for): the level itself when it
+        has that size, else the level resampled in the Fourier domain (its spectrum cropped or zero padded, its
+        pixels resized). Images at sizes other than a level's are cached for the last few sizes.
+        The edit is applied to the returned image, unless it is the one last applied to it, so later calls with
+        the same edit return it as is. At this image's own size, that image is this one.
+        :param size: (width, height)
+        """
+        shape = (size[1], size[0])
+        with self.__pyramid_lock:
+            level = self.level(self.level_for(size))
+            if level.size == shape:
+                image = level
+            else:
+                image = self.__resized.get(shape)
+                if image is None:
+                    image = Image(Image.resize_pixels(level.image_data, size), self.real_fft,
+                                  spectrum=level.__resampled_spectrum(shape))
+                    self.__resized[shape] = image
+                    if len(self.__resized) > Image.resized_cache_size:
+                        self.__resized.popitem(last=False)
+                self.__resized.move_to_end(shape)
+            if image.edit != (brightness, contrast):
+                image.changeBrightnessContrast(brightness, contrast)
+            return image
+
+    def __resampled_spectrum(self, shape):
+        """The original spectrum resampled to shape, scaled like the spectrum of pixels of that shape would be"""
+        spectrum = Image.resample_spectrum(self.stored_ft, self.size, shape, self.real_fft)
+        # the DC bin is the sum of the pixels, so the spectrum scales with the pixel count
+        spectrum *= (shape[0] * shape[1]) / (self.size[0] * self.size[1])
+        return spectrum
+
+    @staticmethod
+    def resample_spectrum(spectrum, source_shape, shape, real_fft=False):
+        """
+        The frequencies an image of the given shape shares with one of source_shape: the others are dropped when
+        the shape is smaller and zero when it is larger, ie: a Fourier down or upsampling of the image.
+        :param spectrum: (..., height, width) full shifted spectrum, or unshifted half spectrum when real_fft
+        :param source_shape: (height, width) of the image the spectrum is of
+        :param shape: (height, width) of the image to resample to
+        :return: new array in the same layout, not scaled
+        """
+        source_rows, rows = Image.__shared_frequencies(source_shape[0], shape[0], shifted=not real_fft)
+        if real_fft:
+            half_width = min(source_shape[1], shape[1]) // 2 + 1
+            source_cols = cols = np.arange(half_width)
+            output_shape = (shape[0], shape[1] // 2 + 1)
+        else:
+            source_cols, cols = Image.__shared_frequencies(source_shape[1], shape[1], shifted=True)
+            output_shape = shape
+        resampled = np.zeros(spectrum.shape[:-2] + output_shape, dtype=spectrum.dtype)
+        resampled[..., rows[:, None], cols] = spectrum[..., source_rows[:, None], source_cols]
+        return resampled
+
+    @staticmethod
+    def __shared_frequencies(source_size, size, shifted):
+        """Indices of the frequencies both axis sizes have, along the source and the target axis"""
+        frequencies = np.arange(-min(source_size // 2, size // 2), min(source_size - source_size // 2,
+                                                                       size - size // 2))
+        if shifted:
+            return frequencies + source_size // 2, frequencies + size // 2
+        return frequencies % source_size, frequencies % size
+
+    @staticmethod
+    def reduce_pixels(pixels):
+        """
+        Halve pixels along their last two axes, each pixel the mean of a 2x2 block, an odd last row or column is
+        dropped
+        """
+        height, width = pixels.shape[-2] // 2, pixels.shape[-1] // 2
+        blocks = pixels[..., :2 * height, :2 * width].reshape(pixels.shape[:-2] + (height, 2, width, 2))
+        if pixels.dtype == np.uint8:
+            return ((blocks.sum(axis=(-3, -1), dtype=np.uint16) + 2) // 4).astype(np.uint8)
+        return blocks.mean(axis=(-3, -1))
 
     def get_ft_image(self, component):
+        """
+        The component of the edited spectrum as a normalized uint8 plane, for display. The component of a color
+        image is averaged over its channels.
+        Rendered planes are cached per component and edit version, and brightness-only edits (which only move the
+        DC bin) reuse the cached component plane. The returned array is shared with the cache, don't modify it.
+        """
+        cached = self.__ft_images.get(component)
+        if cached is not None and cached[0] == self.version:
+            return cached[2]
+
+        dc_index = tuple(x // 2 for x in self.size)
+        plane_key = self.__ft_plane_key(component)
+        entry = self.__ft_planes.get(component)
+        if entry is None or entry[0] != plane_key:
+            plane = np.array(self.__get_ft_component(component))
+            if plane.ndim == 3:
+                plane = plane.mean(axis=0)
+            dc_value = plane[dc_index]
+            # min and max outside the DC bin, which is the only one brightness edits touch
+            plane[dc_index] = plane.flat[0] if plane.size > 1 else dc_value
+            low, high = plane.min(), plane.max()
+            plane[dc_index] = dc_value
+            self.__ft_planes[component] = (plane_key, plane, low, high)
+        else:
+            _, plane, low, high = entry
+            plane[dc_index] = np.mean(self.__get_ft_component_at(component, self.stored_modified_ft[self.__dc_index()]))
+        data_range = (min(low, plane[dc_index]), max(high, plane[dc_index]))
+
+        if cached is not None and cached[1] == data_range and entry is not None and entry[0] == plane_key:
+            # same plane and normalization, only the DC pixel changed
+            data = cached[2]
+            data[dc_index] = self.normalize(plane[dc_index], *data_range)
+        else:
+            data = self.normalize(plane, *data_range)
+        self.__ft_images[component] = (self.version, data_range, data)
+        return data
+
+    def __ft_plane_key(self, component):
+        """
+        What a component plane depends on: the original spectrum and the gain the edits applied to it.
+        The phase doesn't change with a positive gain. Unknown edits get a unique key.
+        """
+        gain = 1 if self.__modified_spectrum is None else self.__applied_contrast
+        if gain is None:
+            return self.version,
+        if component == "Phase" and gain > 0:
+            return self.base_version,
+        return self.base_version, gain
+
+    def __get_ft_component(self, component):
         if component == "Real":
-            data = self.get_real_part()
+            return self.get_real_part()
         elif component == "Imaginary":
-            data = self.get_imaginary_part()
+            return self.get_imaginary_part()
         elif component == "Magnitude":
-            data = self.get_log_magnitude()
-        else:
-            data = self.get_phase()
-        data = self.normalize(data)
-        return data
+            return self.get_log_magnitude()
+        return self.get_phase()
 
     @staticmethod
-    def normalize(data):
-        data = data - data.min()
-        data = data / data.max()
+    def __get_ft_component_at(component, value):
+        if component == "Real":
+            return value.real
+        elif component == "Imaginary":
+            return value.imag
+        elif component == "Magnitude":
+            return np.log1p(np.abs(value))
+        return np.angle(value)
+
+    @staticmethod
+    def normalize(data, low=None, high=None):
+        """
+        Linearly map data to uint8, low to 0 and high to 255
+        :param low: defaults to the minimum of data
+        :param high: defaults to the maximum of data
+        """
+        if low is None:
+            low = data.min()
+        if high is None:
+            high = data.max()
+        if high <= low:
+            # constant data, eg: a region that selects nothing
+            return np.zeros(np.shape(data), dtype=np.uint8)
+        data = data - low
+        data = data / (high - low)
         data = data * 255
-        data = data.astype(np.uint8)
+        data = np.asarray(data).astype(np.uint8)
         return data
 
     def get_real_part(self):
@@ -73,68 +422,181 @@ class Image:
         return np.angle(self.modified_ft)
 
     def changeBrightnessContrast(self, brightness, contrast):
-        self.modified_ft = self.ft.copy()
-        self.modified_image_data = self.image_data.copy()
-        self.change_brightness(brightness)
-        self.change_contrast(contrast)
+        """
+        Apply brightness then contrast to the original image, replacing any previous edit
+        """
+        if self.image_data.dtype == np.uint8:
+            self.__change_brightness_contrast_incrementally(brightness, contrast)
+        else:
+            self.__modified_spectrum = None
+            self.__edited()
+            self.modified_image_data = self.image_data.copy()
+            self.change_brightness(brightness)
+            self.change_contrast(contrast)
+        self.edit = (brightness, contrast)
+
+    def __change_brightness_contrast_incrementally(self, brightness, contrast):
+        """
+        Same result as change_brightness followed by change_contrast, without full array temporaries:
+        the pixels go through a 256 entry lookup table built from the cached histogram, and the spectrum buffer is
+        only rescaled when the contrast changed, otherwise just its DC bin is updated.
+        """
+        logger.debug("Changing brightness to %s and contrast to %s", brightness, contrast)
+        if self.__histogram is None:
+            self.__histogram = np.bincount(self.image_data.ravel(), minlength=256)
+        brightened = np.clip(np.arange(256) + brightness, 0, 255).astype(np.uint8)
+        mean = np.dot(self.__histogram, brightened) / self.image_data.size
+        lut = np.clip((brightened - mean) * contrast + mean, 0, 255).astype(np.uint8)
+        if self.modified_image_data.dtype != np.uint8 or not self.modified_image_data.flags.writeable:
+            self.modified_image_data = np.empty(self.image_data.shape, dtype=np.uint8)
+        np.take(lut, self.image_data, out=self.modified_image_data)
+
+        if brightness == 0 and contrast == 1:
+            self.__modified_spectrum = None
+        else:
+            original = self.stored_ft
+            if self.__modified_spectrum is None or contrast != self.__applied_contrast:
+                if self.__spectrum_buffer is None:
+                    self.__spectrum_buffer = np.empty(original.shape, dtype=original.dtype)
+                np.multiply(original, contrast, out=self.__spectrum_buffer)
+                self.__modified_spectrum = self.__spectrum_buffer
+            # brightness and the mean shift of the contrast only touch the DC component (see __add__, __sub__)
+            dc_index = self.__dc_index()
+            self.__modified_spectrum[dc_index] = (contrast * (original[dc_index] + 2 * np.pi * (brightness - mean))
+                                                  + 2 * np.pi * mean)
+        self.__applied_contrast = contrast
+        self.__edited(known_gain=True)
 
     def change_brightness(self, brightness):
-        logger.info(f"Changing brightness by {brightness}")
-        logger.debug(f"Maximum before change: {self.modified_image_data.max()}")
-        logger.debug(f"Minimum before change: {self.modified_image_data.min()}")
+        logger.debug("Changing brightness by %s", brightness)
+        logger.debug("Range before change: %s", array_range(self.modified_image_data))
         self + brightness
-        logger.debug(f"Maximum before clipping: {self.modified_image_data.max()}")
-        logger.debug(f"Minimum before clipping: {self.modified_image_data.min()}")
+        logger.debug("Range before clipping: %s", array_range(self.modified_image_data))
         self.modified_image_data = np.clip(self.modified_image_data, 0, 255).astype(np.uint8)
-        logger.debug(f"Maximum after clipping: {self.modified_image_data.max()}")
-        logger.debug(f"Minimum after clipping: {self.modified_image_data.min()}")
+        logger.debug("Range after clipping: %s", array_range(self.modified_image_data))
 
     def change_contrast(self, contrast):
         mean = np.mean(self.modified_image_data)
         (self - mean) * contrast + mean
-        logger.info(f"Changed contrast by {contrast}")
-        # logger.debug(f"Maximum before clipping: {self.modified_image_data.max()}")
-        # logger.debug(f"Minimum before clipping: {self.modified_image_data.min()}")
+        logger.debug("Changed contrast by %s", contrast)
+        logger.debug("Range before clipping: %s", array_range(self.modified_image_data))
         self.modified_image_data = np.clip(self.modified_image_data, 0, 255).astype(np.uint8)
-        # logger.debug(f"Maximum after clipping: {self.modified_image_data.max()}")
-        # logger.debug(f"Minimum after clipping: {self.modified_image_data.min()}")
+        logger.debug("Range after clipping: %s", array_range(self.modified_image_data))
 
     def __add__(self, other):
         self.modified_image_data = self.modified_image_data + other
         # assume no clipping occurred
         # add 2 * pi * other * delta(w)  (DC component) to the ft
-        dc_index = tuple(x // 2 for x in self.size)
-        self.modified_ft[dc_index] += 2 * np.pi * other
+        self.__writable_modified_spectrum()[self.__dc_index()] += 2 * np.pi * other
+        self.__edited()
         return self
 
     def __sub__(self, other):
         self.modified_image_data = self.modified_image_data - other
         # assume no clipping occurred
         # subtract 2 * pi * other * delta(w)  (DC component) to the ft
-        dc_index = tuple(x // 2 for x in self.size)
-        self.modified_ft[dc_index] -= 2 * np.pi * other
+        self.__writable_modified_spectrum()[self.__dc_index()] -= 2 * np.pi * other
+        self.__edited()
         return self
 
     def __mul__(self, other):
         self.modified_image_data = self.modified_image_data * other
-        self.modified_ft *= other
+        self.__writable_modified_spectrum()[...] *= other
+        self.__edited()
         return self
 
+    @property
+    def display_data(self):
+        """The edited pixels as uint8, without the copy of get_image_data when they already are. Don't modify it"""
+        if self.modified_image_data.dtype == np.uint8:
+            return self.modified_image_data
+        return self.get_image_data()
+
     def get_image_data(self):
         return np.clip(self.modified_image_data, 0, 255).astype(np.uint8)
 
+    def save(self, file_path, format=None):
+        """
+        :param file_path: path or binary file object
+        :param format: image format, needed for file objects, else guessed from the extension
+        """
+        PILImage.fromarray(Image.to_interleaved(self.get_image_data())).save(file_path, format)
+
+    @staticmethod
+    def from_file(file_path, real_fft=False, size=None, color=False):
+        """
+        :param size: (width, height) to resize to right after decoding, so the spectrum is only ever computed at
+            that size
+        :param color: keep the RGB channels, stacked as (3, height, width), instead of converting to grayscale
+        """
+        return Image(Image.decode(file_path, size, color), real_fft)
+
     @staticmethod
-    def from_file(file_path):
-        image = PILImage.open(file_path)
-        image = image.convert('L')
-        image_data = np.array(image)
-        return Image(image_data)
+    def decode(file_path, size=None, color=False):
+        """
+        The pixels of an image file in the layout Image keeps them, see from_file
+        """
+        mode = "RGB" if color else "L"
+        with get_instrumentation().span("load", ("decoded", "resized"), path=str(file_path), size=size,
+                                        color=color) as span:
+            image = PILImage.open(file_path)
+            image = image.convert(mode)
+            span.attributes["source_size"] = image.size
+            span.stage("decoded", image.width * image.height * len(mode))
+            if size is not None and image.size != tuple(size):
+                image = image.resize(size)
+            image_data = np.array(image)
+            if color:
+                # channels first, so each channel plane is contiguous for the batched FFTs
+                image_data = np.ascontiguousarray(np.moveaxis(image_data, -1, 0))
+            span.stage("resized", image_data.nbytes)
+        return image_data
 
     @staticmethod
-    def from_foureir_domain(ft_array):
-        inverse = Image.normalize(np.abs(np.fft.ifft2(ft_array)))
+    def from_foureir_domain(ft_array, real_shape=None):
+        """
+        :param ft_array: unshifted spectrum, (channels, height, width) for a color image. All channels are
+            normalized together so their balance is kept.
+        :param real_shape: (height, width) of the image when ft_array is a half spectrum from rfft2
+        """
+        fft = FFTBackend.get_backend()
+        if real_shape is not None:
+            inverse = Image.normalize(np.abs(fft.irfft2(ft_array, s=real_shape)))
+            return Image(inverse, real_fft=True)
+        inverse = Image.normalize(np.abs(fft.ifft2(ft_array)))
         return Image(inverse)
 
     @staticmethod
-    def placeholder_image():
-        return Image.from_file("UI/placeholder.jpg")
+    def from_foureir_domain_batch(ft_stack, real_shape=None):
+        """
+        Inverse transform several spectra of the same shape in one batched FFT call
+        :param ft_stack: (B, ...) stack of unshifted spectra, see from_foureir_domain
+        :param real_shape: (height, width) of the images when the spectra are half spectra from rfft2
+        :return: list of B Images, each normalized on its own
+        """
+        fft = FFTBackend.get_backend()
+        if real_shape is not None:
+            inverse = np.abs(fft.irfft2(ft_stack, s=real_shape))
+        else:
+            inverse = np.abs(fft.ifft2(ft_stack))
+        return [Image(Image.normalize(plane), real_fft=real_shape is not None) for plane in inverse]
+
+    @staticmethod
+    def placeholder_image(size=None):
+        """
+        A new Image of UI/placeholder.jpg. The pixels and spectrum are decoded and transformed once per size and
+        shared, read-only, by every placeholder; edits copy them like any other image's.
+        :param size: (width, height), the size of the viewport it is shown in skips any later resize
+        """
+        shared = Image._placeholders.get(size)
+        if shared is None:
+            image = PILImage.open("UI/placeholder.jpg")
+            if size is not None:
+                # let the JPEG decoder downscale by a power of two first, most of the decode is skipped
+                image.draft("L", size)
+                image = image.convert('L').resize(size)
+            placeholder = Image(np.array(image.convert('L')))
+            placeholder.image_data.setflags(write=False)
+            placeholder.stored_ft.setflags(write=False)
+            shared = Image._placeholders[size] = (placeholder.image_data, placeholder.stored_ft)
+        return Image(shared[0], spectrum=shared[1])
@@ -0,0 +1,87 @@
+import numpy as np
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QLabel
+
+from logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ImageLabel(QLabel):
+    """
+    A QLabel showing uint8 pixels without any per-frame allocation: the pixels are copied, or downsampled to the
+    exact size they are shown at, into a NumPy buffer that is reused for as long as that size doesn't change.
+    A persistent QImage wraps the buffer's memory and is painted as is, no QPixmap is built and nothing is scaled
+    by Qt. The buffer has the source's aspect ratio and is drawn at the top left, where the region selector of the
+    FT label expects the spectrum to be.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.buffer = None
+        self.q_image = None
+        self.showing = False
+        # (source shape, target shape) and the flat source index of every target pixel, for resampled sources
+        self.__index_key = None
+        self.__index = None
+
+    def show_pixels(self, pixels):
+        """
+        :param pixels: uint8 gray levels, or (3, height, width) RGB channels
+        """
+        if pixels.dtype != np.uint8:
+            pixels = np.clip(pixels, 0, 255).astype(np.uint8)
+        height, width = self.__fit(pixels.shape[-2:])
+        self.__ensure_buffer(height, width, pixels.ndim == 3)
+        if pixels.shape[-2:] == (height, width):
+            # channels first to the interleaved layout of the QImage, a strided copy
+            np.copyto(self.buffer, np.moveaxis(pixels, 0, -1) if pixels.ndim == 3 else pixels)
+        else:
+            np.take(pixels.reshape(-1), self.__source_index(pixels.shape, self.buffer.shape), out=self.buffer)
+        self.showing = True
+        self.update()
+
+    def clear(self):
+        super().clear()
+        self.showing = False
+        self.update()
+
+    def __fit(self, source_shape):
+        """(height, width) of the source scaled to fit the label, keeping its aspect ratio"""
+        source_height, source_width = source_shape
+        scale = min(self.width() / source_width, self.height() / source_height)
+        return max(1, round(source_height * scale)), max(1, round(source_width * scale))
+
+    def __ensure_buffer(self, height, width, color):
+        shape = (height, width, 3) if color else (height, width)
+        if self.buffer is not None and self.buffer.shape == shape:
+            return
+        self.buffer = np.zeros(shape, dtype=np.uint8)
+        image_format = QImage.Format_RGB888 if color else QImage.Format_Grayscale8
+        # shares the buffer's memory, which must stay alive and unmoved as long as the QImage is used
+        self.q_image = QImage(self.buffer.data, width, height, self.buffer.strides[0], image_format)
+        logger.debug("Display buffer of %s allocated", shape)
+
+    def __source_index(self, source_shape, target_shape):
+        """Nearest source pixel of every target pixel, as indices into the flattened source"""
+        key = (source_shape, target_shape)
+        if self.__index_key != key:
+            source_height, source_width = source_shape[-2:]
+            target_height, target_width = target_shape[:2]
+            rows = (np.arange(target_height) * source_height // target_height)[:, None]
+            cols = (np.arange(target_width) * source_width // target_width)[None, :]
+            index = rows * source_width + cols
+            if len(source_shape) == 3:
+                # channel c of the (channels, height, width) source lands last in the interleaved buffer
+                index = index[..., None] + np.arange(source_shape[0]) * source_height * source_width
+            self.__index = index.astype(np.intp)
+            self.__index_key = key
+        return self.__index
+
+    def paintEvent(self, event):
+        if not self.showing or self.q_image is None:
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self.q_image)
+        painter.end()
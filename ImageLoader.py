@@ -0,0 +1,118 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image as PILImage
+from PySide6.QtCore import QObject, Signal
+
+from SpectrumCache import SpectrumCache
+from logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def make_thumbnail(file_path, size, color=False):
+    """
+    Quick preview at size, the JPEG decoder skips most of the work through draft mode
+    :param size: (width, height)
+    :param color: RGB preview, in the (3, height, width) layout of color Images
+    :return: uint8 array
+    """
+    mode = "RGB" if color else "L"
+    image = PILImage.open(file_path)
+    image.draft(mode, size)
+    thumbnail = np.array(image.convert(mode).resize(size, PILImage.Resampling.BILINEAR))
+    if color:
+        thumbnail = np.ascontiguousarray(np.moveaxis(thumbnail, -1, 0))
+    return thumbnail
+
+
+class LoadRequest:
+    def __init__(self, target, file_path, size, color=False):
+        """
+        :param target: what the image is loaded for, a newer request for the same target cancels this one
+        :param size: (width, height) of the thumbnail and of the image the viewport shows, the image is loaded at
+            full resolution
+        :param color: load the RGB channels instead of gray levels
+        """
+        self.target = target
+        self.file_path = file_path
+        self.size = size
+        self.color = color
+        self.cancelled = False
+        self.future = None
+
+    def cancel(self):
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+
+class ImageLoader(QObject):
+    """
+    Decodes images and computes their spectra on a pool of worker threads (decoding and FFTs release the GIL).
+    Every request first reports a thumbnail, then the loaded Image; the signals are delivered on the GUI thread.
+    A request is dropped as soon as a newer one for the same target is made.
+    """
+    thumbnail_ready = Signal(object, object)
+    image_ready = Signal(object, object)
+    load_failed = Signal(object, str)
+
+    __default = None
+
+    def __init__(self, workers=None, cache: SpectrumCache = None):
+        """
+        :param workers: number of loader threads, defaults to one per CPU up to 4
+        :param cache: SpectrumCache the images are loaded through, defaults to SpectrumCache.default()
+        """
+        super().__init__()
+        self.pool = ThreadPoolExecutor(workers or min(4, os.cpu_count() or 1), thread_name_prefix="image-loader")
+        self.cache = cache
+        # target -> its latest request, only touched on the GUI thread
+        self.latest = {}
+
+    @staticmethod
+    def default():
+        """The loader shared by the GUI viewports"""
+        if ImageLoader.__default is None:
+            ImageLoader.__default = ImageLoader()
+        return ImageLoader.__default
+
+    def load(self, target, file_path, size, color=False):
+        """
+        :return: the LoadRequest, compare it with is_current() when its signals arrive
+        """
+        previous = self.latest.get(target)
+        if previous is not None:
+            previous.cancel()
+        request = LoadRequest(target, file_path, size, color)
+        self.latest[target] = request
+        request.future = self.pool.submit(self.__load, request)
+        return request
+
+    def is_current(self, request):
+        """False once the request was cancelled or superseded, even if its signals were already queued"""
+        return not request.cancelled and self.latest.get(request.target) is request
+
+    def __load(self, request):
+        try:
+            thumbnail = make_thumbnail(request.file_path, request.size, request.color)
+            if request.cancelled:
+                return
+            self.thumbnail_ready.emit(request, thumbnail)
+            # at full resolution, the viewport shows and previews mixes at the pyramid level that fits it
+            image = (self.cache or SpectrumCache.default()).load(request.file_path, color=request.color)
+            # computed here rather than on the GUI thread when the viewport first shows it
+            image.at_size(request.size).stored_ft
+            if request.cancelled:
+                return
+            self.image_ready.emit(request, image)
+        except Exception as e:
+            logger.error(f"Could not load {request.file_path}: {e}")
+            if not request.cancelled:
+                self.load_failed.emit(request, str(e))
+
+    def shutdown(self):
+        for request in self.latest.values():
+            request.cancel()
+        self.pool.shutdown(wait=False, cancel_futures=True)
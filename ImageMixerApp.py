@@ -1,26 +1,63 @@
-from PySide6.QtCore import QFile
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtWidgets import QMainWindow, QWidget, QPushButton, QProgressBar, QLabel, QComboBox, QSlider
+from PySide6.QtCore import QEvent, QFile, QTimer, Signal
+from PySide6.QtWidgets import QMainWindow, QWidget, QPushButton, QProgressBar, QLabel, QComboBox, QSlider, \
+    QCheckBox
 
 from Image import Image
+from Instrumentation import get_instrumentation
 from Viewport import ViewPort
 from RegionSelect import RegionSelectManager
-from Mixer import Mixer, MixingThread
+from Mixer import Mixer, MixCache
+from MixingThread import MixingThread, PreviewMixingThread
+from compile_ui import UI_FILE, ui_source_hash
+from logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def load_main_window(parent):
+    """
+    Build the main window from the precompiled main_window_ui module (see compile_ui.py) when it matches
+    UI/main_window.ui, else parse the .ui file at runtime
+    """
+    try:
+        import main_window_ui
+        if main_window_ui.UI_SOURCE_HASH == ui_source_hash():
+            window = QMainWindow(parent)
+            main_window_ui.Ui_MainWindow().setupUi(window)
+            return window
+        logger.warning(f"main_window_ui.py is older than {UI_FILE}, loading the .ui file. Run compile_ui.py")
+    except ImportError:
+        pass
+    # QtUiTools is only imported when it is needed
+    from PySide6.QtUiTools import QUiLoader
+    loader = QUiLoader()
+    file = QFile(UI_FILE)
+    file.open(QFile.ReadOnly)
+    window = loader.load(file, parent)
+    file.close()
+    return window
 
 
 class ImageMixerApp(QMainWindow):
-    def __init__(self):
+    # seconds from the start of the process to the first frame the user can interact with
+    ready = Signal(float)
+    startup_stages = ("imported", "ui_loaded", "viewports_built", "first_frame", "interactive")
+
+    def __init__(self, started_at=None):
+        """
+        :param started_at: time.perf_counter() at the start of the process, to measure the time to the first frame
+        """
         super().__init__()
+        self.startup = get_instrumentation().span("startup", ImageMixerApp.startup_stages, start=started_at)
+        self.startup.stage("imported")
 
-        loader = QUiLoader()
-        file = QFile("UI/main_window.ui")
-        file.open(QFile.ReadOnly)
-        self.ui = loader.load(file, self)
-        file.close()
+        self.ui = load_main_window(self)
 
         self.setCentralWidget(self.ui)
+        self.ui.installEventFilter(self)
         self.ui.showMaximized()
         self.ui.setWindowTitle("Image Mixer")
+        self.startup.stage("ui_loaded")
 
         self.region_select_manager = RegionSelectManager()
 
@@ -29,18 +66,19 @@ class ImageMixerApp(QMainWindow):
             ViewPort(is_input=True, index=i, parent=widget)
             for i, widget in enumerate(inputViewportWidgets)
         ]
-        for viewport in self.inputViewPorts:
-            self.region_select_manager.add_listener(viewport.region_selector)
-            viewport.region_selector.hide()
+        placeholder_size = (ViewPort.image_size.width(), ViewPort.image_size.height())
+        for i, viewport in enumerate(self.inputViewPorts):
+            self.region_select_manager.add_listener_factory(lambda viewport=viewport: viewport.region_selector)
             viewport.region_select_btn.clicked.connect(self.region_select_manager.toggle_select_region)
-            viewport.set_image(Image.placeholder_image())
+            viewport.files_selected.connect(lambda file_paths, i=i: self.load_files(file_paths, i))
+            viewport.set_image(Image.placeholder_image(placeholder_size))
 
         for i, viewport_widget in enumerate(inputViewportWidgets):
             viewport_widget.layout().addWidget(self.inputViewPorts[i])
 
         outputViewportWidgets = [self.ui.findChild(QWidget, f"outputViewPort{i+1}") for i in range(2)]
         self.outputViewPorts = [ViewPort(is_input=False, parent=widget) for widget in outputViewportWidgets]
-        output_image_placeholder = Image.placeholder_image()
+        output_image_placeholder = Image.placeholder_image(placeholder_size)
         for i, viewport_widget in enumerate(outputViewportWidgets):
             viewport_widget.layout().addWidget(self.outputViewPorts[i])
             self.outputViewPorts[i].set_image(output_image_placeholder)
@@ -54,6 +92,41 @@ class ImageMixerApp(QMainWindow):
         self.mixBtn.clicked.connect(self.mix_images)
         self.mixingModeCombo.currentIndexChanged.connect(self.update_sliders_labels)
         self.mixing_thread = None
+        self.mix_cache = MixCache()
+
+        self.livePreviewCheckBox = self.ui.findChild(QCheckBox, "livePreviewCheckBox")
+        self.livePreviewCheckBox.toggled.connect(self.schedule_live_preview)
+        self.colorCheckBox = self.ui.findChild(QCheckBox, "colorCheckBox")
+        self.colorCheckBox.toggled.connect(self.set_color)
+        self.mixingModeCombo.currentIndexChanged.connect(self.schedule_live_preview)
+        self.ui.findChild(QComboBox, "outputSelectionComboBox").currentIndexChanged.connect(self.schedule_live_preview)
+        self.region_select_manager.selection_changed.connect(self.schedule_live_preview)
+        for viewport in self.inputViewPorts:
+            viewport.image_changed.connect(self.schedule_live_preview)
+        for i in range(4):
+            for side in ("Left", "Right"):
+                self.ui.findChild(QSlider, f"image{i+1}{side}Slider").valueChanged.connect(self.schedule_live_preview)
+        self.live_preview_pending = False
+        self.preview_threads = []
+        # reused while only the weights or the mode change, so its magnitude and phase planes stay cached
+        self.preview_mixer = None
+        self.preview_mixer_key = None
+        self.startup.stage("viewports_built")
+
+    def eventFilter(self, watched, event):
+        if watched is self.ui and event.type() == QEvent.Type.Paint:
+            self.ui.removeEventFilter(self)
+            self.startup.stage("first_frame")
+            # the next pass of the event loop, once the first frame is on screen
+            QTimer.singleShot(0, self.__startup_finished)
+        return super().eventFilter(watched, event)
+
+    def __startup_finished(self):
+        self.startup.stage("interactive")
+        self.startup.finish()
+        stages = ", ".join(f"{stage['stage']} {stage['seconds'] * 1000:.0f} ms" for stage in self.startup.stages)
+        logger.info(f"Interactive {self.startup.seconds * 1000:.0f} ms after start ({stages})")
+        self.ready.emit(self.startup.seconds)
 
     def update_sliders_labels(self):
         selected_index = self.mixingModeCombo.currentIndex()
@@ -67,18 +140,17 @@ class ImageMixerApp(QMainWindow):
     def mix_images(self):
         self.mixingProgressBar.setValue(0)
 
-        region = None
-        if self.region_select_manager.is_selecting:
-            region_rect = self.inputViewPorts[0].region_selector.region_rect
-            x, y, w, h = region_rect.getRect()
-            inside_is_selected = self.region_select_manager.inside_selected
-            region = (inside_is_selected, x, y, w, h)
-
-        mixer = Mixer([viewport.image for viewport in self.inputViewPorts], region)
+        # at the full resolution of the loaded images, the live previews are mixed at the viewport size
+        viewports = self.inputViewPorts
+        loaded = [viewport.source for viewport in viewports if viewport.file_path is not None]
+        size = Mixer.native_size(loaded) if loaded else viewports[0].display_size
         weights = self.__get_weights()
         mode = self.mixingModeCombo.currentIndex()
 
-        self.mixing_thread = MixingThread(mixer, weights, mode)
+        self.mixing_thread = MixingThread([viewport.source for viewport in viewports], weights, mode, size,
+                                          self.__get_region(), region_size=viewports[0].display_size,
+                                          edits=[(viewport.brightness, viewport.contrast) for viewport in viewports],
+                                          cache=self.mix_cache)
 
         def handle_result(output_image):
             output_index = self.ui.findChild(QComboBox, "outputSelectionComboBox").currentIndex()
@@ -88,19 +160,73 @@ class ImageMixerApp(QMainWindow):
         def handle_error(error):
             print(error)
 
-        def update_progress_bar():
-            self.mixingProgressBar.setValue(self.mixingProgressBar.value() + 25)
-
-        mixer.first_component_mixed.connect(update_progress_bar)
-        mixer.second_component_mixed.connect(update_progress_bar)
-        mixer.total_ft_found.connect(update_progress_bar)
-        mixer.ifft_computed.connect(update_progress_bar)
+        def update_progress_bar(fraction):
+            self.mixingProgressBar.setValue(round(fraction * 100))
 
+        self.mixing_thread.progress_sink.progress.connect(update_progress_bar)
         self.mixing_thread.result_ready.connect(handle_result)
         self.mixing_thread.error_occurred.connect(handle_error)
 
         self.mixing_thread.start()
 
+    def schedule_live_preview(self):
+        """Coalesce the changes of one event loop pass into a single preview"""
+        if not self.livePreviewCheckBox.isChecked() or self.live_preview_pending:
+            return
+        self.live_preview_pending = True
+        QTimer.singleShot(0, self.start_live_preview)
+
+    def start_live_preview(self):
+        self.live_preview_pending = False
+        for thread in self.preview_threads:
+            thread.cancel()
+
+        images = [viewport.image for viewport in self.inputViewPorts]
+        region = self.__get_region()
+        mixer_key = (tuple(image.version for image in images), region)
+        if mixer_key != self.preview_mixer_key:
+            self.preview_mixer = Mixer(images, region, cache=self.mix_cache)
+            self.preview_mixer_key = mixer_key
+
+        thread = PreviewMixingThread(self.preview_mixer, self.__get_weights(), self.mixingModeCombo.currentIndex())
+        output_index = self.ui.findChild(QComboBox, "outputSelectionComboBox").currentIndex()
+
+        def handle_preview(output_image, is_final):
+            if thread.cancelled:
+                return
+            self.outputViewPorts[output_index].set_image(output_image)
+
+        def handle_finished():
+            self.preview_threads.remove(thread)
+
+        thread.preview_ready.connect(handle_preview)
+        thread.error_occurred.connect(print)
+        thread.finished.connect(handle_finished)
+        self.preview_threads.append(thread)
+        thread.start()
+
+    def set_color(self, color):
+        """Mix the RGB channels of the loaded images, or their gray levels"""
+        for viewport in self.inputViewPorts:
+            viewport.set_color(color)
+
+    def load_files(self, file_paths, first_index=0):
+        """
+        Load several files at once, into the input viewports from first_index on, wrapping around
+        """
+        if len(file_paths) > len(self.inputViewPorts):
+            logger.warning(f"{len(file_paths)} files selected, only the first {len(self.inputViewPorts)} are loaded")
+        for offset, file_path in enumerate(file_paths[:len(self.inputViewPorts)]):
+            self.inputViewPorts[(first_index + offset) % len(self.inputViewPorts)].load_file(file_path)
+
+    def __get_region(self):
+        if not self.region_select_manager.is_selecting:
+            return None
+        region_rect = self.inputViewPorts[0].region_selector.region_rect
+        x, y, w, h = region_rect.getRect()
+        inside_is_selected = self.region_select_manager.inside_selected
+        return inside_is_selected, x, y, w, h
+
     def __get_weights(self):
         weights = []
         for i in range(4):
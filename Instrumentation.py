@@ -0,0 +1,268 @@
+"""
+Structured timing of the mixing pipeline and image loads, no Qt involved.
+
+An operation (a mix, an image load, an FFT) is a Span. Each stage of it records its duration and the bytes of
+what it produced, and the span's attributes hold the FFT shape, dtype and the like. Spans are handed to sinks:
+
+    JsonLinesSink   one JSON object per finished span, appended to a file
+    HistogramSink   in-memory duration histograms per (span, stage), also used to estimate fractional progress
+    ProgressSignalSink (MixingThread.py) Qt signals with the stage names and the fractional progress
+
+The default instrumentation always has a HistogramSink, plus a JsonLinesSink when the IMAGE_MIXER_METRICS
+environment variable names a file.
+
+    with get_instrumentation().span("mix", Mixer.stages, images=2) as span:
+        ...
+        span.stage("first_component_mixed", magnitude.nbytes)
+"""
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+from logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class Sink:
+    """Receives the events of every span, all methods are optional"""
+
+    def on_span_started(self, span):
+        pass
+
+    def on_stage(self, span, stage):
+        pass
+
+    def on_span_finished(self, span):
+        pass
+
+
+class Span:
+    def __init__(self, instrumentation, name, stages=(), attributes=None, start=None):
+        """
+        :param name: kind of operation, e.g. "mix" or "load"
+        :param stages: the stages the operation is expected to go through, used for the fractional progress
+        :param attributes: JSON serializable details of the operation
+        :param start: time.perf_counter() value the operation started at, if before the span was created
+        """
+        self.instrumentation = instrumentation
+        self.name = name
+        self.planned_stages = tuple(stages)
+        self.attributes = dict(attributes or {})
+        self.stages = []
+        now = time.perf_counter()
+        self.__start = self.__last = now if start is None else start
+        self.started_at = time.time() - (now - self.__start)
+        self.seconds = None
+        self.error = None
+
+    def stage(self, stage, nbytes=0):
+        """
+        Mark the end of a stage, timed from the end of the previous one
+        :param nbytes: size of what the stage produced
+        """
+        now = time.perf_counter()
+        record = {"stage": stage, "seconds": now - self.__last, "bytes": int(nbytes)}
+        self.__last = now
+        self.stages.append(record)
+        self.instrumentation.dispatch("on_stage", self, record)
+
+    @property
+    def fraction(self):
+        """
+        Share of the expected duration done so far. Stages are weighted by their mean past duration when known
+        """
+        if not self.planned_stages:
+            return 1.0 if self.seconds is not None else 0.0
+        expected = {stage: self.instrumentation.expected_seconds(self.name, stage) for stage in self.planned_stages}
+        known = [seconds for seconds in expected.values() if seconds]
+        default = sum(known) / len(known) if known else 1.0
+        expected = {stage: seconds or default for stage, seconds in expected.items()}
+        done = sum(expected.get(record["stage"], 0) for record in self.stages)
+        return min(1.0, done / sum(expected.values()))
+
+    def finish(self, error=None):
+        if self.seconds is not None:
+            return
+        self.seconds = time.perf_counter() - self.__start
+        self.error = error
+        self.instrumentation.dispatch("on_span_finished", self)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "started_at": self.started_at,
+            "seconds": self.seconds,
+            "error": self.error,
+            "attributes": self.attributes,
+            "stages": self.stages,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.finish(None if exc is None else f"{exc_type.__name__}: {exc}")
+        return False
+
+
+class Instrumentation:
+    def __init__(self, sinks=(), parent=None):
+        """
+        :param sinks: the sinks every span is reported to
+        :param parent: an Instrumentation whose sinks also receive the spans
+        """
+        self.sinks = list(sinks)
+        self.parent = parent
+
+    def with_sinks(self, *sinks):
+        """An Instrumentation reporting to these sinks on top of this one's, e.g. for a single operation"""
+        return Instrumentation(sinks, parent=self)
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+
+    def remove_sink(self, sink):
+        self.sinks.remove(sink)
+
+    @property
+    def all_sinks(self):
+        if self.parent is None:
+            return list(self.sinks)
+        return self.parent.all_sinks + self.sinks
+
+    def span(self, name, stages=(), start=None, **attributes):
+        span = Span(self, name, stages, attributes, start)
+        self.dispatch("on_span_started", span)
+        return span
+
+    def dispatch(self, event, *args):
+        for sink in self.all_sinks:
+            try:
+                getattr(sink, event)(*args)
+            except Exception as e:
+                # a broken sink must not break the operation it measures
+                logger.warning(f"Instrumentation sink {type(sink).__name__} failed on {event}: {e}")
+
+    def expected_seconds(self, name, stage):
+        """Mean past duration of a stage, from the first HistogramSink that has seen it, else None"""
+        for sink in self.all_sinks:
+            if isinstance(sink, HistogramSink):
+                mean = sink.mean(name, stage)
+                if mean is not None:
+                    return mean
+        return None
+
+
+class JsonLinesSink(Sink):
+    def __init__(self, path):
+        """
+        :param path: file the finished spans are appended to, one JSON object per line
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def on_span_finished(self, span):
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self.lock, open(self.path, "a") as file:
+            file.write(line)
+
+
+class HistogramSink(Sink):
+    """
+    Duration histograms of every (span name, stage), and of the whole spans under the stage "total".
+    Buckets double from 10 microseconds up to about 3 minutes.
+    """
+    bounds = 1e-5 * 2.0 ** np.arange(25)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = {}
+
+    def __record(self, key, seconds, nbytes):
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = {
+                "buckets": np.zeros(len(HistogramSink.bounds) + 1, dtype=np.int64),
+                "count": 0, "seconds": 0.0, "min": seconds, "max": seconds, "bytes": 0,
+            }
+        histogram["buckets"][np.searchsorted(HistogramSink.bounds, seconds)] += 1
+        histogram["count"] += 1
+        histogram["seconds"] += seconds
+        histogram["min"] = min(histogram["min"], seconds)
+        histogram["max"] = max(histogram["max"], seconds)
+        histogram["bytes"] += nbytes
+
+    def on_stage(self, span, stage):
+        with self.lock:
+            self.__record((span.name, stage["stage"]), stage["seconds"], stage["bytes"])
+
+    def on_span_finished(self, span):
+        if span.error is None:
+            with self.lock:
+                self.__record((span.name, "total"), span.seconds, sum(stage["bytes"] for stage in span.stages))
+
+    def mean(self, name, stage="total"):
+        histogram = self.histograms.get((name, stage))
+        if not histogram:
+            return None
+        return histogram["seconds"] / histogram["count"]
+
+    def percentile(self, name, stage, q):
+        """Upper bound of the bucket holding the q-th percentile of the durations, q in [0, 100]"""
+        histogram = self.histograms.get((name, stage))
+        if not histogram:
+            return None
+        rank = np.searchsorted(np.cumsum(histogram["buckets"]), q / 100 * histogram["count"])
+        if rank >= len(HistogramSink.bounds):
+            return histogram["max"]
+        return min(float(HistogramSink.bounds[rank]), histogram["max"])
+
+    def summary(self):
+        """
+        :return: {"<span>/<stage>": {count, mean, min, max, p50, p95, p99 (seconds), mean_bytes}}
+        """
+        with self.lock:
+            return {
+                f"{name}/{stage}": {
+                    "count": histogram["count"],
+                    "mean": histogram["seconds"] / histogram["count"],
+                    "min": histogram["min"],
+                    "max": histogram["max"],
+                    "p50": self.percentile(name, stage, 50),
+                    "p95": self.percentile(name, stage, 95),
+                    "p99": self.percentile(name, stage, 99),
+                    "mean_bytes": histogram["bytes"] // histogram["count"],
+                }
+                for (name, stage), histogram in self.histograms.items()
+            }
+
+    def clear(self):
+        with self.lock:
+            self.histograms.clear()
+
+
+_instrumentation = None
+
+
+def set_instrumentation(instrumentation):
+    global _instrumentation
+    _instrumentation = instrumentation
+    return _instrumentation
+
+
+def get_instrumentation():
+    """The process wide Instrumentation, created on first use"""
+    if _instrumentation is None:
+        sinks = [HistogramSink()]
+        metrics_path = os.environ.get("IMAGE_MIXER_METRICS")
+        if metrics_path:
+            sinks.append(JsonLinesSink(metrics_path))
+        set_instrumentation(Instrumentation(sinks))
+    return _instrumentation
@@ -0,0 +1,213 @@
+"""
+Large image mode: pixels and spectra live in memory-mapped scratch files and every pass over them is done in
+tiles sized from a memory budget, so images larger than RAM can be transformed and mixed.
+
+The budget defaults to the IMAGE_MIXER_MEMORY_BUDGET environment variable (bytes, or e.g. "512M", "4G"), or 2 GiB.
+"""
+import atexit
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from PIL import Image as PILImage
+
+import FFTBackend
+from Image import Image
+from logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_bytes(text):
+    """Parse a byte count such as "1048576", "512M" or "4G" (binary units)"""
+    text = str(text).strip().upper().rstrip("IB")
+    unit = text[-1:] if text[-1:] in _UNITS else ""
+    return int(float(text[:len(text) - len(unit)]) * _UNITS[unit])
+
+
+_memory_budget = parse_bytes(os.environ.get("IMAGE_MIXER_MEMORY_BUDGET", 2 * 1024 ** 3))
+
+
+def set_memory_budget(budget):
+    """
+    :param budget: bytes the Mixer and the tiled transforms may keep resident at once
+    """
+    global _memory_budget
+    _memory_budget = int(budget)
+
+
+def get_memory_budget():
+    return _memory_budget
+
+
+class ScratchSpace:
+    """A directory of memory-mapped scratch arrays, removed at exit"""
+    __default = None
+
+    def __init__(self, directory=None):
+        """
+        :param directory: parent directory of the scratch files, defaults to the system temporary directory
+        """
+        self.directory = tempfile.mkdtemp(prefix="image_mixer_", dir=directory)
+        atexit.register(self.cleanup)
+
+    @staticmethod
+    def default():
+        if ScratchSpace.__default is None:
+            ScratchSpace.__default = ScratchSpace(os.environ.get("IMAGE_MIXER_SCRATCH_DIR"))
+        return ScratchSpace.__default
+
+    def empty(self, shape, dtype):
+        fd, path = tempfile.mkstemp(dir=self.directory, suffix=".dat")
+        os.close(fd)
+        array = np.memmap(path, dtype=dtype, mode="w+", shape=tuple(shape))
+        try:
+            # the mapping keeps the data alive, the file goes away with the last reference to the array
+            os.unlink(path)
+        except OSError:
+            pass
+        return array
+
+    def cleanup(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def rows_per_tile(width, bytes_per_pixel, budget=None):
+    """How many full rows of bytes_per_pixel bytes per pixel fit in the budget"""
+    budget = budget or get_memory_budget()
+    return max(1, int(budget // max(1, width * bytes_per_pixel)))
+
+
+def tiled_fft2(source, destination, budget=None):
+    """
+    Shifted 2D FFT of source into destination (which may be source itself), as a pass of row FFTs over row tiles
+    followed by a pass of column FFTs over column tiles
+    """
+    fft = FFTBackend.get_backend()
+    height, width = source.shape
+    itemsize = np.dtype(fft.complex_dtype).itemsize
+    rows = rows_per_tile(width, 3 * itemsize, budget)
+    for start in range(0, height, rows):
+        tile = fft.fft2(source[start:start + rows], axes=(-1,))
+        destination[start:start + rows] = np.fft.fftshift(tile, axes=-1)
+    columns = rows_per_tile(height, 3 * itemsize, budget)
+    for start in range(0, width, columns):
+        tile = fft.fft2(destination[:, start:start + columns], axes=(0,))
+        destination[:, start:start + columns] = np.fft.fftshift(tile, axes=0)
+    return destination
+
+
+def tiled_ifft2(source, destination, budget=None):
+    """
+    Inverse of tiled_fft2: unshifts and inverse transforms the columns tile by tile, then the rows
+    """
+    fft = FFTBackend.get_backend()
+    height, width = source.shape
+    itemsize = np.dtype(fft.complex_dtype).itemsize
+    columns = rows_per_tile(height, 3 * itemsize, budget)
+    for start in range(0, width, columns):
+        tile = np.fft.ifftshift(source[:, start:start + columns], axes=0)
+        destination[:, start:start + columns] = fft.ifft2(tile, axes=(0,))
+    rows = rows_per_tile(width, 3 * itemsize, budget)
+    for start in range(0, height, rows):
+        tile = np.fft.ifftshift(destination[start:start + rows], axes=-1)
+        destination[start:start + rows] = fft.ifft2(tile, axes=(-1,))
+    return destination
+
+
+def tiled_normalize(source, destination, budget=None):
+    """Image.normalize of abs(source) into the uint8 destination, in two passes of row tiles"""
+    height, width = source.shape
+    rows = rows_per_tile(width, 3 * source.dtype.itemsize, budget)
+    low, high = np.inf, -np.inf
+    for start in range(0, height, rows):
+        tile = np.abs(source[start:start + rows])
+        low, high = min(low, tile.min()), max(high, tile.max())
+    for start in range(0, height, rows):
+        destination[start:start + rows] = Image.normalize(np.abs(source[start:start + rows]), low, high)
+    return destination
+
+
+class LargeImage:
+    """
+    An image whose pixels and spectrum are memory-mapped scratch arrays. It has the read API Mixer uses
+    (size, version, channels, real_fft, modified_ft, stored_modified_ft) but no edits or display.
+    """
+    real_fft = False
+    # large images are always grayscale
+    channels = 1
+
+    def __init__(self, image_data, scratch=None, spectrum=None):
+        """
+        :param image_data: 2D array of gray levels, usually memory-mapped
+        :param scratch: ScratchSpace holding the spectrum, defaults to ScratchSpace.default()
+        :param spectrum: precomputed shifted spectrum
+        """
+        self.image_data = image_data
+        self.size = image_data.shape
+        self.scratch = scratch or ScratchSpace.default()
+        self.version = next(Image._versions)
+        self.__spectrum = spectrum
+
+    @property
+    def stored_ft(self):
+        """The full shifted spectrum, computed tile by tile into scratch space on first access"""
+        if self.__spectrum is None:
+            fft = FFTBackend.get_backend()
+            logger.info(f"Computing the spectrum of a {self.size[1]}x{self.size[0]} image in tiles")
+            self.__spectrum = tiled_fft2(self.image_data, self.scratch.empty(self.size, fft.complex_dtype))
+        return self.__spectrum
+
+    ft = modified_ft = stored_modified_ft = stored_ft
+
+    def get_image_data(self):
+        return self.image_data
+
+    def preview(self, size):
+        """
+        An in-memory Image of every n-th pixel, n as large as possible while the Image still covers size, eg: to
+        show the result of a tiled mix in a viewport
+        :param size: (width, height)
+        """
+        step = max(1, min(self.size[0] // size[1], self.size[1] // size[0]))
+        return Image(np.ascontiguousarray(self.image_data[::step, ::step]))
+
+    def save(self, file_path):
+        """Save as .npy without loading the pixels, or through PIL for other formats"""
+        if file_path.endswith(".npy"):
+            output = np.lib.format.open_memmap(file_path, mode="w+", dtype=np.uint8, shape=self.size)
+            rows = rows_per_tile(self.size[1], 1)
+            for start in range(0, self.size[0], rows):
+                output[start:start + rows] = self.image_data[start:start + rows]
+            output.flush()
+        else:
+            PILImage.fromarray(np.asarray(self.image_data)).save(file_path)
+
+    @staticmethod
+    def from_file(file_path, scratch=None):
+        """
+        .npy files are memory-mapped as they are. Other formats are decoded by PIL and converted to gray levels
+        strip by strip into scratch space (PIL keeps the decoded file in memory until that's done).
+        """
+        scratch = scratch or ScratchSpace.default()
+        if file_path.endswith(".npy"):
+            return LargeImage(np.load(file_path, mmap_mode='r'), scratch)
+        # large images are expected here: lift the decompression bomb guard only while this file is opened, which
+        # is when PIL checks it, the rest of the process (eg: mix_server decoding uploads) keeps it
+        max_pixels = PILImage.MAX_IMAGE_PIXELS
+        PILImage.MAX_IMAGE_PIXELS = None
+        try:
+            image = PILImage.open(file_path)
+        finally:
+            PILImage.MAX_IMAGE_PIXELS = max_pixels
+        with image:
+            width, height = image.size
+            image_data = scratch.empty((height, width), np.uint8)
+            rows = rows_per_tile(width, 8)
+            for start in range(0, height, rows):
+                strip = image.crop((0, start, width, min(height, start + rows))).convert('L')
+                image_data[start:start + strip.size[1]] = np.asarray(strip)
+        return LargeImage(image_data, scratch)
@@ -1,41 +1,380 @@
-from PySide6.QtCore import QObject, Signal, QThread
+import copy
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
 import numpy as np
+
+import FFTBackend
 from Image import Image
+from Instrumentation import get_instrumentation
+from LargeImage import LargeImage, ScratchSpace, get_memory_budget, rows_per_tile, tiled_ifft2, tiled_normalize
 from logger_config import setup_logger
 
 logger = setup_logger(__name__)
 
 
-class Mixer(QObject):
-    first_component_mixed = Signal()
-    second_component_mixed = Signal()
-    total_ft_found = Signal()
-    ifft_computed = Signal()
+MASK_TYPES = ("hard", "gaussian", "butterworth")
+
+
+@lru_cache(maxsize=32)
+def soft_mask(shape, region, mask_type, softness=None, dtype=np.float64):
+    """
+    Soft edged version of a rectangular region of the shifted spectrum, cached per shape and region.
+    gaussian: 1 inside the rectangle, falling off as exp(-d^2 / (2 * softness^2)) with the distance d to it
+    butterworth: 1 / (1 + (u / (width / 2)) ^ (2 * softness)) along each axis, u being the distance to the center
+    :param shape: (height, width) of the spectrum
+    :param region: (inside_is_selected, x, y, width, height), the mask is inverted when the outside is selected
+    :param softness: edge width in pixels for gaussian (default 5), order for butterworth (default 2)
+    :param dtype: float type of the mask, the real type of the spectra it multiplies
+    :return: read-only float mask
+    """
+    inside_is_selected, x, y, w, h = region
+
+    def profile(start, length, size):
+        positions = np.arange(size, dtype=np.float64)
+        if mask_type == "gaussian":
+            sigma = softness or 5
+            distance = np.maximum(np.maximum(start - positions, positions - (start + length - 1)), 0)
+            return np.exp(-distance ** 2 / (2 * sigma ** 2))
+        order = softness or 2
+        distance = np.abs(positions - (start + (length - 1) / 2))
+        return 1 / (1 + (distance / max(length / 2, 1)) ** (2 * order))
+
+    mask = np.outer(profile(y, h, shape[0]), profile(x, w, shape[1]))
+    if not inside_is_selected:
+        mask = 1 - mask
+    mask = mask.astype(dtype, copy=False)
+    mask.setflags(write=False)
+    return mask
+
+
+class MixCache:
+    """
+    Bounded LRU cache of mixed components and mixed images, keyed by the versions of the input images, the region,
+    the normalized weights and the mode. Shared between Mixers (and threads) so repeated or partially changed mixes
+    reuse work, eg: changing only the phase weights reuses the mixed magnitude.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 ** 2):
+        """
+        :param max_bytes: total size of the cached arrays
+        """
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        :param value: an array, made read-only since it is shared by every later hit
+        """
+        value.setflags(write=False)
+        with self.lock:
+            if key in self.entries or value.nbytes > self.max_bytes:
+                return
+            self.entries[key] = value
+            self.bytes += value.nbytes
+            while self.bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.bytes -= evicted.nbytes
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+
+class Mixer:
+    stages = ("first_component_mixed", "second_component_mixed", "total_ft_found", "ifft_computed")
 
-    def __init__(self, images: [Image], region=None):
+    def __init__(self, images: [Image], region=None, progress_callback=None, cache: MixCache = None,
+                 mask_type="hard", softness=None, memory_budget=None, instrumentation=None):
         """
         :param images:
         :param region: a tuple containing (inside_is_selected boolean, (x, y, width, height))
+        :param progress_callback: optional callable, called with the name of each stage in Mixer.stages once it is done
+        :param cache: optional MixCache to memoize mixed components and images in
+        :param mask_type: "hard" for a rectangular cut, or "gaussian"/"butterworth" for a soft edged region (see soft_mask)
+        :param softness: gaussian edge width in pixels or butterworth order, None for the default of the mask type
+        :param memory_budget: bytes the mix may keep resident, defaults to LargeImage.get_memory_budget().
+            Larger mixes are done in row tiles straight from the (possibly memory-mapped) image spectra.
+        :param instrumentation: where the stage timings of every mix are reported, defaults to get_instrumentation()
         """
-        super().__init__()
+        if mask_type not in MASK_TYPES:
+            raise ValueError(f"Unknown mask type {mask_type!r}, expected one of {MASK_TYPES}")
         self.images = images
-        self.mask = self.__get_mask(region)
-
-    def __get_mask(self, region):
-        mask = np.ones_like(self.images[0].image_data)
-        if region:
-            inside_is_selected, x, y, w, h = region
-            logger.debug(f"Region received as (x, y, w, h): {x}, {y}, {w}, {h}")
-            part_selected = "low frequencies" if inside_is_selected else "high frequencies"
-            logger.debug(f"Region selected: {part_selected}")
-            if inside_is_selected:
-                mask = np.zeros_like(self.images[0].image_data)
-                mask[y:y + h, x:x + w] = 1
-            else:
-                mask = np.ones_like(self.images[0].image_data)
-                mask[y:y + h, x:x + w] = 0
-        return mask
+        # the content the spectra are copied from, images are versioned on every edit
+        self.versions = tuple(image.version for image in images)
+        self.region = tuple(region) if region else None
+        self.mask_type = mask_type
+        self.softness = softness
+        self.cache = cache
+        self.shape = images[0].size
+        # grayscale images mixed with color ones count as gray in every channel
+        self.channels = max(image.channels for image in images)
+        half_spectra = all(image.real_fft for image in images)
+        # mix the half spectra directly when every image is stored that way, the result is then real by construction.
+        # A region that isn't symmetric through DC selects bins without their mirror, which a half spectrum can't
+        # hold, so those mixes fall back to the full spectra and match the full FFT path.
+        self.real_fft = half_spectra and self.__region_is_symmetric()
+        if half_spectra and not self.real_fft:
+            logger.info("Region not symmetric through DC, mixing the full spectra of the half spectrum images")
+        self.memory_budget = memory_budget or get_memory_budget()
+        # LargeImage only handles grayscale
+        self.tiled = (not half_spectra and self.channels == 1
+                      and self.__working_set_bytes(self.shape[0]) > self.memory_budget)
+        self.spectra = None if self.tiled else self.__stack_spectra(images)
+        # float32 spectra (single precision FFT backend) are mixed in float32, weights and masks included
+        if self.spectra is not None:
+            self.real_dtype = self.spectra.real.dtype
+        else:
+            self.real_dtype = np.dtype(FFTBackend.get_backend().real_dtype)
+        self.progress_callback = progress_callback
+        self.instrumentation = instrumentation or get_instrumentation()
+        if not self.tiled:
+            self.__setup_region()
+        self.__decimated = {}
+
+    def __stack_spectra(self, images):
+        """
+        Copy the (modified) spectra of all images into one preallocated (N, H, W) complex stack,
+        so every mix is a single weighted reduction over its first axis.
+        In real FFT mode the stack holds the unshifted half spectra, (N, H, W // 2 + 1).
+        Color images add a channel axis, (N, C, H, W), that the reductions and the inverse FFT carry along;
+        the spectrum of a grayscale image is broadcast into every channel.
+        """
+        spectrum_shape = self.shape
+        if self.real_fft:
+            spectrum_shape = images[0].stored_modified_ft.shape[-2:]
+        if self.channels > 1:
+            spectrum_shape = (self.channels,) + spectrum_shape
+        dtype = np.result_type(*(image.stored_modified_ft.dtype for image in images))
+        spectra = np.empty((len(images),) + spectrum_shape, dtype=dtype)
+        for i, image in enumerate(images):
+            spectra[i] = image.stored_modified_ft if self.real_fft else image.modified_ft
+        return spectra
+
+    def __region_is_symmetric(self):
+        """Whether the region selects the mirror through DC of every bin it selects, with the same weight"""
+        if not self.region:
+            return True
+        if self.mask_type == "hard":
+            _, x, y, w, h = self.region
+            mask = np.zeros(self.shape, dtype=bool)
+            mask[max(0, y):max(0, y + h), max(0, x):max(0, x + w)] = True
+        else:
+            mask = soft_mask(self.shape, self.region, self.mask_type, self.softness)
+        # unshifted, the mirror of bin k is bin -k
+        mask = np.fft.ifftshift(mask)
+        mirrored = np.roll(mask[::-1, ::-1], 1, axis=(0, 1))
+        return np.allclose(mask, mirrored)
+
+    def __working_set_bytes(self, rows):
+        """Rough peak memory of mixing that many rows: the stack, its magnitude and phase planes and the outputs"""
+        itemsize = np.dtype(FFTBackend.get_backend().complex_dtype).itemsize
+        return rows * self.shape[1] * itemsize * (3 * len(self.images) + 4)
+
+    def __setup_region(self):
+        """
+        Hard regions never materialize a mask: the region is turned into blocks of the stored spectrum layout.
+        When the inside is selected only those blocks are mixed and the rest is zero, so the cost is proportional
+        to the region area; when the outside is selected the whole spectrum is mixed and the blocks are zeroed.
+        Soft regions use a cached float mask instead.
+        """
+        # component -> list of (N, h, w) or (N, C, h, w) planes, one per block being mixed
+        self.__planes = {}
+        # held while the planes and the decimated Mixers are built, they are shared by the copies of this Mixer
+        self.__lock = threading.RLock()
+        self.mask = None
+        self.region_blocks = []
+        self.inside_is_selected = False
+        if not self.region:
+            return
+        inside_is_selected, x, y, w, h = self.region
+        logger.debug("Region received as (x, y, w, h): %s, %s, %s, %s", x, y, w, h)
+        part_selected = "low frequencies" if inside_is_selected else "high frequencies"
+        logger.debug("Region selected: %s", part_selected)
+        if self.mask_type != "hard":
+            mask = soft_mask(self.shape, self.region, self.mask_type, self.softness, self.real_dtype)
+            if self.real_fft:
+                # the region is given on the shifted full spectrum, keep the matching half of the unshifted one
+                mask = np.fft.ifftshift(mask)[:, :self.spectra.shape[-1]]
+            self.mask = mask
+            return
+        self.inside_is_selected = inside_is_selected
+        self.region_blocks = self.__get_region_blocks(x, y, w, h)
+
+    def __get_region_blocks(self, x, y, w, h):
+        """
+        :return: list of (row slice, column slice) covering the region in the stored spectrum layout
+        """
+        height, width = self.shape
+        if not self.real_fft:
+            rows = slice(max(0, y), min(height, y + h))
+            cols = slice(max(0, x), min(width, x + w))
+            if rows.start >= rows.stop or cols.start >= cols.stop:
+                return []
+            return [(rows, cols)]
+        # shifted index i is unshifted index (i - size // 2) % size, so a range of the shifted spectrum is at most
+        # two ranges of the unshifted one. Only the columns of the half spectrum are kept.
+        row_ranges = self.__unshifted_ranges(y, h, height, height)
+        col_ranges = self.__unshifted_ranges(x, w, width, self.spectra.shape[-1])
+        return [(rows, cols) for rows in row_ranges for cols in col_ranges]
+
+    @staticmethod
+    def __unshifted_ranges(start, length, size, limit):
+        start, stop = max(0, start), min(size, start + length)
+        if start >= stop:
+            return []
+        length = stop - start
+        start = (start - size // 2) % size
+        stop = start + length
+        ranges = [(start, min(stop, size)), (0, stop - size)] if stop > size else [(start, stop)]
+        return [slice(a, min(b, limit)) for a, b in ranges if a < min(b, limit)]
+
+    @property
+    def key(self):
+        """What the mixed results depend on, besides the weights and the mode"""
+        return self.versions, self.region, self.mask_type, self.softness, self.shape, self.real_fft, self.real_dtype.str
+
+    @staticmethod
+    def at_size(images: [Image], size=None, region=None, region_size=None, edits=None, **kwargs):
+        """
+        A Mixer whose results have the given size, over the pyramid level of each image that fits it (see
+        Image.at_size), eg: previews at the viewport size and exports at the full resolution of the same images,
+        without decoding or transforming them again.
+        :param images: the images at their full resolution
+        :param size: (width, height) of the results, defaults to native_size(images)
+        :param region: see Mixer, drawn on the spectrum of an image of region_size
+        :param region_size: (width, height), the region keeps its frequencies at any size. Defaults to size
+        :param edits: (brightness, contrast) of every image, applied at that size, defaults to none
+        :param kwargs: see Mixer
+        """
+        if size is None:
+            size = Mixer.native_size(images)
+        edits = edits or [(0, 1)] * len(images)
+        resized = [image.at_size(size, *edit) for image, edit in zip(images, edits)]
+        if region and region_size is not None:
+            region = Mixer.moved_region(region, (region_size[1], region_size[0]), (size[1], size[0]))
+        return Mixer(resized, region, **kwargs)
+
+    @staticmethod
+    def native_size(images: [Image]):
+        """(width, height) of the largest results all the images have every frequency of"""
+        return min(image.size[1] for image in images), min(image.size[0] for image in images)
+
+    @staticmethod
+    def moved_region(region, from_shape, to_shape):
+        """
+        The same frequencies as the region on a spectrum of from_shape, in the coordinates of a spectrum of to_shape
+        :param region: (inside_is_selected, x, y, width, height)
+        :param from_shape: (height, width)
+        :param to_shape: (height, width)
+        """
+        inside_is_selected, x, y, w, h = region
+        top = to_shape[0] // 2 - from_shape[0] // 2
+        left = to_shape[1] // 2 - from_shape[1] // 2
+        return inside_is_selected, x + left, y + top, w, h
+
+    def decimated(self, factor):
+        """
+        A Mixer over the lowest 1/factor of the frequencies along each axis, whose results are previews of this
+        Mixer's results at 1/factor of the resolution. Built once per factor.
+        """
+        if factor == 1:
+            return self
+        with self.__lock:
+            if factor not in self.__decimated:
+                preview = copy.copy(self)
+                preview.shape = (max(1, self.shape[0] // factor), max(1, self.shape[1] // factor))
+                preview.spectra = Image.resample_spectrum(self.spectra, self.shape, preview.shape, self.real_fft)
+                if self.region:
+                    # same frequencies, in the coordinates of the smaller shifted spectrum
+                    preview.region = self.moved_region(self.region, self.shape, preview.shape)
+                preview.__setup_region()
+                preview.__decimated = {}
+                self.__decimated[factor] = preview
+            return self.__decimated[factor]
+
+    def __working_spectra(self, spectra=None):
+        """
+        The parts of the spectra that get mixed: the region blocks if only the inside is selected, else all
+        :param spectra: the stack, or the spectrum of a single image, defaults to the whole stack
+        """
+        if spectra is None:
+            spectra = self.spectra
+        if self.inside_is_selected:
+            return [spectra[..., rows, cols] for rows, cols in self.region_blocks]
+        return [spectra]
+
+    def __magnitude_planes(self):
+        """Magnitudes of the working spectra, computed once per Mixer"""
+        with self.__lock:
+            if "magnitude" not in self.__planes:
+                self.__planes["magnitude"] = [np.abs(spectra) for spectra in self.__working_spectra()]
+            return self.__planes["magnitude"]
+
+    def __phasor_planes(self):
+        """Unit phase vectors exp(1j * phase) of the working spectra, computed once per Mixer"""
+        with self.__lock:
+            if "phasor" not in self.__planes:
+                phasors = []
+                for spectra, magnitudes in zip(self.__working_spectra(), self.__magnitude_planes()):
+                    phasors.append(self.__phasor(spectra, magnitudes))
+                self.__planes["phasor"] = phasors
+            return self.__planes["phasor"]
+
+    @staticmethod
+    def __phasor(spectra, magnitudes, out=None):
+        # zero bins have a phase of 0, so their phase vector is 1
+        if out is None:
+            out = np.empty_like(spectra)
+        out[...] = 1
+        np.divide(spectra, magnitudes, out=out, where=magnitudes != 0)
+        return out
+
+    def replace_image(self, index, image: Image):
+        """
+        Swap one of the images for another of the same size, eg: the next frame of a sequence mixed with fixed
+        references. Only the new image's spectrum is copied into the stack and only its magnitude and phase planes
+        are recomputed, those of the other images are kept.
+        :param index: position of the image in the images given to the Mixer
+        """
+        if self.tiled:
+            raise ValueError("Images of a tiled mix can't be replaced")
+        if image.size != self.images[index].size:
+            raise ValueError(f"Expected a {self.images[index].size} image, got {image.size}")
+        if self.real_fft and not image.real_fft:
+            raise ValueError("The images of a real FFT mix must all keep half spectra")
+        if image.channels > self.channels:
+            raise ValueError(f"Expected at most {self.channels} channels, got {image.channels}")
+        self.images = list(self.images)
+        self.images[index] = image
+        self.versions = self.versions[:index] + (image.version,) + self.versions[index + 1:]
+        self.spectra[index] = image.stored_modified_ft if self.real_fft else image.modified_ft
+        self.__decimated = {}
+        self.__planes.pop("basis", None)
+        magnitudes = self.__planes.get("magnitude")
+        if magnitudes is None:
+            return
+        phasors = self.__planes.get("phasor")
+        for i, spectrum in enumerate(self.__working_spectra(self.spectra[index])):
+            np.abs(spectrum, out=magnitudes[i][index])
+            if phasors is not None:
+                self.__phasor(spectrum, magnitudes[i][index], out=phasors[i][index])
 
     def mix_mag_phase(self, weights: []):
         """
@@ -46,20 +385,19 @@ class Mixer(QObject):
         """
         mag_weights = self.__get_adjusted_weights([weight[0] for weight in weights])
         phase_weights = self.__get_adjusted_weights([weight[1] for weight in weights])
-        mixed_magnitude = self.__mix_mag(mag_weights)
-        self.first_component_mixed.emit()
-        logger.info("Magnitude mixed")
-        mixed_phase = self.__mix_phase(phase_weights)
-        self.second_component_mixed.emit()
-        logger.info("Phase mixed")
-        complex_ft = mixed_magnitude * np.exp(1j * mixed_phase)
-        complex_ft = np.fft.ifftshift(complex_ft)
-        self.total_ft_found.emit()
-        logger.info("Resultant FT found")
-        image = Image.from_foureir_domain(complex_ft)
-        self.ifft_computed.emit()
-        logger.info("IFFT computed")
-        return image
+        result_key = ("mag_phase", tuple(mag_weights.tolist()), tuple(phase_weights.tolist()))
+        with self.__span("mag_phase") as span:
+            cached = self.__cache_get(result_key)
+            if cached is not None:
+                return self.__cached_image(span, cached)
+            if self.tiled:
+                return self.__mix_tiled(span, 0, mag_weights, phase_weights)
+            complex_ft = self.__mixed_mag_phase(span, mag_weights, phase_weights)
+            image = self.__inverse(complex_ft)
+            self.__report(span, "ifft_computed", image.image_data.nbytes)
+            logger.info("IFFT computed")
+            self.__cache_put(result_key, image.image_data)
+            return image
 
     def mix_real_imaginary(self, weights):
         """
@@ -70,75 +408,304 @@ class Mixer(QObject):
         """
         real_weights = self.__get_adjusted_weights([weight[0] for weight in weights])
         imaginary_weights = self.__get_adjusted_weights([weight[1] for weight in weights])
-        mixed_real = self.__mix_real(real_weights)
-        self.first_component_mixed.emit()
+        result_key = ("real_imaginary", tuple(real_weights.tolist()), tuple(imaginary_weights.tolist()))
+        with self.__span("real_imaginary") as span:
+            cached = self.__cache_get(result_key)
+            if cached is not None:
+                return self.__cached_image(span, cached)
+            if self.tiled:
+                return self.__mix_tiled(span, 1, real_weights, imaginary_weights)
+            complex_ft = self.__mixed_real_imaginary(span, real_weights, imaginary_weights)
+            image = self.__inverse(complex_ft)
+            self.__report(span, "ifft_computed", image.image_data.nbytes)
+            logger.info("IFFT computed")
+            self.__cache_put(result_key, image.image_data)
+            return image
+
+    def mixed_spectrum(self, weights, mode=0):
+        """
+        The mixed spectrum before the inverse FFT, for callers that inverse transform several mixes at once
+        (see inverse_batch). In the stored layout: shifted full spectrum, or unshifted half spectrum in real FFT mode.
+        :param weights: same as mix_mag_phase and mix_real_imaginary
+        :param mode: 0 for magnitude/phase, 1 for real/imaginary
+        """
+        if self.tiled:
+            raise ValueError("Tiled mixes are inverse transformed in tiles, they have no in-memory spectrum")
+        first_weights = self.__get_adjusted_weights([weight[0] for weight in weights])
+        second_weights = self.__get_adjusted_weights([weight[1] for weight in weights])
+        mode_name = ("mag_phase", "real_imaginary")[mode]
+        with self.__span(mode_name, Mixer.stages[:-1]) as span:
+            if mode == 0:
+                return self.__mixed_mag_phase(span, first_weights, second_weights)
+            return self.__mixed_real_imaginary(span, first_weights, second_weights)
+
+    def __mixed_mag_phase(self, span, mag_weights, phase_weights):
+        mixed_magnitude = self.__cached_component("magnitude", mag_weights, self.__mix_mag)
+        self.__report(span, "first_component_mixed", mixed_magnitude.nbytes)
+        logger.info("Magnitude mixed")
+        mixed_phase = self.__cached_component("phase", phase_weights, self.__mix_phase)
+        self.__report(span, "second_component_mixed", mixed_phase.nbytes)
+        logger.info("Phase mixed")
+        complex_ft = mixed_magnitude * np.exp(1j * mixed_phase)
+        self.__report(span, "total_ft_found", complex_ft.nbytes)
+        logger.info("Resultant FT found")
+        return complex_ft
+
+    def __mixed_real_imaginary(self, span, real_weights, imaginary_weights):
+        mixed_real = self.__cached_component("real", real_weights, self.__mix_real)
+        self.__report(span, "first_component_mixed", mixed_real.nbytes)
         logger.info("Real parts mixed")
-        mixed_imaginary = self.__mix_imaginary(imaginary_weights)
-        self.second_component_mixed.emit()
+        mixed_imaginary = self.__cached_component("imaginary", imaginary_weights, self.__mix_imaginary)
+        self.__report(span, "second_component_mixed", mixed_imaginary.nbytes)
         logger.info("Imaginary parts mixed")
         complex_ft = mixed_real + 1j * mixed_imaginary
-        complex_ft = np.fft.ifftshift(complex_ft)
-        self.total_ft_found.emit()
+        self.__report(span, "total_ft_found", complex_ft.nbytes)
         logger.info("Resultant FT found")
-        image = Image.from_foureir_domain(complex_ft)
-        self.ifft_computed.emit()
+        return complex_ft
+
+    @staticmethod
+    def inverse_batch(spectra, real_shape=None):
+        """
+        Inverse transform mixed spectra of the same shape and layout (see mixed_spectrum) in one batched FFT call
+        :param spectra: list of mixed spectra
+        :param real_shape: (height, width) of the images when the spectra are half spectra (real FFT mode)
+        :return: list of Images, each normalized on its own like the results of mix_mag_phase
+        """
+        stack = np.stack(spectra)
+        if real_shape is None:
+            stack = np.fft.ifftshift(stack, axes=(-2, -1))
+        return Image.from_foureir_domain_batch(stack, real_shape)
+
+    def sweep_real_imaginary(self, weight_sets, out=None):
+        """
+        Mix the images in real/imaginary mode with many weights, without any FFT per weight set.
+        Mixing the real and imaginary parts and the inverse FFT are linear in the weights, so every result is a
+        linear combination of 2N spatial basis images (see real_imaginary_basis), taken as one matrix product per
+        chunk of weight sets; each result is then normalized as from_foureir_domain does.
+        Matches mix_real_imaginary up to rounding, at most one gray level on a few pixels.
+        :param weight_sets: K weights lists, each one as for mix_real_imaginary
+        :param out: optional (K, ...) uint8 array to write the results to, eg: a memory-mapped file for long sweeps
+        :return: (K, height, width) uint8 array, (K, C, height, width) for color images
+        """
+        weight_sets = np.asarray(weight_sets, dtype=np.float64)
+        if weight_sets.ndim != 3 or weight_sets.shape[1:] != (len(self.images), 2):
+            raise ValueError(f"Expected K weights lists of {len(self.images)} (real, imaginary) pairs, "
+                             f"got an array of shape {weight_sets.shape}")
+        zero = np.flatnonzero((weight_sets.sum(axis=1) == 0).any(axis=1))
+        if len(zero):
+            raise ValueError(f"The weights of a component must not all be zero, weight sets {zero[:10].tolist()} are")
+        with self.instrumentation.span("sweep", ("basis_computed", "combined"), weight_sets=len(weight_sets),
+                                       images=len(self.images), shape=self.shape, channels=self.channels,
+                                       real_fft=self.real_fft, region=self.region, mask_type=self.mask_type) as span:
+            basis = self.real_imaginary_basis()
+            span.stage("basis_computed", sum(part.nbytes for part in basis))
+            # normalized per component like __get_adjusted_weights, real weights first as in the basis
+            coefficients = np.concatenate([weight_sets[..., 0] / weight_sets[..., 0].sum(axis=1, keepdims=True),
+                                           weight_sets[..., 1] / weight_sets[..., 1].sum(axis=1, keepdims=True)],
+                                          axis=1).astype(self.real_dtype)
+            result_shape = self.spectra.shape[1:-1] + (self.shape[1],)
+            if out is None:
+                out = np.empty((len(weight_sets),) + result_shape, dtype=np.uint8)
+            pixels = int(np.prod(result_shape))
+            flat_out = out.reshape(len(weight_sets), pixels)
+            # the real and imaginary parts of a chunk of results and their magnitudes
+            chunk = max(1, self.memory_budget // (3 * pixels * self.real_dtype.itemsize))
+            for start in range(0, len(weight_sets), chunk):
+                self.__combine(basis, coefficients[start:start + chunk], flat_out[start:start + chunk])
+            span.stage("combined", out.nbytes)
+        return out
+
+    @staticmethod
+    def __combine(basis, coefficients, out):
+        """
+        Magnitudes of the linear combinations of the basis, each normalized to uint8 on its own into out.
+        Same steps as Image.normalize, in place since the chunk is the bulk of the sweep's memory traffic.
+        """
+        magnitude = coefficients @ basis[0]
+        if len(basis) > 1:
+            imaginary = coefficients @ basis[1]
+            # a lot cheaper than np.hypot, and the same up to rounding
+            np.multiply(magnitude, magnitude, out=magnitude)
+            np.multiply(imaginary, imaginary, out=imaginary)
+            np.add(magnitude, imaginary, out=magnitude)
+            np.sqrt(magnitude, out=magnitude)
+        else:
+            np.abs(magnitude, out=magnitude)
+        low = magnitude.min(axis=1, keepdims=True)
+        high = magnitude.max(axis=1, keepdims=True)
+        magnitude -= low
+        magnitude /= high - low
+        magnitude *= 255
+        np.copyto(out, magnitude, casting="unsafe")
+
+    def real_imaginary_basis(self):
+        """
+        The inverse FFTs of the region-selected real part and imaginary part (times 1j) of every image's spectrum,
+        computed once per Mixer in one batched FFT call. The result of mix_real_imaginary, before its magnitude is
+        taken and normalized, is their linear combination with the adjusted real then imaginary weights.
+        :return: the real parts of the 2N basis images as a (2N, pixels) array, followed by their imaginary parts
+            unless they are real by construction (real FFT mode)
+        """
+        if self.tiled:
+            raise ValueError("Tiled mixes have no in-memory spectra to build a basis from")
+        with self.__lock:
+            if "basis" not in self.__planes:
+                count = len(self.images)
+                selected = np.empty((2 * count,) + self.spectra.shape[1:], dtype=self.spectra.dtype)
+                for i, spectrum in enumerate(self.spectra):
+                    selected[i] = self.__select(spectrum.real)
+                    selected[count + i] = 1j * self.__select(spectrum.imag)
+                fft = FFTBackend.get_backend()
+                if self.real_fft:
+                    basis = (fft.irfft2(selected, s=self.shape).reshape(2 * count, -1),)
+                else:
+                    spatial = fft.ifft2(np.fft.ifftshift(selected, axes=(-2, -1))).reshape(2 * count, -1)
+                    basis = (np.ascontiguousarray(spatial.real), np.ascontiguousarray(spatial.imag))
+                self.__planes["basis"] = basis
+            return self.__planes["basis"]
+
+    def __select(self, component):
+        """A copy of a full size component with the frequencies outside of the region zeroed, as mixing does"""
+        if not self.inside_is_selected:
+            return self.__apply_mask(component.copy())
+        selected = np.zeros_like(component)
+        for rows, cols in self.region_blocks:
+            selected[..., rows, cols] = component[..., rows, cols]
+        return selected
+
+    def __span(self, mode, stages=None):
+        if self.spectra is not None:
+            fft_shape, dtype = self.spectra.shape[1:], self.spectra.dtype
+        else:
+            fft_shape, dtype = self.shape, np.dtype(FFTBackend.get_backend().complex_dtype)
+        return self.instrumentation.span("mix", stages or Mixer.stages, mode=mode, images=len(self.images), shape=self.shape,
+                                         channels=self.channels, fft_shape=fft_shape, dtype=str(dtype),
+                                         real_fft=self.real_fft, tiled=self.tiled, region=self.region,
+                                         mask_type=self.mask_type)
+
+    def __mix_tiled(self, span, mode, first_weights, second_weights):
+        """
+        Mix row tile by row tile into a memory-mapped spectrum, then inverse transform and normalize it in tiles
+        :return: LargeImage
+        """
+        scratch = ScratchSpace.default()
+        fft = FFTBackend.get_backend()
+        height, width = self.shape
+        rows = rows_per_tile(width, self.__working_set_bytes(1) // width, self.memory_budget)
+        logger.info(f"Mixing {height}x{width} spectra in tiles of {rows} rows")
+        complex_ft = scratch.empty(self.shape, fft.complex_dtype)
+        for start in range(0, height, rows):
+            tile = self.__tile(start, min(height, start + rows))
+            if mode == 0:
+                complex_ft[start:start + rows] = tile.__mix_mag(first_weights) * np.exp(1j * tile.__mix_phase(second_weights))
+            else:
+                complex_ft[start:start + rows] = tile.__mix_real(first_weights) + 1j * tile.__mix_imaginary(second_weights)
+        self.__report(span, "first_component_mixed")
+        self.__report(span, "second_component_mixed")
+        self.__report(span, "total_ft_found", complex_ft.nbytes)
+        logger.info("Resultant FT found")
+        tiled_ifft2(complex_ft, complex_ft, self.memory_budget)
+        image_data = tiled_normalize(complex_ft, scratch.empty(self.shape, np.uint8), self.memory_budget)
+        self.__report(span, "ifft_computed", image_data.nbytes)
         logger.info("IFFT computed")
-        return image
+        return LargeImage(image_data, scratch)
+
+    def __tile(self, start, stop):
+        """An in-memory Mixer over rows start to stop of the spectra"""
+        tile = copy.copy(self)
+        tile.tiled = False
+        tile.cache = None
+        tile.shape = (stop - start, self.shape[1])
+        tile.spectra = np.empty((len(self.images),) + tile.shape, dtype=FFTBackend.get_backend().complex_dtype)
+        for i, image in enumerate(self.images):
+            tile.spectra[i] = image.stored_modified_ft[start:stop]
+        if self.region:
+            inside_is_selected, x, y, w, h = self.region
+            tile.region = (inside_is_selected, x, y - start, w, h)
+        tile.__setup_region()
+        return tile
 
     def __mix_phase(self, weights):
         """
         Mix the phase of the images based on a weighted vector approach
         :param weights: Array of weights between 0 and 1, must match the number of images provided
-        :return: The resultant complex matrix combining the phases of all images provided
+        :return: The resultant phase matrix combining the phases of all images provided
         """
-        phases = [(image.get_phase() * self.mask).astype(float) for image in self.images]
-        phase_vectors = [np.exp(1j * phase) for phase in phases]
-        mixed_phase_vector = np.sum([vec * weight for vec, weight in zip(phase_vectors, weights)], axis=0)
-        return np.angle(mixed_phase_vector)
+        return self.__mix(weights, self.__phasor_planes(), lambda w, phasors: np.angle(np.tensordot(w, phasors, axes=1)))
 
     def __mix_mag(self, weights):
-        magnitudes = [image.get_magnitude() * self.mask for image in self.images]
-        mixed_magnitude = np.zeros_like(magnitudes[0])
-        for magnitude, weight in zip(magnitudes, weights):
-            mixed_magnitude += magnitude * weight
-        return mixed_magnitude
+        return self.__mix(weights, self.__magnitude_planes(), lambda w, magnitudes: np.tensordot(w, magnitudes, axes=1))
 
     def __mix_real(self, weights):
-        real_parts = [image.get_real_part() * self.mask for image in self.images]
-        mixed_real = np.zeros_like(real_parts[0])
-        for real, weight in zip(real_parts, weights):
-            mixed_real += real * weight
-        return mixed_real
+        planes = [spectra.real for spectra in self.__working_spectra()]
+        return self.__mix(weights, planes, lambda w, real: np.einsum('n,n...->...', w, real))
 
     def __mix_imaginary(self, weights):
-        imaginary_parts = [image.get_imaginary_part() * self.mask for image in self.images]
-        mixed_imaginary = np.zeros_like(imaginary_parts[0])
-        for imaginary, weight in zip(imaginary_parts, weights):
-            mixed_imaginary += imaginary * weight
-        return mixed_imaginary
+        planes = [spectra.imag for spectra in self.__working_spectra()]
+        return self.__mix(weights, planes, lambda w, imaginary: np.einsum('n,n...->...', w, imaginary))
 
-    @staticmethod
-    def __get_adjusted_weights(weights):
-        total = sum(weights)
-        return [weight / total for weight in weights]
+    def __mix(self, weights, planes, reduce):
+        """
+        Weighted reduction of every working plane, placed back into a full size component
+        :param planes: list of (N, h, w) arrays, or (N, C, h, w) for color, aligned with the working spectra
+        :param reduce: function of (weights, planes) returning the (h, w) or (C, h, w) mixed plane
+        """
+        # float64 weights would upcast the whole reduction
+        weights = weights.astype(self.real_dtype, copy=False)
+        if not self.inside_is_selected:
+            return self.__apply_mask(reduce(weights, planes[0]))
+        component = np.zeros(self.spectra.shape[1:], dtype=self.spectra.real.dtype)
+        for (rows, cols), plane in zip(self.region_blocks, planes):
+            component[..., rows, cols] = reduce(weights, plane)
+        return component
 
+    def __cache_get(self, key):
+        if self.cache is None:
+            return None
+        return self.cache.get(self.key + key)
 
-class MixingThread(QThread):
-    result_ready = Signal(object)
-    error_occurred = Signal(str)
+    def __cache_put(self, key, value):
+        if self.cache is not None:
+            self.cache.put(self.key + key, value)
 
-    def __init__(self, mixer, weights, mode):
-        super().__init__()
-        self.mixer = mixer
-        self.weights = weights
-        self.mode = mode
+    def __cached_component(self, component, weights, mix):
+        key = (component, tuple(weights.tolist()))
+        mixed = self.__cache_get(key)
+        if mixed is None:
+            mixed = mix(weights)
+            self.__cache_put(key, mixed)
+        return mixed
 
-    def run(self):
-        try:
-            if self.mode == 0:
-                result_image = self.mixer.mix_mag_phase(self.weights)
-            else:
-                result_image = self.mixer.mix_real_imaginary(self.weights)
-            self.result_ready.emit(result_image)
-        except Exception as e:
-            self.error_occurred.emit(str(e))
+    def __cached_image(self, span, image_data):
+        span.attributes["cached"] = True
+        for stage in Mixer.stages:
+            self.__report(span, stage)
+        logger.info("Mixed image found in cache")
+        # a new Image each time, callers resize and edit the images they get
+        return Image(image_data, self.real_fft)
+
+    def __inverse(self, complex_ft):
+        if self.real_fft:
+            return Image.from_foureir_domain(complex_ft, real_shape=self.shape)
+        return Image.from_foureir_domain(np.fft.ifftshift(complex_ft, axes=(-2, -1)))
+
+    def __apply_mask(self, component):
+        """Mask the unselected frequencies in place, the weighted sum commutes with the mask"""
+        if self.mask is not None:
+            np.multiply(component, self.mask, out=component)
+        for rows, cols in self.region_blocks:
+            component[..., rows, cols] = 0
+        return component
+
+    def __report(self, span, stage, nbytes=0):
+        span.stage(stage, nbytes)
+        if self.progress_callback is not None:
+            self.progress_callback(stage)
+
+    @staticmethod
+    def __get_adjusted_weights(weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        total = weights.sum()
+        if total == 0:
+            raise ValueError("The weights of a component must not all be zero")
+        return weights / total
@@ -0,0 +1,65 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _run_chunk(task, jobs):
+    """
+    Runs in a worker process. Each job is isolated so that one failure doesn't lose the rest of the chunk.
+    :return: a list of (result, error message) tuples, one per job
+    """
+    results = []
+    for job in jobs:
+        try:
+            results.append((task(job), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+
+class MixingExecutor:
+    def __init__(self, task, workers=None, chunk_size=1, max_pending_chunks=None, initializer=None, initargs=()):
+        """
+        Fans independent mix jobs out across a process pool.
+        Everything heavy (decoding, FFTs, mixing, inverse FFT) happens inside the task, in the workers.
+        :param task: a picklable (module level) function taking a single job
+        :param workers: number of worker processes, defaults to the number of CPUs
+        :param chunk_size: number of jobs sent to a worker at once, larger chunks amortize the IPC overhead
+        :param max_pending_chunks: bound on the chunks in flight so long job lists are consumed lazily,
+            defaults to twice the number of workers
+        :param initializer: optional callable run once in every worker process, eg: to select the FFT backend
+        :param initargs: arguments passed to the initializer
+        """
+        self.task = task
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.max_pending_chunks = max_pending_chunks or 2 * self.workers
+        self.initializer = initializer
+        self.initargs = initargs
+
+    def map(self, jobs):
+        """
+        Run the task on every job in the process pool
+        :param jobs: an iterable of jobs, consumed lazily
+        :return: a generator of (job, result, error message) tuples, in the same order as the jobs
+        """
+        jobs = iter(jobs)
+        logger.info(f"Starting {self.workers} mixing workers with chunks of {self.chunk_size} jobs")
+        with ProcessPoolExecutor(self.workers, initializer=self.initializer, initargs=self.initargs) as pool:
+            pending = deque()
+            while True:
+                while len(pending) < self.max_pending_chunks:
+                    chunk = list(islice(jobs, self.chunk_size))
+                    if not chunk:
+                        break
+                    pending.append((chunk, pool.submit(_run_chunk, self.task, chunk)))
+                if not pending:
+                    break
+                chunk, future = pending.popleft()
+                for job, (result, error) in zip(chunk, future.result()):
+                    yield job, result, error
@@ -0,0 +1,114 @@
+import copy
+
+from PySide6.QtCore import QObject, Signal, QThread
+
+from Instrumentation import Sink, get_instrumentation
+from LargeImage import LargeImage
+from Mixer import Mixer
+
+
+class ProgressSignalSink(QObject, Sink):
+    """
+    Instrumentation sink re-emitting the stages of the spans it sees as Qt signals, with the fraction of the
+    span's expected duration done so far (stages weighted by their past durations, see Span.fraction)
+    """
+    stage_completed = Signal(str, float)
+    progress = Signal(float)
+
+    def on_span_started(self, span):
+        self.progress.emit(0.0)
+
+    def on_stage(self, span, stage):
+        fraction = span.fraction
+        self.stage_completed.emit(stage["stage"], stage["seconds"])
+        self.progress.emit(fraction)
+
+
+class MixingThread(QThread):
+    """
+    Builds a Mixer over the images at the given size (see Mixer.at_size), which resamples and edits them, and mixes
+    it, all off the GUI thread
+    """
+    result_ready = Signal(object)
+    error_occurred = Signal(str)
+
+    def __init__(self, images, weights, mode, size=None, region=None, **kwargs):
+        """
+        :param images: the images at their full resolution
+        :param size: (width, height) of the result, defaults to Mixer.native_size(images)
+        :param kwargs: see Mixer.at_size, eg: region_size, edits, cache
+        """
+        super().__init__()
+        self.images = images
+        self.weights = weights
+        self.mode = mode
+        self.size = size
+        self.region = region
+        self.mixer_kwargs = kwargs
+        # signals of this mix only, on top of the sinks the mixer reports to
+        self.progress_sink = ProgressSignalSink()
+
+    def run(self):
+        try:
+            mixer = Mixer.at_size(self.images, self.size, self.region,
+                                  instrumentation=get_instrumentation().with_sinks(self.progress_sink),
+                                  **self.mixer_kwargs)
+            if self.mode == 0:
+                result_image = mixer.mix_mag_phase(self.weights)
+            else:
+                result_image = mixer.mix_real_imaginary(self.weights)
+            # the viewport shows the result from its spectrum, computed here rather than on the GUI thread. A tiled
+            # result is shown from a preview of its pixels instead, see ViewPort.set_image
+            if not isinstance(result_image, LargeImage):
+                result_image.stored_ft
+            self.result_ready.emit(result_image)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+
+class MixCancelled(Exception):
+    pass
+
+
+class PreviewMixingThread(QThread):
+    """
+    Mixes coarse to fine: a low resolution preview from the decimated spectra first, then the full resolution result.
+    Cancelling stops the mix at the next stage boundary and nothing more is emitted.
+    """
+    preview_ready = Signal(object, bool)
+    error_occurred = Signal(str)
+
+    def __init__(self, mixer, weights, mode, decimations=(4, 1)):
+        """
+        :param decimations: the resolution divisors to render, in order. The last result is reported as final.
+        """
+        super().__init__()
+        self.mixer = mixer
+        self.weights = weights
+        self.mode = mode
+        self.decimations = decimations
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def check_cancelled(self, stage=None):
+        if self.cancelled:
+            raise MixCancelled()
+
+    def run(self):
+        try:
+            for i, factor in enumerate(self.decimations):
+                # a copy for this thread's cancellation check only, its caches are still shared with the others
+                mixer = copy.copy(self.mixer.decimated(factor))
+                mixer.progress_callback = self.check_cancelled
+                if self.mode == 0:
+                    result_image = mixer.mix_mag_phase(self.weights)
+                else:
+                    result_image = mixer.mix_real_imaginary(self.weights)
+                self.check_cancelled()
+                self.preview_ready.emit(result_image, i == len(self.decimations) - 1)
+        except MixCancelled:
+            pass
+        except Exception as e:
+            self.error_occurred.emit(str(e))
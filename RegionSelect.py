@@ -128,9 +128,14 @@ class RegionSelect(QWidget):
 
 
 class RegionSelectManager(QObject):
+    # the region, its inside/outside selection or whether it is used at all changed
+    selection_changed = Signal()
+
     def __init__(self):
         super().__init__()
         self.listeners = []
+        # callables building the RegionSelect overlays that weren't needed yet
+        self.listener_factories = []
         self.is_selecting = False
         self.inside_selected = True
 
@@ -139,6 +144,22 @@ class RegionSelectManager(QObject):
         listener.region_changed.connect(self.update_listeners)
         listener.inside_selected_changed.connect(self.toggle_inside_selected)
 
+    def add_listener_factory(self, factory):
+        """
+        Register an overlay that is only built, by calling factory, when region selection is first turned on
+        """
+        self.listener_factories.append(factory)
+
+    def build_listeners(self):
+        for factory in self.listener_factories:
+            listener = factory()
+            if self.listeners:
+                listener.region_rect = QRect(self.listeners[0].region_rect)
+                listener.update_handles()
+            listener.inside_selected = self.inside_selected
+            self.add_listener(listener)
+        self.listener_factories = []
+
     def update_listeners(self, region):
         sender = self.sender()
         for listener in self.listeners:
@@ -147,17 +168,22 @@ class RegionSelectManager(QObject):
             listener.region_rect = region
             listener.update_handles()
             listener.update()
+        self.selection_changed.emit()
 
     def toggle_inside_selected(self):
         self.inside_selected = not self.inside_selected
         for listener in self.listeners:
             listener.inside_selected = self.inside_selected
             listener.update()
+        self.selection_changed.emit()
 
     def toggle_select_region(self):
         self.is_selecting = not self.is_selecting
+        if self.is_selecting:
+            self.build_listeners()
         for listener in self.listeners:
             if self.is_selecting:
                 listener.show()
             else:
                 listener.hide()
+        self.selection_changed.emit()
@@ -0,0 +1,110 @@
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+import FFTBackend
+from Image import Image
+from logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class SpectrumCache:
+    """
+    Persistent cache of decoded, resized pixels and their spectra, keyed by the content of the image file,
+    the target size and the FFT settings. Entries are .npy files opened memory-mapped, and the least recently
+    used ones are evicted once the cache grows past max_bytes.
+    """
+    default_dir = os.path.join(os.path.expanduser("~"), ".cache", "image_mixer", "spectra")
+    __default = None
+
+    def __init__(self, cache_dir=None, max_bytes=2 * 1024 ** 3):
+        """
+        :param cache_dir: directory holding the entries, created if needed
+        :param max_bytes: total size of the entries kept on disk
+        """
+        self.cache_dir = cache_dir or SpectrumCache.default_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def default():
+        """The cache shared by the GUI viewports"""
+        if SpectrumCache.__default is None:
+            SpectrumCache.__default = SpectrumCache()
+        return SpectrumCache.__default
+
+    def load(self, file_path, size=None, real_fft=False, color=False):
+        """
+        Load an image, skipping decode, resize and FFT when the same file was already loaded with the same settings
+        :param file_path: path of the image file
+        :param size: (width, height) to resize to, None keeps the original size
+        :param real_fft: see Image
+        :param color: keep the RGB channels, see Image.from_file
+        :return: Image
+        """
+        key = self.key(file_path, size, real_fft, color)
+        pixels_path, spectrum_path = self.__paths(key)
+        try:
+            image_data = np.load(pixels_path, mmap_mode='r')
+            spectrum = np.load(spectrum_path, mmap_mode='r')
+        except (OSError, ValueError):
+            image = Image.from_file(file_path, real_fft, size, color)
+            self.__store(key, image)
+            return image
+        logger.debug(f"Spectrum cache hit for {file_path}")
+        for path in (pixels_path, spectrum_path):
+            os.utime(path)
+        return Image(image_data, real_fft, spectrum=spectrum)
+
+    @staticmethod
+    def key(file_path, size=None, real_fft=False, color=False):
+        fft = FFTBackend.get_backend()
+        digest = hashlib.blake2b(digest_size=20)
+        with open(file_path, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(block)
+        size_tag = "full" if size is None else f"{size[0]}x{size[1]}"
+        fft_tag = f"{fft.name}-{fft.precision}-{'rfft' if real_fft else 'fft'}"
+        color_tag = "rgb" if color else "gray"
+        return f"{digest.hexdigest()}_{size_tag}_{color_tag}_{fft_tag}"
+
+    def __paths(self, key):
+        return (os.path.join(self.cache_dir, f"{key}.pixels.npy"),
+                os.path.join(self.cache_dir, f"{key}.spectrum.npy"))
+
+    def __store(self, key, image):
+        for path, array in zip(self.__paths(key), (image.image_data, image.stored_ft)):
+            # write then rename, so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                np.save(file, array)
+            os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".npy"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        # evicted meanwhile by another loader thread or process
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            logger.debug(f"Evicted {path} from the spectrum cache")
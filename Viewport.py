@@ -1,9 +1,10 @@
-import numpy as np
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QImage, QPixmap, QIcon
+from PySide6.QtCore import Qt, QSize, QTimer, Signal
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QGridLayout, QLabel, QComboBox, QFileDialog, QPushButton, QFrame
 
-from Image import Image
+from ImageLabel import ImageLabel
+from ImageLoader import ImageLoader
+from LargeImage import LargeImage
 from RegionSelect import RegionSelect
 from logger_config import setup_logger
 
@@ -11,6 +12,11 @@ logger = setup_logger(__name__)
 
 
 class ViewPort(QFrame):
+    # the image or its edits changed
+    image_changed = Signal()
+    # more than one file was picked in the file dialog, for the application to spread over the viewports
+    files_selected = Signal(list)
+
     image_size = QSize(220, 220)
     max_brightness = 50
     min_brightness = -50
@@ -25,13 +31,23 @@ class ViewPort(QFrame):
         self.setFrameShadow(QFrame.Shadow.Sunken)
         self.setLineWidth(1)
         self.setMidLineWidth(0)
+        # the image at full resolution, image is its pyramid level at the size of the viewport, with the edits
+        self.source = None
         self.image = None
+        # file the image was loaded from, reloaded when the color mode changes
+        self.file_path = None
+        # load the RGB channels of the images instead of gray levels
+        self.color = False
+        # (component, image version) the FT label shows
+        self.ft_shown = None
         self.brightness = 0
         self.contrast = 1
 
         # Tracking drag state
         self.dragging = False
         self.last_pos = None
+        # True while an edit is queued for rendering, later drag events only update the values it will use
+        self.edit_pending = False
 
         self.layout = QGridLayout()
         self.setLayout(self.layout)
@@ -40,7 +56,7 @@ class ViewPort(QFrame):
         self.layout.setRowStretch(0, 1)
         self.layout.setRowStretch(1, 0)
 
-        self.image_label = QLabel()
+        self.image_label = ImageLabel()
         self.image_label.setMaximumSize(ViewPort.image_size)
         self.image_label.setMinimumSize(ViewPort.image_size)
         if is_input:
@@ -50,7 +66,7 @@ class ViewPort(QFrame):
             self.image_label.mouseMoveEvent = self.drag_motion
         self.layout.addWidget(self.image_label, 0, 0, 1, 6)
 
-        self.ft_label = QLabel()
+        self.ft_label = ImageLabel()
         self.ft_label.setMaximumSize(ViewPort.image_size)
         self.ft_label.setMinimumSize(ViewPort.image_size)
         self.layout.addWidget(self.ft_label, 0, 6, 1, 6)
@@ -80,10 +96,23 @@ class ViewPort(QFrame):
             self.region_select_btn.setIconSize(QSize(20, 20))
             self.layout.addWidget(self.region_select_btn, 1, 11)
 
-            self.region_selector = RegionSelect(self.ft_label)
+            # built on first use (see region_selector), most sessions never select a region
+            self.__region_selector = None
 
             self.image_label.mouseDoubleClickEvent = lambda even: self.load_image()
 
+            self.loader = ImageLoader.default()
+            self.loader.thumbnail_ready.connect(self.show_thumbnail)
+            self.loader.image_ready.connect(self.show_loaded_image)
+            self.loader.load_failed.connect(self.show_load_error)
+
+    @property
+    def region_selector(self):
+        if self.__region_selector is None:
+            self.__region_selector = RegionSelect(self.ft_label)
+            self.__region_selector.hide()
+        return self.__region_selector
+
     def start_drag(self, event):
         if self.image is not None and event.button() == Qt.LeftButton:
             self.dragging = True
@@ -115,57 +144,112 @@ class ViewPort(QFrame):
 
             self.contrast = new_contrast
             self.brightness = new_brightness
+            self.last_pos = event.pos()
 
-            self.image.changeBrightnessContrast(self.brightness, self.contrast)
+            if not self.edit_pending:
+                self.edit_pending = True
+                QTimer.singleShot(0, self.apply_pending_edit)
 
-            self.update_labels()
-            self.last_pos = event.pos()
+    def apply_pending_edit(self):
+        self.edit_pending = False
+        if self.image is None:
+            return
+        self.image = self.image_at(self.display_size)
+        self.update_labels()
+        self.image_changed.emit()
 
     def load_image(self):
         file_dialog = QFileDialog(self)
-        file_dialog.setFileMode(QFileDialog.ExistingFile)
+        file_dialog.setFileMode(QFileDialog.ExistingFiles)
         file_dialog.setNameFilter("Images (*.png *.jpg *jpeg)")
         if file_dialog.exec():
-            file_path = file_dialog.selectedFiles()[0]
-            self.set_image(Image.from_file(file_path))
+            file_paths = file_dialog.selectedFiles()
+            if len(file_paths) == 1:
+                self.load_file(file_paths[0])
+            else:
+                self.files_selected.emit(file_paths)
+
+    def load_file(self, file_path):
+        """
+        Load an image in the background: a thumbnail is shown first, the image replaces it once its spectrum is
+        computed. Loading another file before that drops this one.
+        """
+        self.file_path = file_path
+        self.loader.load(self, file_path, self.display_size, self.color)
+
+    def set_color(self, color):
+        """Switch between color and grayscale, reloading the current image in the new mode"""
+        if color == self.color:
+            return
+        self.color = color
+        if self.file_path is not None:
+            self.load_file(self.file_path)
+
+    def show_thumbnail(self, request, thumbnail):
+        if request.target is not self or not self.loader.is_current(request):
+            return
+        self.image_label.show_pixels(thumbnail)
+        self.ft_label.clear()
+        self.ft_shown = None
+
+    def show_loaded_image(self, request, image):
+        if request.target is not self or not self.loader.is_current(request):
+            return
+        self.set_image(image)
+
+    def show_load_error(self, request, error):
+        if request.target is not self or not self.loader.is_current(request):
+            return
+        if self.image is not None:
+            self.update_labels()
 
     def update_ft_label(self):
-        height, width = self.image.size
-        bytes_per_line = width
-        relevant_ft = self.image.get_ft_image(self.component_combo.currentText())
-        contiguous_arr = np.ascontiguousarray(relevant_ft.data)  # Fixed C-contiguous error
-        q_ft = QImage(contiguous_arr, width, height, bytes_per_line, QImage.Format_Grayscale8)
-        self.ft_label.setPixmap(QPixmap.fromImage(q_ft).scaled(
-            self.ft_label.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        ))
+        component = self.component_combo.currentText()
+        shown = (component, self.image.version)
+        if shown == self.ft_shown:
+            return
+        # the rendered plane is cached by the image, showing it is a copy into the label's buffer
+        self.ft_label.show_pixels(self.image.get_ft_image(component))
+        self.ft_shown = shown
 
     def update_img_label(self):
-        height, width = self.image.size
-        bytes_per_line = width
-        q_img = QImage(self.image.get_image_data().data, width, height, bytes_per_line, QImage.Format_Grayscale8)
-        self.image_label.setPixmap(QPixmap.fromImage(q_img).scaled(
-            self.image_label.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        ))
+        self.image_label.show_pixels(self.image.display_data)
 
     def update_labels(self):
         self.update_img_label()
         self.update_ft_label()
 
+    @property
+    def display_size(self):
+        """(width, height) the image is shown and previewed at"""
+        return self.image_label.size().width(), self.image_label.size().height()
+
+    def image_at(self, size):
+        """
+        The image at another size with the viewport's edits, from the level of its pyramid that fits it
+        :param size: (width, height)
+        """
+        return self.source.at_size(size, self.brightness, self.contrast)
+
     def set_image(self, image):
-        self.image = image
-        self.image.resize((self.image_label.size().width(), self.image_label.size().height()))
+        """
+        :param image: the image at full resolution, shown at the pyramid level that fits the viewport. A
+            LargeImage (from a tiled mix) is replaced by an in-memory preview of it
+        """
+        if isinstance(image, LargeImage):
+            image = image.preview(self.display_size)
+        self.source = image
+        self.ft_shown = None
         self.brightness = 0
         self.contrast = 1
-        self.image.changeBrightnessContrast(self.brightness, self.contrast)
+        self.image = self.image_at(self.display_size)
         self.update_labels()
+        self.image_changed.emit()
 
     def reset_edits(self):
         self.brightness = 0
         self.contrast = 1
-        self.image.changeBrightnessContrast(self.brightness, self.contrast)
+        self.image = self.image_at(self.display_size)
         self.update_labels()
+        self.image_changed.emit()
         logger.info("Image edits reset")
@@ -0,0 +1,324 @@
+"""
+Headless batch mixing, no Qt involved.
+
+The manifest is either a JSON list of jobs or a JSON Lines file (one job per line, read lazily so
+arbitrarily long job lists run in constant memory). Each job looks like:
+
+    {
+        "images": ["Images/cat.jpg", "Images/roses.jpg"],
+        "weights": [[0.3, 0.7], [0.7, 0.3]],
+        "mode": "mag_phase",                       # or "real_imaginary"
+        "region": [true, 70, 70, 80, 80],          # optional, (inside_is_selected, x, y, width, height)
+        "mask_type": "gaussian",                   # optional, "hard" (default), "gaussian" or "butterworth"
+        "softness": 5,                             # optional, edge width or order of the soft masks
+        "size": [220, 220],                        # optional, defaults to the size of the first image
+        "real_fft": true,                          # optional, mix the rfft2 half spectra (default: --real-fft)
+        "large": true,                             # optional, memory-map the images and mix them in tiles
+                                                   # (default: --large), they must all have the same size
+        "color": true,                             # optional, mix the RGB channels (default: --color),
+                                                   # not for large jobs
+        "output": "out/cat_roses.png"              # optional, defaults to <output_dir>/<job index>.png
+    }
+
+Usage:
+    python batch_mix.py jobs.jsonl --output-dir out/ --workers 32 --chunk-size 4
+    python batch_mix.py scans.jsonl --large --memory-budget 4G
+    python batch_mix.py photos.jsonl --color
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import FFTBackend
+from Image import Image
+from Instrumentation import JsonLinesSink, get_instrumentation
+from LargeImage import LargeImage, parse_bytes, set_memory_budget
+from Mixer import Mixer
+from MixingExecutor import MixingExecutor
+from SpectrumCache import SpectrumCache
+from logger_config import set_quiet, setup_logger
+
+logger = setup_logger(__name__)
+
+MODES = {"mag_phase": 0, "real_imaginary": 1}
+
+
+class MixJob:
+    def __init__(self, index, images, weights, mode=0, region=None, size=None, output=None, real_fft=False,
+                 cache_dir=None, mask_type="hard", softness=None, large=False, color=False):
+        """
+        :param index: position of the job in the manifest
+        :param images: list of image file paths
+        :param weights: list of (first component weight, second component weight) tuples, one per image
+        :param mode: 0 for magnitude/phase, 1 for real/imaginary (same as MixingThread)
+        :param region: a tuple containing (inside_is_selected, x, y, width, height), or None for the full spectrum
+        :param size: (width, height) every image is resized to, or None to use the first image's size
+        :param output: path the mixed image is written to
+        :param real_fft: store and mix only the Hermitian half spectra of the (real) images. A region that isn't
+            symmetric through DC is mixed on the full spectra instead, see Mixer
+        :param cache_dir: directory of the SpectrumCache used to load the images, None to always decode
+        :param mask_type: how the region is cut out, see Mixer
+        :param softness: edge width or order of soft masks, see soft_mask
+        :param large: load the images as memory-mapped LargeImages instead of decoding them into memory
+        :param color: load and mix the RGB channels of the images instead of their gray levels
+        """
+        if len(images) != len(weights):
+            raise ValueError(f"Job {index}: got {len(images)} images but {len(weights)} weights")
+        if large and color:
+            raise ValueError(f"Job {index}: large images are mixed in grayscale only")
+        self.index = index
+        self.images = images
+        self.weights = weights
+        self.mode = mode
+        self.region = region
+        self.size = size
+        self.output = output
+        self.real_fft = real_fft
+        self.cache_dir = cache_dir
+        self.mask_type = mask_type
+        self.softness = softness
+        self.large = large
+        self.color = color
+
+    @staticmethod
+    def from_dict(index, job, output_dir=".", real_fft=False, cache_dir=None, large=False, color=False):
+        if not isinstance(job, dict):
+            raise ValueError(f"Job {index}: expected an object, got {type(job).__name__}")
+        for field in ("images", "weights"):
+            if field not in job:
+                raise ValueError(f"Job {index}: missing {field!r}")
+        mode = job.get("mode", 0)
+        if isinstance(mode, str):
+            if mode not in MODES:
+                raise ValueError(f"Job {index}: unknown mode {mode!r}, expected one of {list(MODES)}")
+            mode = MODES[mode]
+        if mode not in MODES.values():
+            raise ValueError(f"Job {index}: unknown mode {mode!r}, expected one of {list(MODES)}")
+        region = job.get("region")
+        if region is not None:
+            region = tuple(region)
+        size = job.get("size")
+        if size is not None:
+            size = tuple(size)
+        output = job.get("output") or os.path.join(output_dir, f"{index:06d}.png")
+        real_fft = job.get("real_fft", real_fft)
+        return MixJob(index, job["images"], job["weights"], mode, region, size, output, real_fft, cache_dir,
+                      job.get("mask_type", "hard"), job.get("softness"), job.get("large", large),
+                      job.get("color", color))
+
+
+class InvalidJob:
+    """A manifest entry that isn't a valid job, reported as a failed job when it is run"""
+
+    def __init__(self, index, error):
+        self.index = index
+        self.error = error
+
+
+def read_manifest(manifest_path, output_dir=".", real_fft=False, cache_dir=None, large=False, color=False):
+    """
+    Yield MixJob objects from a JSON (list of jobs) or JSON Lines (one job per line) manifest.
+    Malformed entries are yielded as InvalidJob, so they fail on their own without stopping the run.
+    """
+    def parse(index, load):
+        try:
+            return MixJob.from_dict(index, load(), output_dir, real_fft, cache_dir, large, color)
+        except (ValueError, TypeError) as e:
+            # json.JSONDecodeError is a ValueError
+            return InvalidJob(index, str(e) if str(e).startswith("Job ") else f"Job {index}: {e}")
+
+    with open(manifest_path) as file:
+        if manifest_path.endswith(".jsonl"):
+            index = 0
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                yield parse(index, lambda: json.loads(line))
+                index += 1
+        else:
+            for index, job in enumerate(json.load(file)):
+                yield parse(index, lambda: job)
+
+
+_caches = {}
+
+
+def _get_cache(cache_dir):
+    """One SpectrumCache per directory and process"""
+    if cache_dir not in _caches:
+        _caches[cache_dir] = SpectrumCache(cache_dir)
+    return _caches[cache_dir]
+
+
+def load_images(paths, size=None, real_fft=False, cache_dir=None, color=False):
+    def load(path, size):
+        if cache_dir is not None:
+            return _get_cache(cache_dir).load(path, size, real_fft, color)
+        return Image.from_file(path, real_fft, size, color)
+
+    first = load(paths[0], size)
+    if size is None:
+        height, width = first.size
+        size = (width, height)
+    return [first] + [load(path, size) for path in paths[1:]]
+
+
+def load_large_images(paths, size=None):
+    """
+    Memory-map the images without resizing them, a large job needs them all at the same size
+    """
+    images = [LargeImage.from_file(path) for path in paths]
+    height, width = images[0].size
+    if size is not None and tuple(size) != (width, height):
+        raise ValueError(f"Large images can't be resized, {paths[0]} is {width}x{height} but size is {size}")
+    for path, image in zip(paths[1:], images[1:]):
+        if image.size != images[0].size:
+            raise ValueError(f"{path} is {image.size[1]}x{image.size[0]} but {paths[0]} is {width}x{height}")
+    return images
+
+
+def mix_job(job: MixJob):
+    """
+    Load and mix the images of a single job
+    :return: the mixed Image
+    """
+    if job.large:
+        images = load_large_images(job.images, job.size)
+    else:
+        images = load_images(job.images, job.size, job.real_fft, job.cache_dir, job.color)
+    mixer = Mixer(images, job.region, mask_type=job.mask_type, softness=job.softness)
+    if job.mode == 0:
+        return mixer.mix_mag_phase(job.weights)
+    return mixer.mix_real_imaginary(job.weights)
+
+
+def run_job(job: MixJob):
+    """
+    Load, mix and save a single job
+    :return: the number of output pixels
+    """
+    if isinstance(job, InvalidJob):
+        raise ValueError(job.error)
+    result = mix_job(job)
+    output_dir = os.path.dirname(job.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    result.save(job.output)
+    return result.size[0] * result.size[1]
+
+
+def _run_serial(jobs):
+    for job in jobs:
+        try:
+            yield job, run_job(job), None
+        except Exception as e:
+            yield job, None, str(e)
+
+
+def _init_worker(fft_backend, precision, memory_budget, metrics_path, quiet, fft_threads=None):
+    """
+    :param fft_threads: threads per FFT, 1 in pool workers so the processes don't oversubscribe the CPUs
+    """
+    if quiet:
+        set_quiet()
+    if fft_backend is not None or precision is not None or fft_threads is not None:
+        current = FFTBackend.get_backend()
+        FFTBackend.set_backend(fft_backend or current.name, precision or current.precision, fft_threads)
+    if memory_budget is not None:
+        set_memory_budget(memory_budget)
+    if metrics_path is not None:
+        get_instrumentation().add_sink(JsonLinesSink(metrics_path))
+
+
+def run_batch(jobs, report_every=100, workers=1, chunk_size=1, fft_backend=None, precision=None,
+              memory_budget=None, metrics_path=None, quiet=False):
+    """
+    Run the jobs, streaming each result to disk as soon as it is mixed
+    :param jobs: an iterable of MixJob
+    :param report_every: log the throughput every that many jobs
+    :param workers: number of worker processes, 1 runs everything in this process
+    :param chunk_size: number of jobs handed to a worker process at once
+    :param fft_backend: name of the FFT backend to use (see FFTBackend), None keeps the current one
+    :param precision: "double" or "single" (float32/complex64 end to end), None keeps the current precision
+    :param memory_budget: bytes each process may keep resident while mixing, None keeps the current budget
+    :param metrics_path: append the stage timings of every load, FFT and mix to this JSON Lines file
+    :param quiet: log only warnings and errors, the throughput reports included
+    :return: a dict with the throughput statistics of the run
+    """
+    _init_worker(fft_backend, precision, memory_budget, metrics_path, quiet)
+    if workers == 1:
+        results = _run_serial(jobs)
+    else:
+        executor = MixingExecutor(run_job, workers, chunk_size, initializer=_init_worker,
+                                  initargs=(fft_backend, precision, memory_budget, metrics_path, quiet, 1))
+        results = executor.map(jobs)
+
+    start = time.perf_counter()
+    completed = 0
+    failed = 0
+    pixels = 0
+    for job, job_pixels, error in results:
+        if error is None:
+            pixels += job_pixels
+            completed += 1
+        else:
+            failed += 1
+            logger.error(f"Job {job.index} failed: {error}")
+        if report_every and (completed + failed) % report_every == 0:
+            elapsed = time.perf_counter() - start
+            logger.info(f"{completed + failed} jobs done in {elapsed:.1f}s ({(completed + failed) / elapsed:.1f} jobs/s)")
+    elapsed = time.perf_counter() - start
+    stats = {
+        "workers": workers or os.cpu_count(),
+        "fft_backend": FFTBackend.get_backend().name,
+        "precision": FFTBackend.get_backend().precision,
+        "completed": completed,
+        "failed": failed,
+        "seconds": elapsed,
+        "jobs_per_second": completed / elapsed if elapsed else 0.0,
+        "megapixels_per_second": pixels / 1e6 / elapsed if elapsed else 0.0,
+    }
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mix batches of images without the GUI")
+    parser.add_argument("manifest", help="JSON or JSON Lines (.jsonl) file describing the jobs")
+    parser.add_argument("--output-dir", default=".", help="directory for jobs that don't set an output path")
+    parser.add_argument("--report-every", type=int, default=100, help="log the throughput every N jobs")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of worker processes, 0 uses one per CPU (default: 1, no pool)")
+    parser.add_argument("--chunk-size", type=int, default=1, help="jobs handed to a worker process at once")
+    parser.add_argument("--real-fft", action="store_true",
+                        help="use half spectra (rfft2/irfft2) for jobs that don't set real_fft themselves")
+    parser.add_argument("--fft-backend", choices=list(FFTBackend.BACKENDS), default=None,
+                        help="FFT implementation, falls back to numpy when not installed")
+    parser.add_argument("--precision", choices=list(FFTBackend.PRECISIONS), default=None,
+                        help="single keeps spectra and mixing in float32/complex64, halving memory "
+                             "(default: $IMAGE_MIXER_FFT_PRECISION or double)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="reuse decoded pixels and spectra stored in this directory across runs")
+    parser.add_argument("--large", action="store_true",
+                        help="memory-map the images of jobs that don't set large themselves and mix them in tiles")
+    parser.add_argument("--color", action="store_true",
+                        help="mix the RGB channels of the images of jobs that don't set color themselves")
+    parser.add_argument("--memory-budget", type=parse_bytes, default=None,
+                        help="bytes each process may keep resident while mixing, e.g. 512M or 4G "
+                             "(default: $IMAGE_MIXER_MEMORY_BUDGET or 2G)")
+    parser.add_argument("--metrics", default=None,
+                        help="append per-stage timings, bytes and FFT sizes of every load and mix to this .jsonl file")
+    parser.add_argument("--quiet", action="store_true", help="log only warnings and errors")
+    args = parser.parse_args(argv)
+
+    jobs = read_manifest(args.manifest, args.output_dir, args.real_fft, args.cache_dir, args.large, args.color)
+    stats = run_batch(jobs, args.report_every, args.workers or None, args.chunk_size, args.fft_backend, args.precision,
+                      args.memory_budget, args.metrics, args.quiet)
+    print(json.dumps(stats))
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
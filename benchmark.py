@@ -0,0 +1,263 @@
+"""
+Benchmarks of the load, FFT, edit, mix and render hot paths, no Qt involved.
+
+Every benchmark is swept over image sizes and inputs (the sample Images/ and synthetic noise/gradient images),
+the mixing benchmarks also over image counts and regions. Each case is run --repeat times on fresh objects, so
+no cache carries over between runs, plus once under tracemalloc for its peak memory.
+
+The results are printed (or written with --output) as JSON:
+
+    {"meta": {"commit": ..., "fft_backend": ..., ...},
+     "results": [{"benchmark": "mix_mag_phase", "input": "sample", "size": 512, "count": 4, "region": "inside",
+                  "seconds": {"min": ..., "median": ..., "mean": ...}, "peak_bytes": ...}, ...]}
+
+and can be compared against an earlier run with --compare, which exits with 1 when a case got slower than
+--threshold times its baseline median.
+
+Usage:
+    python benchmark.py --output bench.json
+    python benchmark.py --sizes 256 1024 --counts 2 4 --compare bench.json
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from PIL import Image as PILImage
+
+import FFTBackend
+from Image import Image
+from Mixer import Mixer
+from logger_config import setup_logger
+from precision_report import DEFAULT_REGIONS, scale_region
+
+logger = setup_logger(__name__)
+
+SAMPLE_IMAGES = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Images", "*")))
+INPUTS = ("sample", "synthetic")
+# weight sets evaluated by the sweep benchmark, its time is for all of them
+SWEEP_SIZE = 64
+
+
+def synthetic_images(directory, size, count):
+    """
+    Write count synthetic size x size PNGs, alternating white noise and smooth gradients with a few edges
+    :return: their paths
+    """
+    rng = np.random.default_rng(size)
+    y, x = np.mgrid[0:size, 0:size] / size
+    paths = []
+    for i in range(count):
+        if i % 2 == 0:
+            data = rng.integers(0, 256, (size, size), dtype=np.uint8)
+        else:
+            data = (np.sin(2 * np.pi * (i + 1) * x) * np.cos(2 * np.pi * y) * 100 + 127).astype(np.uint8)
+            data[size // 4:size // 2, size // 4:size // 2] = 255
+        path = os.path.join(directory, f"synthetic_{size}_{i}.png")
+        if not os.path.exists(path):
+            PILImage.fromarray(data).save(path)
+        paths.append(path)
+    return paths
+
+
+class Inputs:
+    """Image files of each input kind, synthetic ones are generated once per size in a temporary directory"""
+
+    def __init__(self):
+        self.directory = tempfile.TemporaryDirectory(prefix="image_mixer_bench_")
+
+    def paths(self, kind, size, count):
+        if kind == "sample":
+            return [SAMPLE_IMAGES[i % len(SAMPLE_IMAGES)] for i in range(count)]
+        return synthetic_images(self.directory.name, size, count)
+
+    def images(self, kind, size, count, real_fft):
+        """Images resized to size x size with their spectra already computed"""
+        images = [Image.from_file(path, real_fft, (size, size)) for path in self.paths(kind, size, count)]
+        for image in images:
+            image.stored_ft
+        return images
+
+
+def measure(run, setup, repeat):
+    """
+    Time run(setup()) repeat times, then once more under tracemalloc
+    :return: (list of seconds, peak traced bytes)
+    """
+    times = []
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+    state = setup()
+    tracemalloc.start()
+    try:
+        run(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return times, peak
+
+
+def spectrum_of(image):
+    return image.stored_ft, image.size
+
+
+def cases(inputs, sizes, counts, kinds, real_fft):
+    """
+    Yield (benchmark name, parameters, setup, run) for every case of the sweep
+    """
+    weights_of = {count: [(1 + i, count - i) for i in range(count)] for count in counts}
+    # weight sets of the sweep benchmark, the ones of the single mixes with the real weights shifted
+    sweeps_of = {count: [[(1 + i + step, count - i) for i in range(count)] for step in range(SWEEP_SIZE)]
+                 for count in counts}
+    for kind in kinds:
+        for size in sizes:
+            params = {"input": kind, "size": size}
+            path = inputs.paths(kind, size, 1)[0]
+            yield "from_file", params, lambda path=path: path, \
+                lambda path, size=size: Image.from_file(path, real_fft, (size, size))
+            fresh = lambda kind=kind, size=size: inputs.images(kind, size, 1, real_fft)[0]
+            yield "resize", params, fresh, lambda image, size=size: image.resize((size * 3 // 4, size * 3 // 4))
+            yield "brightness_contrast", {**params, "edit": "brightness"}, fresh, \
+                lambda image: image.changeBrightnessContrast(20, 1)
+            yield "brightness_contrast", {**params, "edit": "contrast"}, fresh, \
+                lambda image: image.changeBrightnessContrast(20, 1.5)
+            for component in Image.ft_components:
+                yield "get_ft_image", {**params, "component": component}, fresh, \
+                    lambda image, component=component: image.get_ft_image(component)
+            spectrum = lambda fresh=fresh: spectrum_of(fresh())
+            if real_fft:
+                yield "from_foureir_domain", params, spectrum, \
+                    lambda state: Image.from_foureir_domain(state[0], real_shape=state[1])
+            else:
+                yield "from_foureir_domain", params, spectrum, \
+                    lambda state: Image.from_foureir_domain(np.fft.ifftshift(state[0]))
+            for count in counts:
+                images = lambda kind=kind, size=size, count=count: inputs.images(kind, size, count, real_fft)
+                for region_name, region in DEFAULT_REGIONS.items():
+                    mix_params = {**params, "count": count, "region": region_name}
+                    region = scale_region(region, (size, size))
+                    weights = weights_of[count]
+                    yield "mix_mag_phase", mix_params, images, \
+                        lambda images, region=region, weights=weights: Mixer(images, region).mix_mag_phase(weights)
+                    yield "mix_real_imaginary", mix_params, images, \
+                        lambda images, region=region, weights=weights: Mixer(images, region).mix_real_imaginary(weights)
+                    yield "sweep_real_imaginary", {**mix_params, "weight_sets": SWEEP_SIZE}, images, \
+                        lambda images, region=region, sweep=sweeps_of[count]: \
+                        Mixer(images, region).sweep_real_imaginary(sweep)
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes=(128, 256, 512, 1024), counts=(2, 4), kinds=INPUTS, repeat=5, real_fft=False,
+                   only=None):
+    """
+    :param sizes: side lengths of the square images
+    :param counts: numbers of images mixed together
+    :param kinds: inputs to sweep, "sample" and/or "synthetic"
+    :param repeat: timed runs per case
+    :param only: names of the benchmarks to run, None for all of them
+    :return: a dict with the run's metadata and one result per case
+    """
+    fft = FFTBackend.get_backend()
+    meta = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "fft_backend": fft.name,
+        "precision": fft.precision,
+        "real_fft": real_fft,
+        "repeat": repeat,
+    }
+    inputs = Inputs()
+    results = []
+    try:
+        for name, params, setup, run in cases(inputs, sizes, counts, kinds, real_fft):
+            if only and name not in only:
+                continue
+            times, peak = measure(run, setup, repeat)
+            result = {"benchmark": name, **params,
+                      "seconds": {"min": min(times), "median": statistics.median(times), "mean": statistics.mean(times)},
+                      "peak_bytes": peak}
+            logger.info(f"{name} {params}: {result['seconds']['median'] * 1000:.2f} ms, peak {peak / 1e6:.1f} MB")
+            results.append(result)
+    finally:
+        inputs.directory.cleanup()
+    return {"meta": meta, "results": results}
+
+
+def case_key(result):
+    return tuple(sorted((key, value) for key, value in result.items() if key not in ("seconds", "peak_bytes")))
+
+
+def compare(report, baseline, threshold=1.2):
+    """
+    :return: list of (case, baseline median, median) of the cases more than threshold times slower than baseline
+    """
+    baseline_results = {case_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        old = baseline_results.get(case_key(result))
+        if old is None:
+            continue
+        old_median, median = old["seconds"]["median"], result["seconds"]["median"]
+        if median > threshold * old_median:
+            regressions.append((dict(case_key(result)), old_median, median))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the load, FFT, edit, mix and render hot paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[128, 256, 512, 1024], help="image side lengths")
+    parser.add_argument("--counts", type=int, nargs="+", default=[2, 4], help="numbers of images mixed together")
+    parser.add_argument("--inputs", nargs="+", choices=INPUTS, default=list(INPUTS), help="input images to sweep")
+    parser.add_argument("--only", nargs="+", default=None, help="run only these benchmarks")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    parser.add_argument("--real-fft", action="store_true", help="store and mix the rfft2 half spectra")
+    parser.add_argument("--fft-backend", choices=list(FFTBackend.BACKENDS), default=None,
+                        help="FFT implementation, falls back to numpy when not installed")
+    parser.add_argument("--precision", choices=list(FFTBackend.PRECISIONS), default=None, help="FFT precision")
+    parser.add_argument("--output", default=None, help="write the JSON results here instead of printing them")
+    parser.add_argument("--compare", default=None, help="JSON results of an earlier run to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="a case regressed when its median time exceeds this factor of the baseline's")
+    args = parser.parse_args(argv)
+
+    if args.fft_backend is not None or args.precision is not None:
+        FFTBackend.set_backend(args.fft_backend or FFTBackend.get_backend().name, args.precision or "double")
+    report = run_benchmarks(args.sizes, args.counts, args.inputs, args.repeat, args.real_fft, args.only)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(report, json.load(file), args.threshold)
+        for case, old_median, median in regressions:
+            logger.warning(f"Regression in {case}: {old_median * 1000:.2f} ms -> {median * 1000:.2f} ms")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,31 @@
+"""
+Precompile UI/main_window.ui into main_window_ui.py, so the application starts without parsing the .ui file.
+
+The generated module records a hash of the .ui file it was built from; ImageMixerApp falls back to loading the
+.ui file at runtime when they don't match. Run this after every change to UI/main_window.ui:
+
+    python compile_ui.py
+"""
+import hashlib
+import subprocess
+import sys
+
+UI_FILE = "UI/main_window.ui"
+UI_MODULE = "main_window_ui.py"
+
+
+def ui_source_hash(ui_file=UI_FILE):
+    with open(ui_file, "rb") as file:
+        return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+
+
+def compile_ui(ui_file=UI_FILE, ui_module=UI_MODULE):
+    subprocess.run(["pyside6-uic", ui_file, "-o", ui_module], check=True)
+    with open(ui_module, "a") as file:
+        file.write(f"\n\n# hash of the {ui_file} this module was generated from, see compile_ui.py\n")
+        file.write(f"UI_SOURCE_HASH = \"{ui_source_hash(ui_file)}\"\n")
+
+
+if __name__ == '__main__':
+    compile_ui()
+    sys.exit(0)
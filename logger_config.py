@@ -1,36 +1,105 @@
+import atexit
 import logging
-from datetime import datetime
 import os
+import queue
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
+# Records are only put on a queue by the logging call, a single listener thread per process formats them and
+# writes them to one shared log file and the console, so no log I/O happens on the caller's thread.
+#
+# IMAGE_MIXER_QUIET=1 (or set_quiet()) keeps only warnings and errors: debug and info calls then return right
+# away, before their arguments are formatted. Use %-style arguments and lazy()/array_range() for anything costly:
+#
+#     logger.debug("Range before change: %s", array_range(self.modified_image_data))
 
-def setup_logger(name, log_dir='logs/', level=logging.DEBUG):
-    """Setup a logger for a specific module or class."""
-    # create log_dir if it doesn't exist
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+QUIET_LEVEL = logging.WARNING
 
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    current_time = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-    log_file = f"{log_dir}ImageMixer_{current_time}.log"
+_loggers = []
+_queue = None
+_handler = None
+_listener = None
+_listener_pid = None
+_log_file = None
+_quiet = os.environ.get("IMAGE_MIXER_QUIET", "").lower() in ("1", "true", "yes")
 
-    # Create handlers
-    file_handler = logging.FileHandler(log_file)
-    console_handler = logging.StreamHandler()
 
-    # Set handler levels
-    file_handler.setLevel(level)
-    console_handler.setLevel(logging.INFO)
+class lazy:
+    """Defers function(*args) until the log record is actually formatted"""
+
+    def __init__(self, function, *args):
+        self.function = function
+        self.args = args
+
+    def __str__(self):
+        return str(self.function(*self.args))
+
+
+def array_range(array):
+    """Lazy "min..max" of an array, the reductions only run when the record is emitted"""
+    return lazy(lambda: f"{array.min()}..{array.max()}")
+
+
+class _ProcessQueueHandler(QueueHandler):
+    def enqueue(self, record):
+        # worker processes forked from a logging process inherit the handler but not the listener thread
+        if _listener_pid != os.getpid():
+            _start_listener()
+        self.queue.put_nowait(record)
 
-    # Create formatter and add it to the handlers
+
+def _start_listener():
+    global _listener, _listener_pid
+    _handler.queue = queue.SimpleQueue()
+    file_handler = logging.FileHandler(_log_file)
+    file_handler.setLevel(logging.DEBUG)
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
+    _listener = QueueListener(_handler.queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    if _listener_pid is not None:
+        # forked workers skip atexit, multiprocessing runs its finalizers instead
+        from multiprocessing.util import Finalize
+        Finalize(None, _stop_listener, exitpriority=0)
+    _listener_pid = os.getpid()
+
+
+def _stop_listener():
+    if _listener is not None and _listener_pid == os.getpid():
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+
 
-    # Add handlers to the logger
+def set_quiet(quiet=True):
+    """Keep only warnings and errors, for production runs where logging must stay out of the interactive loop"""
+    global _quiet
+    _quiet = quiet
+    for logger in _loggers:
+        logger.setLevel(QUIET_LEVEL if quiet else logger.requested_level)
+
+
+def setup_logger(name, log_dir='logs/', level=logging.DEBUG):
+    """Setup a logger for a specific module or class."""
+    global _handler, _log_file
+    if _handler is None:
+        # create log_dir if it doesn't exist
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir)
+        current_time = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        _log_file = f"{log_dir}ImageMixer_{current_time}.log"
+        _handler = _ProcessQueueHandler(queue.SimpleQueue())
+        _start_listener()
+        atexit.register(_stop_listener)
+
+    logger = logging.getLogger(name)
+    logger.requested_level = level
+    logger.setLevel(QUIET_LEVEL if _quiet else level)
     if not logger.hasHandlers():  # Prevent adding handlers multiple times
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        logger.addHandler(_handler)
+        _loggers.append(logger)
 
     return logger
@@ -1,8 +1,24 @@
+import time
+
+started_at = time.perf_counter()
+
+import json
 import sys
 from PySide6.QtWidgets import QApplication
 from ImageMixerApp import ImageMixerApp
+from logger_config import set_quiet
 
 if __name__ == '__main__':
+    if "--quiet" in sys.argv:
+        # only warnings and errors, nothing is formatted or written while dragging and mixing
+        sys.argv.remove("--quiet")
+        set_quiet()
+    # print the startup timings as JSON and exit once the window is interactive
+    measure_startup = "--startup-time" in sys.argv
+    if measure_startup:
+        sys.argv.remove("--startup-time")
     app = QApplication(sys.argv)
-    window = ImageMixerApp()
+    window = ImageMixerApp(started_at)
+    if measure_startup:
+        window.ready.connect(lambda seconds: (print(json.dumps(window.startup.to_dict())), app.quit()))
     sys.exit(app.exec())
@@ -0,0 +1,2600 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'main_window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QFrame,
+    QGridLayout, QHBoxLayout, QLabel, QLayout,
+    QMainWindow, QMenuBar, QProgressBar, QPushButton,
+    QSizePolicy, QSlider, QStatusBar, QVBoxLayout,
+    QWidget)
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(1305, 884)
+        MainWindow.setMinimumSize(QSize(1080, 720))
+        MainWindow.setStyleSheet(u"/* ---------------------------------------------------------------------------\n"
+"\n"
+"    WARNING! File created programmatically. All changes made in this file will be lost!\n"
+"\n"
+"    Created by the qtsass compiler v0.4.0\n"
+"\n"
+"    The definitions are in the \"qdarkstyle.qss._styles.scss\" module\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"/* Light Style - QDarkStyleSheet ------------------------------------------ */\n"
+"/*\n"
+"\n"
+"See Qt documentation:\n"
+"\n"
+"  - https://doc.qt.io/qt-5/stylesheet.html\n"
+"  - https://doc.qt.io/qt-5/stylesheet-reference.html\n"
+"  - https://doc.qt.io/qt-5/stylesheet-examples.html\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"/* Reset elements ------------------------------------------------------------\n"
+"\n"
+"Resetting everything helps to unify styles across different operating systems\n"
+"\n"
+"--------------------------------------------------------------------------- */"
+                        "\n"
+"* {\n"
+"  padding: 0px;\n"
+"  margin: 0px;\n"
+"  border: 0px;\n"
+"  border-style: none;\n"
+"  border-image: none;\n"
+"  outline: 0;\n"
+"}\n"
+"\n"
+"/* specific reset for elements inside QToolBar */\n"
+"QToolBar * {\n"
+"  margin: 0px;\n"
+"  padding: 0px;\n"
+"}\n"
+"\n"
+"/* QWidget ----------------------------------------------------------------\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QWidget {\n"
+"  background-color: #19232D;\n"
+"  border: 0px solid #455364;\n"
+"  padding: 0px;\n"
+"  color: #DFE1E2;\n"
+"  selection-background-color: #346792;\n"
+"  selection-color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QWidget:disabled {\n"
+"  background-color: #19232D;\n"
+"  color: #788D9C;\n"
+"  selection-background-color: #26486B;\n"
+"  selection-color: #788D9C;\n"
+"}\n"
+"\n"
+"QWidget::item:selected {\n"
+"  background-color: #346792;\n"
+"}\n"
+"\n"
+"QWidget::item:hover:!selected {\n"
+"  background-color: #1A72BB;\n"
+"}\n"
+"\n"
+"/* QMainWindow --------------------------------------------"
+                        "----------------\n"
+"\n"
+"This adjusts the splitter in the dock widget, not qsplitter\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qmainwindow\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QMainWindow::separator {\n"
+"  background-color: #455364;\n"
+"  border: 0px solid #19232D;\n"
+"  spacing: 0px;\n"
+"  padding: 2px;\n"
+"}\n"
+"\n"
+"QMainWindow::separator:hover {\n"
+"  background-color: #60798B;\n"
+"  border: 0px solid #1A72BB;\n"
+"}\n"
+"\n"
+"QMainWindow::separator:horizontal {\n"
+"  width: 5px;\n"
+"  margin-top: 2px;\n"
+"  margin-bottom: 2px;\n"
+"  image: url(\":/qss_icons/dark/rc/toolbar_separator_vertical.png\");\n"
+"}\n"
+"\n"
+"QMainWindow::separator:vertical {\n"
+"  height: 5px;\n"
+"  margin-left: 2px;\n"
+"  margin-right: 2px;\n"
+"  image: url(\":/qss_icons/dark/rc/toolbar_separator_horizontal.png\");\n"
+"}\n"
+"\n"
+"/* QToolTip ---------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples."
+                        "html#customizing-qtooltip\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QToolTip {\n"
+"  background-color: #346792;\n"
+"  color: #DFE1E2;\n"
+"  /* If you remove the border property, background stops working on Windows */\n"
+"  border: none;\n"
+"  /* Remove padding, for fix combo box tooltip */\n"
+"  padding: 0px;\n"
+"  /* Remove opacity, fix #174 - may need to use RGBA */\n"
+"}\n"
+"\n"
+"/* QStatusBar -------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qstatusbar\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QStatusBar {\n"
+"  border: 1px solid #455364;\n"
+"  /* Fixes Spyder #9120, #9121 */\n"
+"  background: #455364;\n"
+"  /* Fixes #205, white vertical borders separating items */\n"
+"}\n"
+"\n"
+"QStatusBar::item {\n"
+"  border: none;\n"
+"}\n"
+"\n"
+"QStatusBar QToolTip {\n"
+"  background-color: #1A72BB;\n"
+"  border: 1px solid #19232D;\n"
+"  col"
+                        "or: #19232D;\n"
+"  /* Remove padding, for fix combo box tooltip */\n"
+"  padding: 0px;\n"
+"  /* Reducing transparency to read better */\n"
+"  opacity: 230;\n"
+"}\n"
+"\n"
+"QStatusBar QLabel {\n"
+"  /* Fixes Spyder #9120, #9121 */\n"
+"  background: transparent;\n"
+"}\n"
+"\n"
+"/* QCheckBox --------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qcheckbox\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QCheckBox {\n"
+"  background-color: #19232D;\n"
+"  color: #DFE1E2;\n"
+"  spacing: 4px;\n"
+"  outline: none;\n"
+"  padding-top: 4px;\n"
+"  padding-bottom: 4px;\n"
+"}\n"
+"\n"
+"QCheckBox:focus {\n"
+"  border: none;\n"
+"}\n"
+"\n"
+"QCheckBox QWidget:disabled {\n"
+"  background-color: #19232D;\n"
+"  color: #788D9C;\n"
+"}\n"
+"\n"
+"QCheckBox::indicator {\n"
+"  margin-left: 2px;\n"
+"  height: 14px;\n"
+"  width: 14px;\n"
+"}\n"
+"\n"
+"\n"
+"/* QGroupBox ----------------------------------------------------------"
+                        "----\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qgroupbox\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QGroupBox {\n"
+"  font-weight: bold;\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 4px;\n"
+"  padding: 2px;\n"
+"  margin-top: 6px;\n"
+"  margin-bottom: 4px;\n"
+"}\n"
+"\n"
+"QGroupBox::title {\n"
+"  subcontrol-origin: margin;\n"
+"  subcontrol-position: top left;\n"
+"  left: 4px;\n"
+"  padding-left: 2px;\n"
+"  padding-right: 4px;\n"
+"  padding-top: -4px;\n"
+"}\n"
+"\n"
+"QGroupBox::indicator {\n"
+"  margin-left: 2px;\n"
+"  margin-top: 2px;\n"
+"  padding: 0;\n"
+"  height: 14px;\n"
+"  width: 14px;\n"
+"}\n"
+"\n"
+"QGroupBox::indicator:unchecked {\n"
+"  border: none;\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_unchecked.png\");\n"
+"}\n"
+"\n"
+"QGroupBox::indicator:unchecked:hover, QGroupBox::indicator:unchecked:focus, QGroupBox::indicator:unchecked:pressed {\n"
+"  border: none;\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_unchecked_f"
+                        "ocus.png\");\n"
+"}\n"
+"\n"
+"QGroupBox::indicator:unchecked:disabled {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_unchecked_disabled.png\");\n"
+"}\n"
+"\n"
+"QGroupBox::indicator:checked {\n"
+"  border: none;\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_checked.png\");\n"
+"}\n"
+"\n"
+"QGroupBox::indicator:checked:hover, QGroupBox::indicator:checked:focus, QGroupBox::indicator:checked:pressed {\n"
+"  border: none;\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_checked_focus.png\");\n"
+"}\n"
+"\n"
+"QGroupBox::indicator:checked:disabled {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_checked_disabled.png\");\n"
+"}\n"
+"\n"
+"/* QRadioButton -----------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qradiobutton\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QRadioButton {\n"
+"  background-color: #19232D;\n"
+"  color: #DFE1E2;\n"
+"  spacing: 4px;\n"
+"  padding-top: 4px;\n"
+"  padding-bottom: 4px;\n"
+""
+                        "  border: none;\n"
+"  outline: none;\n"
+"}\n"
+"\n"
+"QRadioButton:focus {\n"
+"  border: none;\n"
+"}\n"
+"\n"
+"QRadioButton:disabled {\n"
+"  background-color: #19232D;\n"
+"  color: #788D9C;\n"
+"  border: none;\n"
+"  outline: none;\n"
+"}\n"
+"\n"
+"QRadioButton QWidget {\n"
+"  background-color: #19232D;\n"
+"  color: #DFE1E2;\n"
+"  spacing: 0px;\n"
+"  padding: 0px;\n"
+"  outline: none;\n"
+"  border: none;\n"
+"}\n"
+"\n"
+"QRadioButton::indicator {\n"
+"  border: none;\n"
+"  outline: none;\n"
+"  margin-left: 2px;\n"
+"  height: 14px;\n"
+"  width: 14px;\n"
+"}\n"
+"\n"
+"QRadioButton::indicator:unchecked {\n"
+"  image: url(\":/qss_icons/dark/rc/radio_unchecked.png\");\n"
+"}\n"
+"\n"
+"QRadioButton::indicator:unchecked:hover, QRadioButton::indicator:unchecked:focus, QRadioButton::indicator:unchecked:pressed {\n"
+"  border: none;\n"
+"  outline: none;\n"
+"  image: url(\":/qss_icons/dark/rc/radio_unchecked_focus.png\");\n"
+"}\n"
+"\n"
+"QRadioButton::indicator:unchecked:disabled {\n"
+"  image: url(\":/qss_icons/dark/rc/radio_unchecke"
+                        "d_disabled.png\");\n"
+"}\n"
+"\n"
+"QRadioButton::indicator:checked {\n"
+"  border: none;\n"
+"  outline: none;\n"
+"  image: url(\":/qss_icons/dark/rc/radio_checked.png\");\n"
+"}\n"
+"\n"
+"QRadioButton::indicator:checked:hover, QRadioButton::indicator:checked:focus, QRadioButton::indicator:checked:pressed {\n"
+"  border: none;\n"
+"  outline: none;\n"
+"  image: url(\":/qss_icons/dark/rc/radio_checked_focus.png\");\n"
+"}\n"
+"\n"
+"QRadioButton::indicator:checked:disabled {\n"
+"  outline: none;\n"
+"  image: url(\":/qss_icons/dark/rc/radio_checked_disabled.png\");\n"
+"}\n"
+"\n"
+"/* QMenuBar ---------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qmenubar\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QMenuBar {\n"
+"  background-color: #455364;\n"
+"  padding: 2px;\n"
+"  border: 1px solid #19232D;\n"
+"  color: #DFE1E2;\n"
+"  selection-background-color: #1A72BB;\n"
+"}\n"
+"\n"
+"QMenuBar:focus {\n"
+"  bo"
+                        "rder: 1px solid #346792;\n"
+"}\n"
+"\n"
+"QMenuBar::item {\n"
+"  background: transparent;\n"
+"  padding: 4px;\n"
+"}\n"
+"\n"
+"QMenuBar::item:selected {\n"
+"  padding: 4px;\n"
+"  background: transparent;\n"
+"  border: 0px solid #455364;\n"
+"  background-color: #1A72BB;\n"
+"}\n"
+"\n"
+"QMenuBar::item:pressed {\n"
+"  padding: 4px;\n"
+"  border: 0px solid #455364;\n"
+"  background-color: #1A72BB;\n"
+"  color: #DFE1E2;\n"
+"  margin-bottom: 0px;\n"
+"  padding-bottom: 0px;\n"
+"}\n"
+"\n"
+"/* QMenu ------------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qmenu\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QMenu {\n"
+"  border: 0px solid #455364;\n"
+"  color: #DFE1E2;\n"
+"  margin: 0px;\n"
+"  background-color: #37414F;\n"
+"  selection-background-color: #1A72BB;\n"
+"}\n"
+"\n"
+"QMenu::separator {\n"
+"  height: 1px;\n"
+"  background-color: #60798B;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QMenu::item {\n"
+" "
+                        " background-color: #37414F;\n"
+"  padding: 4px 24px 4px 28px;\n"
+"  /* Reserve space for selection border */\n"
+"  border: 1px transparent #455364;\n"
+"}\n"
+"\n"
+"QMenu::item:selected {\n"
+"  color: #DFE1E2;\n"
+"  background-color: #1A72BB;\n"
+"}\n"
+"\n"
+"QMenu::item:pressed {\n"
+"  background-color: #1A72BB;\n"
+"}\n"
+"\n"
+"QMenu::icon {\n"
+"  padding-left: 10px;\n"
+"  width: 14px;\n"
+"  height: 14px;\n"
+"}\n"
+"\n"
+"QMenu::indicator {\n"
+"  padding-left: 8px;\n"
+"  width: 12px;\n"
+"  height: 12px;\n"
+"  /* non-exclusive indicator = check box style indicator (see QActionGroup::setExclusive) */\n"
+"  /* exclusive indicator = radio button style indicator (see QActionGroup::setExclusive) */\n"
+"}\n"
+"\n"
+"QMenu::indicator:non-exclusive:unchecked {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_unchecked.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:non-exclusive:unchecked:hover, QMenu::indicator:non-exclusive:unchecked:focus, QMenu::indicator:non-exclusive:unchecked:pressed {\n"
+"  border: none;\n"
+"  image: url(\":/qs"
+                        "s_icons/dark/rc/checkbox_unchecked_focus.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:non-exclusive:unchecked:disabled {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_unchecked_disabled.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:non-exclusive:checked {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_checked.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:non-exclusive:checked:hover, QMenu::indicator:non-exclusive:checked:focus, QMenu::indicator:non-exclusive:checked:pressed {\n"
+"  border: none;\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_checked_focus.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:non-exclusive:checked:disabled {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_checked_disabled.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:non-exclusive:indeterminate {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_indeterminate.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:non-exclusive:indeterminate:disabled {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_indeterminate_disabled.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:non-exclusive:in"
+                        "determinate:focus, QMenu::indicator:non-exclusive:indeterminate:hover, QMenu::indicator:non-exclusive:indeterminate:pressed {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_indeterminate_focus.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:exclusive:unchecked {\n"
+"  image: url(\":/qss_icons/dark/rc/radio_unchecked.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:exclusive:unchecked:hover, QMenu::indicator:exclusive:unchecked:focus, QMenu::indicator:exclusive:unchecked:pressed {\n"
+"  border: none;\n"
+"  outline: none;\n"
+"  image: url(\":/qss_icons/dark/rc/radio_unchecked_focus.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:exclusive:unchecked:disabled {\n"
+"  image: url(\":/qss_icons/dark/rc/radio_unchecked_disabled.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:exclusive:checked {\n"
+"  border: none;\n"
+"  outline: none;\n"
+"  image: url(\":/qss_icons/dark/rc/radio_checked.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:exclusive:checked:hover, QMenu::indicator:exclusive:checked:focus, QMenu::indicator:exclusive:checked:pressed {\n"
+"  border:"
+                        " none;\n"
+"  outline: none;\n"
+"  image: url(\":/qss_icons/dark/rc/radio_checked_focus.png\");\n"
+"}\n"
+"\n"
+"QMenu::indicator:exclusive:checked:disabled {\n"
+"  outline: none;\n"
+"  image: url(\":/qss_icons/dark/rc/radio_checked_disabled.png\");\n"
+"}\n"
+"\n"
+"QMenu::right-arrow {\n"
+"  margin: 5px;\n"
+"  padding-left: 12px;\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_right.png\");\n"
+"  height: 12px;\n"
+"  width: 12px;\n"
+"}\n"
+"\n"
+"/* QAbstractItemView ------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qcombobox\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QAbstractItemView {\n"
+"  alternate-background-color: #19232D;\n"
+"  color: #DFE1E2;\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QAbstractItemView QLineEdit {\n"
+"  padding: 2px;\n"
+"}\n"
+"\n"
+"/* QAbstractScrollArea ----------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/style"
+                        "sheet-examples.html#customizing-qabstractscrollarea\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QAbstractScrollArea {\n"
+"  background-color: #19232D;\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 4px;\n"
+"  /* fix #159 */\n"
+"  padding: 2px;\n"
+"  /* remove min-height to fix #244 */\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QAbstractScrollArea:disabled {\n"
+"  color: #788D9C;\n"
+"}\n"
+"\n"
+"/* QScrollArea ------------------------------------------------------------\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QScrollArea QWidget QWidget:disabled {\n"
+"  background-color: #19232D;\n"
+"}\n"
+"\n"
+"/* QScrollBar -------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qscrollbar\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QScrollBar:horizontal {\n"
+"  height: 16px;\n"
+"  margin: 2px 16px 2px 16px;"
+                        "\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 4px;\n"
+"  background-color: #19232D;\n"
+"}\n"
+"\n"
+"QScrollBar:vertical {\n"
+"  background-color: #19232D;\n"
+"  width: 16px;\n"
+"  margin: 16px 2px 16px 2px;\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:horizontal {\n"
+"  background-color: #60798B;\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 4px;\n"
+"  min-width: 8px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:horizontal:hover {\n"
+"  background-color: #346792;\n"
+"  border: #346792;\n"
+"  border-radius: 4px;\n"
+"  min-width: 8px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:horizontal:focus {\n"
+"  border: 1px solid #1A72BB;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:vertical {\n"
+"  background-color: #60798B;\n"
+"  border: 1px solid #455364;\n"
+"  min-height: 8px;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:vertical:hover {\n"
+"  background-color: #346792;\n"
+"  border: #346792;\n"
+"  border-radius: 4px;\n"
+"  min-height: 8px;\n"
+"}\n"
+"\n"
+"QScrollBar::hand"
+                        "le:vertical:focus {\n"
+"  border: 1px solid #1A72BB;\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:horizontal {\n"
+"  margin: 0px 0px 0px 0px;\n"
+"  border-image: url(\":/qss_icons/dark/rc/arrow_right_disabled.png\");\n"
+"  height: 12px;\n"
+"  width: 12px;\n"
+"  subcontrol-position: right;\n"
+"  subcontrol-origin: margin;\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:horizontal:hover, QScrollBar::add-line:horizontal:on {\n"
+"  border-image: url(\":/qss_icons/dark/rc/arrow_right.png\");\n"
+"  height: 12px;\n"
+"  width: 12px;\n"
+"  subcontrol-position: right;\n"
+"  subcontrol-origin: margin;\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:vertical {\n"
+"  margin: 3px 0px 3px 0px;\n"
+"  border-image: url(\":/qss_icons/dark/rc/arrow_down_disabled.png\");\n"
+"  height: 12px;\n"
+"  width: 12px;\n"
+"  subcontrol-position: bottom;\n"
+"  subcontrol-origin: margin;\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:vertical:hover, QScrollBar::add-line:vertical:on {\n"
+"  border-image: url(\":/qss_icons/dark/rc/arrow_down.png\");\n"
+"  height: 12px;\n"
+"  width: 12px"
+                        ";\n"
+"  subcontrol-position: bottom;\n"
+"  subcontrol-origin: margin;\n"
+"}\n"
+"\n"
+"QScrollBar::sub-line:horizontal {\n"
+"  margin: 0px 3px 0px 3px;\n"
+"  border-image: url(\":/qss_icons/dark/rc/arrow_left_disabled.png\");\n"
+"  height: 12px;\n"
+"  width: 12px;\n"
+"  subcontrol-position: left;\n"
+"  subcontrol-origin: margin;\n"
+"}\n"
+"\n"
+"QScrollBar::sub-line:horizontal:hover, QScrollBar::sub-line:horizontal:on {\n"
+"  border-image: url(\":/qss_icons/dark/rc/arrow_left.png\");\n"
+"  height: 12px;\n"
+"  width: 12px;\n"
+"  subcontrol-position: left;\n"
+"  subcontrol-origin: margin;\n"
+"}\n"
+"\n"
+"QScrollBar::sub-line:vertical {\n"
+"  margin: 3px 0px 3px 0px;\n"
+"  border-image: url(\":/qss_icons/dark/rc/arrow_up_disabled.png\");\n"
+"  height: 12px;\n"
+"  width: 12px;\n"
+"  subcontrol-position: top;\n"
+"  subcontrol-origin: margin;\n"
+"}\n"
+"\n"
+"QScrollBar::sub-line:vertical:hover, QScrollBar::sub-line:vertical:on {\n"
+"  border-image: url(\":/qss_icons/dark/rc/arrow_up.png\");\n"
+"  height: 12px;\n"
+"  width"
+                        ": 12px;\n"
+"  subcontrol-position: top;\n"
+"  subcontrol-origin: margin;\n"
+"}\n"
+"\n"
+"QScrollBar::up-arrow:horizontal, QScrollBar::down-arrow:horizontal {\n"
+"  background: none;\n"
+"}\n"
+"\n"
+"QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {\n"
+"  background: none;\n"
+"}\n"
+"\n"
+"QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {\n"
+"  background: none;\n"
+"}\n"
+"\n"
+"QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {\n"
+"  background: none;\n"
+"}\n"
+"\n"
+"/* QTextEdit --------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-specific-widgets\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QTextEdit {\n"
+"  background-color: #19232D;\n"
+"  color: #DFE1E2;\n"
+"  border-radius: 4px;\n"
+"  border: 1px solid #455364;\n"
+"}\n"
+"\n"
+"QTextEdit:focus {\n"
+"  border: 1px solid #1A72BB;\n"
+"}\n"
+"\n"
+"QTextEdit:selected {\n"
+"  background: #346792;\n"
+"  co"
+                        "lor: #455364;\n"
+"}\n"
+"\n"
+"/* QPlainTextEdit ---------------------------------------------------------\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QPlainTextEdit {\n"
+"  background-color: #19232D;\n"
+"  color: #DFE1E2;\n"
+"  border-radius: 4px;\n"
+"  border: 1px solid #455364;\n"
+"}\n"
+"\n"
+"QPlainTextEdit:focus {\n"
+"  border: 1px solid #1A72BB;\n"
+"}\n"
+"\n"
+"QPlainTextEdit:selected {\n"
+"  background: #346792;\n"
+"  color: #455364;\n"
+"}\n"
+"\n"
+"/* QSizeGrip --------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qsizegrip\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QSizeGrip {\n"
+"  background: transparent;\n"
+"  width: 12px;\n"
+"  height: 12px;\n"
+"  image: url(\":/qss_icons/dark/rc/window_grip.png\");\n"
+"}\n"
+"\n"
+"/* QStackedWidget ---------------------------------------------------------\n"
+"\n"
+"---------------------------------"
+                        "------------------------------------------ */\n"
+"QStackedWidget {\n"
+"  padding: 2px;\n"
+"  border: 1px solid #455364;\n"
+"  border: 1px solid #19232D;\n"
+"}\n"
+"\n"
+"/* QToolBar ---------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtoolbar\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QToolBar {\n"
+"  background-color: #455364;\n"
+"  border-bottom: 1px solid #19232D;\n"
+"  padding: 1px;\n"
+"  font-weight: bold;\n"
+"  spacing: 2px;\n"
+"}\n"
+"\n"
+"QToolBar:disabled {\n"
+"  /* Fixes #272 */\n"
+"  background-color: #455364;\n"
+"}\n"
+"\n"
+"QToolBar::handle:horizontal {\n"
+"  width: 16px;\n"
+"  image: url(\":/qss_icons/dark/rc/toolbar_move_horizontal.png\");\n"
+"}\n"
+"\n"
+"QToolBar::handle:vertical {\n"
+"  height: 16px;\n"
+"  image: url(\":/qss_icons/dark/rc/toolbar_move_vertical.png\");\n"
+"}\n"
+"\n"
+"QToolBar::separator:horizontal {\n"
+"  width: 16px;\n"
+"  image: url(\":/qss_icons/dark/r"
+                        "c/toolbar_separator_horizontal.png\");\n"
+"}\n"
+"\n"
+"QToolBar::separator:vertical {\n"
+"  height: 16px;\n"
+"  image: url(\":/qss_icons/dark/rc/toolbar_separator_vertical.png\");\n"
+"}\n"
+"\n"
+"QToolButton#qt_toolbar_ext_button {\n"
+"  background: #455364;\n"
+"  border: 0px;\n"
+"  color: #DFE1E2;\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_right.png\");\n"
+"}\n"
+"\n"
+"/* QAbstractSpinBox -------------------------------------------------------\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QAbstractSpinBox {\n"
+"  background-color: #19232D;\n"
+"  border: 1px solid #455364;\n"
+"  color: #DFE1E2;\n"
+"  /* This fixes 103, 111 /\n"
+"  padding-top: 2px;\n"
+"  / This fixes 103, 111 /\n"
+"  padding-bottom: 2px;\n"
+"  padding-left: 4px;\n"
+"  padding-right: 4px;\n"
+"  border-radius: 4px;\n"
+"  / min-width: 5px; removed to fix 109 */\n"
+"}\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"QAbstractSpinBox:hover {\n"
+"  border: 1px solid #346792;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QAbstractSpin"
+                        "Box:focus {\n"
+"  border: 1px solid #1A72BB;\n"
+"}\n"
+"\n"
+"QAbstractSpinBox:selected {\n"
+"  background: #346792;\n"
+"  color: #455364;\n"
+"}\n"
+"\n"
+"/* ------------------------------------------------------------------------ */\n"
+"/* DISPLAYS --------------------------------------------------------------- */\n"
+"/* ------------------------------------------------------------------------ */\n"
+"/* QLabel -----------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qframe\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QLabel {\n"
+"  background-color: #19232D;\n"
+"  border: 0px solid #455364;\n"
+"  padding: 2px;\n"
+"  margin: 0px;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QLabel:disabled {\n"
+"  background-color: #19232D;\n"
+"  border: 0px solid #455364;\n"
+"  color: #788D9C;\n"
+"}\n"
+"\n"
+"/* QTextBrowser -----------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/"
+                        "stylesheet-examples.html#customizing-qabstractscrollarea\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QTextBrowser {\n"
+"  background-color: #19232D;\n"
+"  border: 1px solid #455364;\n"
+"  color: #DFE1E2;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QTextBrowser:disabled {\n"
+"  background-color: #19232D;\n"
+"  border: 1px solid #455364;\n"
+"  color: #788D9C;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QTextBrowser:hover, QTextBrowser:!hover, QTextBrowser:selected, QTextBrowser:pressed {\n"
+"  border: 1px solid #455364;\n"
+"}\n"
+"\n"
+"/* QGraphicsView ----------------------------------------------------------\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QGraphicsView {\n"
+"  background-color: #19232D;\n"
+"  border: 1px solid #455364;\n"
+"  color: #DFE1E2;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QGraphicsView:disabled {\n"
+"  background-color: #19232D;\n"
+"  border: 1px solid #455364;\n"
+"  color: #788D9C;\n"
+"  border-radiu"
+                        "s: 4px;\n"
+"}\n"
+"\n"
+"QGraphicsView:hover, QGraphicsView:!hover, QGraphicsView:selected, QGraphicsView:pressed {\n"
+"  border: 1px solid #455364;\n"
+"}\n"
+"\n"
+"/* QCalendarWidget --------------------------------------------------------\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QCalendarWidget {\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QCalendarWidget:disabled {\n"
+"  background-color: #19232D;\n"
+"  color: #788D9C;\n"
+"}\n"
+"\n"
+"/* QLCDNumber -------------------------------------------------------------\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QLCDNumber {\n"
+"  background-color: #19232D;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QLCDNumber:disabled {\n"
+"  background-color: #19232D;\n"
+"  color: #788D9C;\n"
+"}\n"
+"\n"
+"/* QProgressBar -----------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qprogressbar\n"
+"\n"
+""
+                        "--------------------------------------------------------------------------- */\n"
+"QProgressBar {\n"
+"  background-color: #19232D;\n"
+"  border: 1px solid #455364;\n"
+"  color: #DFE1E2;\n"
+"  border-radius: 4px;\n"
+"  text-align: center;\n"
+"}\n"
+"\n"
+"QProgressBar:disabled {\n"
+"  background-color: #19232D;\n"
+"  border: 1px solid #455364;\n"
+"  color: #788D9C;\n"
+"  border-radius: 4px;\n"
+"  text-align: center;\n"
+"}\n"
+"\n"
+"QProgressBar::chunk {\n"
+"  background-color: #346792;\n"
+"  color: #19232D;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QProgressBar::chunk:disabled {\n"
+"  background-color: #26486B;\n"
+"  color: #788D9C;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"/* ------------------------------------------------------------------------ */\n"
+"/* BUTTONS ---------------------------------------------------------------- */\n"
+"/* ------------------------------------------------------------------------ */\n"
+"/* QPushButton ------------------------------------------------------------\n"
+"\n"
+"https://doc.qt"
+                        ".io/qt-5/stylesheet-examples.html#customizing-qpushbutton\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QPushButton {\n"
+"  background-color: #455364;\n"
+"  color: #DFE1E2;\n"
+"  border-radius: 4px;\n"
+"  padding: 2px;\n"
+"  outline: none;\n"
+"  border: none;\n"
+"}\n"
+"\n"
+"QPushButton:disabled {\n"
+"  background-color: #455364;\n"
+"  color: #788D9C;\n"
+"  border-radius: 4px;\n"
+"  padding: 2px;\n"
+"}\n"
+"\n"
+"QPushButton:checked {\n"
+"  background-color: #60798B;\n"
+"  border-radius: 4px;\n"
+"  padding: 2px;\n"
+"  outline: none;\n"
+"}\n"
+"\n"
+"QPushButton:checked:disabled {\n"
+"  background-color: #60798B;\n"
+"  color: #788D9C;\n"
+"  border-radius: 4px;\n"
+"  padding: 2px;\n"
+"  outline: none;\n"
+"}\n"
+"\n"
+"QPushButton:checked:selected {\n"
+"  background: #60798B;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"  background-color: #54687A;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"  background-color: #60798B;\n"
+"}\n"
+"\n"
+"QPushButton:selected {\n"
+""
+                        "  background: #60798B;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QPushButton::menu-indicator {\n"
+"  subcontrol-origin: padding;\n"
+"  subcontrol-position: bottom right;\n"
+"  bottom: 4px;\n"
+"}\n"
+"\n"
+"QDialogButtonBox QPushButton {\n"
+"  /* Issue #194 #248 - Special case of QPushButton inside dialogs, for better UI */\n"
+"  min-width: 80px;\n"
+"}\n"
+"\n"
+"/* QToolButton ------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtoolbutton\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QToolButton {\n"
+"  background-color: #455364;\n"
+"  color: #DFE1E2;\n"
+"  border-radius: 4px;\n"
+"  padding: 2px;\n"
+"  outline: none;\n"
+"  border: none;\n"
+"  /* The subcontrols below are used only in the DelayedPopup mode */\n"
+"  /* The subcontrols below are used only in the MenuButtonPopup mode */\n"
+"  /* The subcontrol below is used only in the InstantPopup or DelayedPopup mode */\n"
+"}\n"
+"\n"
+"QToolButton:d"
+                        "isabled {\n"
+"  background-color: #455364;\n"
+"  color: #788D9C;\n"
+"  border-radius: 4px;\n"
+"  padding: 2px;\n"
+"}\n"
+"\n"
+"QToolButton:checked {\n"
+"  background-color: #60798B;\n"
+"  border-radius: 4px;\n"
+"  padding: 2px;\n"
+"  outline: none;\n"
+"}\n"
+"\n"
+"QToolButton:checked:disabled {\n"
+"  background-color: #60798B;\n"
+"  color: #788D9C;\n"
+"  border-radius: 4px;\n"
+"  padding: 2px;\n"
+"  outline: none;\n"
+"}\n"
+"\n"
+"QToolButton:checked:hover {\n"
+"  background-color: #54687A;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QToolButton:checked:pressed {\n"
+"  background-color: #60798B;\n"
+"}\n"
+"\n"
+"QToolButton:checked:selected {\n"
+"  background: #60798B;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QToolButton:hover {\n"
+"  background-color: #54687A;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QToolButton:pressed {\n"
+"  background-color: #60798B;\n"
+"}\n"
+"\n"
+"QToolButton:selected {\n"
+"  background: #60798B;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QToolButton[popupMode=\"0\"] {\n"
+"  /* Only for DelayedPopup */\n"
+"  paddi"
+                        "ng-right: 2px;\n"
+"}\n"
+"\n"
+"QToolButton[popupMode=\"1\"] {\n"
+"  /* Only for MenuButtonPopup */\n"
+"  padding-right: 20px;\n"
+"}\n"
+"\n"
+"QToolButton[popupMode=\"1\"]::menu-button {\n"
+"  border: none;\n"
+"}\n"
+"\n"
+"QToolButton[popupMode=\"1\"]::menu-button:hover {\n"
+"  border: none;\n"
+"  border-left: 1px solid #455364;\n"
+"  border-radius: 0;\n"
+"}\n"
+"\n"
+"QToolButton[popupMode=\"2\"] {\n"
+"  /* Only for InstantPopup */\n"
+"  padding-right: 2px;\n"
+"}\n"
+"\n"
+"QToolButton::menu-button {\n"
+"  padding: 2px;\n"
+"  border-radius: 4px;\n"
+"  width: 12px;\n"
+"  border: none;\n"
+"  outline: none;\n"
+"}\n"
+"\n"
+"QToolButton::menu-button:hover {\n"
+"  border: 1px solid #346792;\n"
+"}\n"
+"\n"
+"QToolButton::menu-button:checked:hover {\n"
+"  border: 1px solid #346792;\n"
+"}\n"
+"\n"
+"QToolButton::menu-indicator {\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_down.png\");\n"
+"  height: 8px;\n"
+"  width: 8px;\n"
+"  top: 0;\n"
+"  /* Exclude a shift for better image */\n"
+"  left: -2px;\n"
+"  /* Shift it a bit */\n"
+"}\n"
+""
+                        "\n"
+"QToolButton::menu-arrow {\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_down.png\");\n"
+"  height: 8px;\n"
+"  width: 8px;\n"
+"}\n"
+"\n"
+"QToolButton::menu-arrow:hover {\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_down_focus.png\");\n"
+"}\n"
+"\n"
+"/* QCommandLinkButton -----------------------------------------------------\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QCommandLinkButton {\n"
+"  background-color: transparent;\n"
+"  border: 1px solid #455364;\n"
+"  color: #DFE1E2;\n"
+"  border-radius: 4px;\n"
+"  padding: 0px;\n"
+"  margin: 0px;\n"
+"}\n"
+"\n"
+"QCommandLinkButton:disabled {\n"
+"  background-color: transparent;\n"
+"  color: #788D9C;\n"
+"}\n"
+"\n"
+"/* ------------------------------------------------------------------------ */\n"
+"/* INPUTS - NO FIELDS ----------------------------------------------------- */\n"
+"/* ------------------------------------------------------------------------ */\n"
+"/* QComboBox ----------------------------------------------"
+                        "----------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qcombobox\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QComboBox {\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 4px;\n"
+"  selection-background-color: #346792;\n"
+"  padding-left: 4px;\n"
+"  padding-right: 4px;\n"
+"  /* padding-right = 36; 4 + 16*2 See scrollbar size */\n"
+"  /* changed to 4px to fix #239 */\n"
+"  /* Fixes #103, #111 */\n"
+"  min-height: 1.5em;\n"
+"  /* padding-top: 2px;     removed to fix #132 */\n"
+"  /* padding-bottom: 2px;  removed to fix #132 */\n"
+"  /* min-width: 75px;      removed to fix #109 */\n"
+"  /* Needed to remove indicator - fix #132 */\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 0;\n"
+"  background-color: #19232D;\n"
+"  selection-background-color: #346792;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView:hover {\n"
+"  background-color: #19232D;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QComboBo"
+                        "x QAbstractItemView:selected {\n"
+"  background: #346792;\n"
+"  color: #455364;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView:alternate {\n"
+"  background: #19232D;\n"
+"}\n"
+"\n"
+"QComboBox:disabled {\n"
+"  background-color: #19232D;\n"
+"  color: #788D9C;\n"
+"}\n"
+"\n"
+"QComboBox:hover {\n"
+"  border: 1px solid #346792;\n"
+"}\n"
+"\n"
+"QComboBox:focus {\n"
+"  border: 1px solid #1A72BB;\n"
+"}\n"
+"\n"
+"QComboBox:on {\n"
+"  selection-background-color: #346792;\n"
+"}\n"
+"\n"
+"QComboBox::indicator {\n"
+"  border: none;\n"
+"  border-radius: 0;\n"
+"  background-color: transparent;\n"
+"  selection-background-color: transparent;\n"
+"  color: transparent;\n"
+"  selection-color: transparent;\n"
+"  /* Needed to remove indicator - fix #132 */\n"
+"}\n"
+"\n"
+"QComboBox::indicator:alternate {\n"
+"  background: #19232D;\n"
+"}\n"
+"\n"
+"QComboBox::item {\n"
+"  /* Remove to fix #282, #285 and MR #288*/\n"
+"  /*&:checked {\n"
+"            font-weight: bold;\n"
+"        }\n"
+"\n"
+"        &:selected {\n"
+"            border: 0px solid "
+                        "transparent;\n"
+"        }\n"
+"        */\n"
+"}\n"
+"\n"
+"QComboBox::item:alternate {\n"
+"  background: #19232D;\n"
+"}\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"/* QSlider ----------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qslider\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QSlider:disabled {\n"
+"  background: #19232D;\n"
+"}\n"
+"\n"
+"QSlider:focus {\n"
+"  border: none;\n"
+"}\n"
+"\n"
+"QSlider::groove:horizontal {\n"
+"  background: #455364;\n"
+"  border: 1px solid #455364;\n"
+"  height: 4px;\n"
+"  margin: 0px;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::groove:vertical {\n"
+"  background: #455364;\n"
+"  border: 1px solid #455364;\n"
+"  width: 4px;\n"
+"  margin: 0px;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::add-page:vertical {\n"
+"  background: #346792;\n"
+"  border: 1px solid #455364;\n"
+"  width: 4px;\n"
+"  margin: 0px;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::add-page:vertical"
+                        " :disabled {\n"
+"  background: #26486B;\n"
+"}\n"
+"\n"
+"QSlider::sub-page:horizontal {\n"
+"  background: #346792;\n"
+"  border: 1px solid #455364;\n"
+"  height: 4px;\n"
+"  margin: 0px;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::sub-page:horizontal:disabled {\n"
+"  background: #26486B;\n"
+"}\n"
+"\n"
+"QSlider::handle:horizontal {\n"
+"  background: #9DA9B5;\n"
+"  border: 1px solid #455364;\n"
+"  width: 8px;\n"
+"  height: 8px;\n"
+"  margin: -8px 0px;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::handle:horizontal:hover {\n"
+"  background: #346792;\n"
+"  border: 1px solid #346792;\n"
+"}\n"
+"\n"
+"QSlider::handle:horizontal:focus {\n"
+"  border: 1px solid #1A72BB;\n"
+"}\n"
+"\n"
+"QSlider::handle:vertical {\n"
+"  background: #9DA9B5;\n"
+"  border: 1px solid #455364;\n"
+"  width: 8px;\n"
+"  height: 8px;\n"
+"  margin: 0 -8px;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::handle:vertical:hover {\n"
+"  background: #346792;\n"
+"  border: 1px solid #346792;\n"
+"}\n"
+"\n"
+"QSlider::handle:vertical:focus {\n"
+"  "
+                        "border: 1px solid #1A72BB;\n"
+"}\n"
+"\n"
+"/* QLineEdit --------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qlineedit\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QLineEdit {\n"
+"  background-color: #19232D;\n"
+"  padding-top: 2px;\n"
+"  /* This QLineEdit fix  103, 111 */\n"
+"  padding-bottom: 2px;\n"
+"  /* This QLineEdit fix  103, 111 */\n"
+"  padding-left: 4px;\n"
+"  padding-right: 4px;\n"
+"  border-style: solid;\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 4px;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QLineEdit:disabled {\n"
+"  background-color: #19232D;\n"
+"  color: #788D9C;\n"
+"}\n"
+"\n"
+"QLineEdit:hover {\n"
+"  border: 1px solid #346792;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QLineEdit:focus {\n"
+"  border: 1px solid #1A72BB;\n"
+"}\n"
+"\n"
+"QLineEdit:selected {\n"
+"  background-color: #346792;\n"
+"  color: #455364;\n"
+"}\n"
+"\n"
+"/* QTabWiget -----------------------------------"
+                        "---------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtabwidget-and-qtabbar\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QTabWidget {\n"
+"  padding: 2px;\n"
+"  selection-background-color: #455364;\n"
+"}\n"
+"\n"
+"QTabWidget QWidget {\n"
+"  /* Fixes #189 */\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QTabWidget::pane {\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 4px;\n"
+"  margin: 0px;\n"
+"  /* Fixes double border inside pane with pyqt5 */\n"
+"  padding: 0px;\n"
+"}\n"
+"\n"
+"QTabWidget::pane:selected {\n"
+"  background-color: #455364;\n"
+"  border: 1px solid #346792;\n"
+"}\n"
+"\n"
+"/* QTabBar ----------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtabwidget-and-qtabbar\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QTabBar, QDockWidget QTabBar {\n"
+"  qproperty-drawBase: 0;\n"
+"  border-radius: "
+                        "4px;\n"
+"  margin: 0px;\n"
+"  padding: 2px;\n"
+"  border: 0;\n"
+"  /* left: 5px; move to the right by 5px - removed for fix */\n"
+"}\n"
+"\n"
+"QTabBar::close-button, QDockWidget QTabBar::close-button {\n"
+"  border: 0;\n"
+"  margin: 0;\n"
+"  padding: 4px;\n"
+"  image: url(\":/qss_icons/dark/rc/window_close.png\");\n"
+"}\n"
+"\n"
+"QTabBar::close-button:hover, QDockWidget QTabBar::close-button:hover {\n"
+"  image: url(\":/qss_icons/dark/rc/window_close_focus.png\");\n"
+"}\n"
+"\n"
+"QTabBar::close-button:pressed, QDockWidget QTabBar::close-button:pressed {\n"
+"  image: url(\":/qss_icons/dark/rc/window_close_pressed.png\");\n"
+"}\n"
+"\n"
+"QTabBar::tab, QDockWidget QTabBar::tab {\n"
+"  /* !selected and disabled ----------------------------------------- */\n"
+"  /* selected ------------------------------------------------------- */\n"
+"}\n"
+"\n"
+"QTabBar::tab:top:selected:disabled, QDockWidget QTabBar::tab:top:selected:disabled {\n"
+"  border-bottom: 3px solid #26486B;\n"
+"  color: #788D9C;\n"
+"  background-color: #455"
+                        "364;\n"
+"}\n"
+"\n"
+"QTabBar::tab:bottom:selected:disabled, QDockWidget QTabBar::tab:bottom:selected:disabled {\n"
+"  border-top: 3px solid #26486B;\n"
+"  color: #788D9C;\n"
+"  background-color: #455364;\n"
+"}\n"
+"\n"
+"QTabBar::tab:left:selected:disabled, QDockWidget QTabBar::tab:left:selected:disabled {\n"
+"  border-right: 3px solid #26486B;\n"
+"  color: #788D9C;\n"
+"  background-color: #455364;\n"
+"}\n"
+"\n"
+"QTabBar::tab:right:selected:disabled, QDockWidget QTabBar::tab:right:selected:disabled {\n"
+"  border-left: 3px solid #26486B;\n"
+"  color: #788D9C;\n"
+"  background-color: #455364;\n"
+"}\n"
+"\n"
+"QTabBar::tab:top:!selected:disabled, QDockWidget QTabBar::tab:top:!selected:disabled {\n"
+"  border-bottom: 3px solid #19232D;\n"
+"  color: #788D9C;\n"
+"  background-color: #19232D;\n"
+"}\n"
+"\n"
+"QTabBar::tab:bottom:!selected:disabled, QDockWidget QTabBar::tab:bottom:!selected:disabled {\n"
+"  border-top: 3px solid #19232D;\n"
+"  color: #788D9C;\n"
+"  background-color: #19232D;\n"
+"}\n"
+"\n"
+"QTabBar::tab:left"
+                        ":!selected:disabled, QDockWidget QTabBar::tab:left:!selected:disabled {\n"
+"  border-right: 3px solid #19232D;\n"
+"  color: #788D9C;\n"
+"  background-color: #19232D;\n"
+"}\n"
+"\n"
+"QTabBar::tab:right:!selected:disabled, QDockWidget QTabBar::tab:right:!selected:disabled {\n"
+"  border-left: 3px solid #19232D;\n"
+"  color: #788D9C;\n"
+"  background-color: #19232D;\n"
+"}\n"
+"\n"
+"QTabBar::tab:top:!selected, QDockWidget QTabBar::tab:top:!selected {\n"
+"  border-bottom: 2px solid #19232D;\n"
+"  margin-top: 2px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:bottom:!selected, QDockWidget QTabBar::tab:bottom:!selected {\n"
+"  border-top: 2px solid #19232D;\n"
+"  margin-bottom: 2px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:left:!selected, QDockWidget QTabBar::tab:left:!selected {\n"
+"  border-left: 2px solid #19232D;\n"
+"  margin-right: 2px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:right:!selected, QDockWidget QTabBar::tab:right:!selected {\n"
+"  border-right: 2px solid #19232D;\n"
+"  margin-left: 2px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:top, QDockWidget QTabBar::tab:to"
+                        "p {\n"
+"  background-color: #455364;\n"
+"  margin-left: 2px;\n"
+"  padding-left: 4px;\n"
+"  padding-right: 4px;\n"
+"  padding-top: 2px;\n"
+"  padding-bottom: 2px;\n"
+"  min-width: 5px;\n"
+"  border-bottom: 3px solid #455364;\n"
+"  border-top-left-radius: 4px;\n"
+"  border-top-right-radius: 4px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:top:selected, QDockWidget QTabBar::tab:top:selected {\n"
+"  background-color: #54687A;\n"
+"  border-bottom: 3px solid #259AE9;\n"
+"  border-top-left-radius: 4px;\n"
+"  border-top-right-radius: 4px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:top:!selected:hover, QDockWidget QTabBar::tab:top:!selected:hover {\n"
+"  border: 1px solid #1A72BB;\n"
+"  border-bottom: 3px solid #1A72BB;\n"
+"  /* Fixes spyder-ide/spyder#9766 and #243 */\n"
+"  padding-left: 3px;\n"
+"  padding-right: 3px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:bottom, QDockWidget QTabBar::tab:bottom {\n"
+"  border-top: 3px solid #455364;\n"
+"  background-color: #455364;\n"
+"  margin-left: 2px;\n"
+"  padding-left: 4px;\n"
+"  padding-right: 4px;\n"
+"  padding-top:"
+                        " 2px;\n"
+"  padding-bottom: 2px;\n"
+"  border-bottom-left-radius: 4px;\n"
+"  border-bottom-right-radius: 4px;\n"
+"  min-width: 5px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:bottom:selected, QDockWidget QTabBar::tab:bottom:selected {\n"
+"  background-color: #54687A;\n"
+"  border-top: 3px solid #259AE9;\n"
+"  border-bottom-left-radius: 4px;\n"
+"  border-bottom-right-radius: 4px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:bottom:!selected:hover, QDockWidget QTabBar::tab:bottom:!selected:hover {\n"
+"  border: 1px solid #1A72BB;\n"
+"  border-top: 3px solid #1A72BB;\n"
+"  /* Fixes spyder-ide/spyder#9766 and #243 */\n"
+"  padding-left: 3px;\n"
+"  padding-right: 3px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:left, QDockWidget QTabBar::tab:left {\n"
+"  background-color: #455364;\n"
+"  margin-top: 2px;\n"
+"  padding-left: 2px;\n"
+"  padding-right: 2px;\n"
+"  padding-top: 4px;\n"
+"  padding-bottom: 4px;\n"
+"  border-top-left-radius: 4px;\n"
+"  border-bottom-left-radius: 4px;\n"
+"  min-height: 5px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:left:selected, QDockWidget QTabBar::t"
+                        "ab:left:selected {\n"
+"  background-color: #54687A;\n"
+"  border-right: 3px solid #259AE9;\n"
+"}\n"
+"\n"
+"QTabBar::tab:left:!selected:hover, QDockWidget QTabBar::tab:left:!selected:hover {\n"
+"  border: 1px solid #1A72BB;\n"
+"  border-right: 3px solid #1A72BB;\n"
+"  /* Fixes different behavior #271 */\n"
+"  margin-right: 0px;\n"
+"  padding-right: -1px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:right, QDockWidget QTabBar::tab:right {\n"
+"  background-color: #455364;\n"
+"  margin-top: 2px;\n"
+"  padding-left: 2px;\n"
+"  padding-right: 2px;\n"
+"  padding-top: 4px;\n"
+"  padding-bottom: 4px;\n"
+"  border-top-right-radius: 4px;\n"
+"  border-bottom-right-radius: 4px;\n"
+"  min-height: 5px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:right:selected, QDockWidget QTabBar::tab:right:selected {\n"
+"  background-color: #54687A;\n"
+"  border-left: 3px solid #259AE9;\n"
+"}\n"
+"\n"
+"QTabBar::tab:right:!selected:hover, QDockWidget QTabBar::tab:right:!selected:hover {\n"
+"  border: 1px solid #1A72BB;\n"
+"  border-left: 3px solid #1A72BB;\n"
+"  /* Fixes dif"
+                        "ferent behavior #271 */\n"
+"  margin-left: 0px;\n"
+"  padding-left: 0px;\n"
+"}\n"
+"\n"
+"QTabBar QToolButton, QDockWidget QTabBar QToolButton {\n"
+"  /* Fixes #136 */\n"
+"  background-color: #455364;\n"
+"  height: 12px;\n"
+"  width: 12px;\n"
+"}\n"
+"\n"
+"QTabBar QToolButton:pressed, QDockWidget QTabBar QToolButton:pressed {\n"
+"  background-color: #455364;\n"
+"}\n"
+"\n"
+"QTabBar QToolButton:pressed:hover, QDockWidget QTabBar QToolButton:pressed:hover {\n"
+"  border: 1px solid #346792;\n"
+"}\n"
+"\n"
+"QTabBar QToolButton::left-arrow:enabled, QDockWidget QTabBar QToolButton::left-arrow:enabled {\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_left.png\");\n"
+"}\n"
+"\n"
+"QTabBar QToolButton::left-arrow:disabled, QDockWidget QTabBar QToolButton::left-arrow:disabled {\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_left_disabled.png\");\n"
+"}\n"
+"\n"
+"QTabBar QToolButton::right-arrow:enabled, QDockWidget QTabBar QToolButton::right-arrow:enabled {\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_right.png\");\n"
+"}\n"
+"\n"
+"QTab"
+                        "Bar QToolButton::right-arrow:disabled, QDockWidget QTabBar QToolButton::right-arrow:disabled {\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_right_disabled.png\");\n"
+"}\n"
+"\n"
+"/* QDockWiget -------------------------------------------------------------\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QDockWidget {\n"
+"  outline: 1px solid #455364;\n"
+"  background-color: #19232D;\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 4px;\n"
+"  titlebar-close-icon: url(\":/qss_icons/dark/rc/transparent.png\");\n"
+"  titlebar-normal-icon: url(\":/qss_icons/dark/rc/transparent.png\");\n"
+"}\n"
+"\n"
+"QDockWidget::title {\n"
+"  /* Better size for title bar */\n"
+"  padding: 3px;\n"
+"  spacing: 4px;\n"
+"  border: none;\n"
+"  background-color: #455364;\n"
+"}\n"
+"\n"
+"QDockWidget::close-button {\n"
+"  icon-size: 12px;\n"
+"  border: none;\n"
+"  background: transparent;\n"
+"  background-image: transparent;\n"
+"  border: 0;\n"
+"  margin: 0;\n"
+"  padding: 0;\n"
+"  image: url(\""
+                        ":/qss_icons/dark/rc/window_close.png\");\n"
+"}\n"
+"\n"
+"QDockWidget::close-button:hover {\n"
+"  image: url(\":/qss_icons/dark/rc/window_close_focus.png\");\n"
+"}\n"
+"\n"
+"QDockWidget::close-button:pressed {\n"
+"  image: url(\":/qss_icons/dark/rc/window_close_pressed.png\");\n"
+"}\n"
+"\n"
+"QDockWidget::float-button {\n"
+"  icon-size: 12px;\n"
+"  border: none;\n"
+"  background: transparent;\n"
+"  background-image: transparent;\n"
+"  border: 0;\n"
+"  margin: 0;\n"
+"  padding: 0;\n"
+"  image: url(\":/qss_icons/dark/rc/window_undock.png\");\n"
+"}\n"
+"\n"
+"QDockWidget::float-button:hover {\n"
+"  image: url(\":/qss_icons/dark/rc/window_undock_focus.png\");\n"
+"}\n"
+"\n"
+"QDockWidget::float-button:pressed {\n"
+"  image: url(\":/qss_icons/dark/rc/window_undock_pressed.png\");\n"
+"}\n"
+"\n"
+"/* QTreeView QListView QTableView -----------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtreeview\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qlistview\n"
+""
+                        "https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtableview\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QTreeView:branch:selected, QTreeView:branch:hover {\n"
+"  background: url(\":/qss_icons/dark/rc/transparent.png\");\n"
+"}\n"
+"\n"
+"QTreeView:branch:has-siblings:!adjoins-item {\n"
+"  border-image: url(\":/qss_icons/dark/rc/branch_line.png\") 0;\n"
+"}\n"
+"\n"
+"QTreeView:branch:has-siblings:adjoins-item {\n"
+"  border-image: url(\":/qss_icons/dark/rc/branch_more.png\") 0;\n"
+"}\n"
+"\n"
+"QTreeView:branch:!has-children:!has-siblings:adjoins-item {\n"
+"  border-image: url(\":/qss_icons/dark/rc/branch_end.png\") 0;\n"
+"}\n"
+"\n"
+"QTreeView:branch:has-children:!has-siblings:closed, QTreeView:branch:closed:has-children:has-siblings {\n"
+"  border-image: none;\n"
+"  image: url(\":/qss_icons/dark/rc/branch_closed.png\");\n"
+"}\n"
+"\n"
+"QTreeView:branch:open:has-children:!has-siblings, QTreeView:branch:open:has-children:has-siblings {\n"
+"  border-image: none;\n"
+""
+                        "  image: url(\":/qss_icons/dark/rc/branch_open.png\");\n"
+"}\n"
+"\n"
+"QTreeView:branch:has-children:!has-siblings:closed:hover, QTreeView:branch:closed:has-children:has-siblings:hover {\n"
+"  image: url(\":/qss_icons/dark/rc/branch_closed_focus.png\");\n"
+"}\n"
+"\n"
+"QTreeView:branch:open:has-children:!has-siblings:hover, QTreeView:branch:open:has-children:has-siblings:hover {\n"
+"  image: url(\":/qss_icons/dark/rc/branch_open_focus.png\");\n"
+"}\n"
+"\n"
+"QTreeView::indicator:checked,\n"
+"QListView::indicator:checked,\n"
+"QTableView::indicator:checked,\n"
+"QColumnView::indicator:checked {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_checked.png\");\n"
+"}\n"
+"\n"
+"QTreeView::indicator:checked:hover, QTreeView::indicator:checked:focus, QTreeView::indicator:checked:pressed,\n"
+"QListView::indicator:checked:hover,\n"
+"QListView::indicator:checked:focus,\n"
+"QListView::indicator:checked:pressed,\n"
+"QTableView::indicator:checked:hover,\n"
+"QTableView::indicator:checked:focus,\n"
+"QTableView::indicator:checked:pr"
+                        "essed,\n"
+"QColumnView::indicator:checked:hover,\n"
+"QColumnView::indicator:checked:focus,\n"
+"QColumnView::indicator:checked:pressed {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_checked_focus.png\");\n"
+"}\n"
+"\n"
+"QTreeView::indicator:unchecked,\n"
+"QListView::indicator:unchecked,\n"
+"QTableView::indicator:unchecked,\n"
+"QColumnView::indicator:unchecked {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_unchecked.png\");\n"
+"}\n"
+"\n"
+"QTreeView::indicator:unchecked:hover, QTreeView::indicator:unchecked:focus, QTreeView::indicator:unchecked:pressed,\n"
+"QListView::indicator:unchecked:hover,\n"
+"QListView::indicator:unchecked:focus,\n"
+"QListView::indicator:unchecked:pressed,\n"
+"QTableView::indicator:unchecked:hover,\n"
+"QTableView::indicator:unchecked:focus,\n"
+"QTableView::indicator:unchecked:pressed,\n"
+"QColumnView::indicator:unchecked:hover,\n"
+"QColumnView::indicator:unchecked:focus,\n"
+"QColumnView::indicator:unchecked:pressed {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_unchecked_focus.png\""
+                        ");\n"
+"}\n"
+"\n"
+"QTreeView::indicator:indeterminate,\n"
+"QListView::indicator:indeterminate,\n"
+"QTableView::indicator:indeterminate,\n"
+"QColumnView::indicator:indeterminate {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_indeterminate.png\");\n"
+"}\n"
+"\n"
+"QTreeView::indicator:indeterminate:hover, QTreeView::indicator:indeterminate:focus, QTreeView::indicator:indeterminate:pressed,\n"
+"QListView::indicator:indeterminate:hover,\n"
+"QListView::indicator:indeterminate:focus,\n"
+"QListView::indicator:indeterminate:pressed,\n"
+"QTableView::indicator:indeterminate:hover,\n"
+"QTableView::indicator:indeterminate:focus,\n"
+"QTableView::indicator:indeterminate:pressed,\n"
+"QColumnView::indicator:indeterminate:hover,\n"
+"QColumnView::indicator:indeterminate:focus,\n"
+"QColumnView::indicator:indeterminate:pressed {\n"
+"  image: url(\":/qss_icons/dark/rc/checkbox_indeterminate_focus.png\");\n"
+"}\n"
+"\n"
+"QTreeView,\n"
+"QListView,\n"
+"QTableView,\n"
+"QColumnView {\n"
+"  background-color: #19232D;\n"
+"  border: 1px so"
+                        "lid #455364;\n"
+"  color: #DFE1E2;\n"
+"  gridline-color: #455364;\n"
+"  border-radius: 4px;\n"
+"}\n"
+"\n"
+"QTreeView:disabled,\n"
+"QListView:disabled,\n"
+"QTableView:disabled,\n"
+"QColumnView:disabled {\n"
+"  background-color: #19232D;\n"
+"  color: #788D9C;\n"
+"}\n"
+"\n"
+"QTreeView:selected,\n"
+"QListView:selected,\n"
+"QTableView:selected,\n"
+"QColumnView:selected {\n"
+"  background-color: #346792;\n"
+"  color: #455364;\n"
+"}\n"
+"\n"
+"QTreeView:focus,\n"
+"QListView:focus,\n"
+"QTableView:focus,\n"
+"QColumnView:focus {\n"
+"  border: 1px solid #1A72BB;\n"
+"}\n"
+"\n"
+"QTreeView::item:pressed,\n"
+"QListView::item:pressed,\n"
+"QTableView::item:pressed,\n"
+"QColumnView::item:pressed {\n"
+"  background-color: #346792;\n"
+"}\n"
+"\n"
+"QTreeView::item:selected:active,\n"
+"QListView::item:selected:active,\n"
+"QTableView::item:selected:active,\n"
+"QColumnView::item:selected:active {\n"
+"  background-color: #346792;\n"
+"}\n"
+"\n"
+"QTreeView::item:selected:!active,\n"
+"QListView::item:selected:!active,\n"
+"QTableView::item:s"
+                        "elected:!active,\n"
+"QColumnView::item:selected:!active {\n"
+"  color: #DFE1E2;\n"
+"  background-color: #37414F;\n"
+"}\n"
+"\n"
+"QTreeView::item:!selected:hover,\n"
+"QListView::item:!selected:hover,\n"
+"QTableView::item:!selected:hover,\n"
+"QColumnView::item:!selected:hover {\n"
+"  outline: 0;\n"
+"  color: #DFE1E2;\n"
+"  background-color: #37414F;\n"
+"}\n"
+"\n"
+"QTableCornerButton::section {\n"
+"  background-color: #19232D;\n"
+"  border: 1px transparent #455364;\n"
+"  border-radius: 0px;\n"
+"}\n"
+"\n"
+"/* QHeaderView ------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qheaderview\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QHeaderView {\n"
+"  background-color: #455364;\n"
+"  border: 0px transparent #455364;\n"
+"  padding: 0;\n"
+"  margin: 0;\n"
+"  border-radius: 0;\n"
+"}\n"
+"\n"
+"QHeaderView:disabled {\n"
+"  background-color: #455364;\n"
+"  border: 1px transparent #455364;\n"
+"}\n"
+"\n"
+""
+                        "QHeaderView::section {\n"
+"  background-color: #455364;\n"
+"  color: #DFE1E2;\n"
+"  border-radius: 0;\n"
+"  text-align: left;\n"
+"  font-size: 13px;\n"
+"}\n"
+"\n"
+"QHeaderView::section::horizontal {\n"
+"  padding-top: 0;\n"
+"  padding-bottom: 0;\n"
+"  padding-left: 4px;\n"
+"  padding-right: 4px;\n"
+"  border-left: 1px solid #19232D;\n"
+"}\n"
+"\n"
+"QHeaderView::section::horizontal::first, QHeaderView::section::horizontal::only-one {\n"
+"  border-left: 1px solid #455364;\n"
+"}\n"
+"\n"
+"QHeaderView::section::horizontal:disabled {\n"
+"  color: #788D9C;\n"
+"}\n"
+"\n"
+"QHeaderView::section::vertical {\n"
+"  padding-top: 0;\n"
+"  padding-bottom: 0;\n"
+"  padding-left: 4px;\n"
+"  padding-right: 4px;\n"
+"  border-top: 1px solid #19232D;\n"
+"}\n"
+"\n"
+"QHeaderView::section::vertical::first, QHeaderView::section::vertical::only-one {\n"
+"  border-top: 1px solid #455364;\n"
+"}\n"
+"\n"
+"QHeaderView::section::vertical:disabled {\n"
+"  color: #788D9C;\n"
+"}\n"
+"\n"
+"QHeaderView::down-arrow {\n"
+"  /* Those settings (border/w"
+                        "idth/height/background-color) solve bug */\n"
+"  /* transparent arrow background and size */\n"
+"  background-color: #455364;\n"
+"  border: none;\n"
+"  height: 12px;\n"
+"  width: 12px;\n"
+"  padding-left: 2px;\n"
+"  padding-right: 2px;\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_down.png\");\n"
+"}\n"
+"\n"
+"QHeaderView::up-arrow {\n"
+"  background-color: #455364;\n"
+"  border: none;\n"
+"  height: 12px;\n"
+"  width: 12px;\n"
+"  padding-left: 2px;\n"
+"  padding-right: 2px;\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_up.png\");\n"
+"}\n"
+"\n"
+"/* QToolBox --------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtoolbox\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QToolBox {\n"
+"  padding: 0px;\n"
+"  border: 0px;\n"
+"  border: 1px solid #455364;\n"
+"}\n"
+"\n"
+"QToolBox:selected {\n"
+"  padding: 0px;\n"
+"  border: 2px solid #346792;\n"
+"}\n"
+"\n"
+"QToolBox::tab {\n"
+"  background-color: #19232D"
+                        ";\n"
+"  border: 1px solid #455364;\n"
+"  color: #DFE1E2;\n"
+"  border-top-left-radius: 4px;\n"
+"  border-top-right-radius: 4px;\n"
+"}\n"
+"\n"
+"QToolBox::tab:disabled {\n"
+"  color: #788D9C;\n"
+"}\n"
+"\n"
+"QToolBox::tab:selected {\n"
+"  background-color: #60798B;\n"
+"  border-bottom: 2px solid #346792;\n"
+"}\n"
+"\n"
+"QToolBox::tab:selected:disabled {\n"
+"  background-color: #455364;\n"
+"  border-bottom: 2px solid #26486B;\n"
+"}\n"
+"\n"
+"QToolBox::tab:!selected {\n"
+"  background-color: #455364;\n"
+"  border-bottom: 2px solid #455364;\n"
+"}\n"
+"\n"
+"QToolBox::tab:!selected:disabled {\n"
+"  background-color: #19232D;\n"
+"}\n"
+"\n"
+"QToolBox::tab:hover {\n"
+"  border-color: #1A72BB;\n"
+"  border-bottom: 2px solid #1A72BB;\n"
+"}\n"
+"\n"
+"QToolBox QScrollArea {\n"
+"  padding: 0px;\n"
+"  border: 0px;\n"
+"  background-color: #19232D;\n"
+"}\n"
+"\n"
+"/* QFrame -----------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qframe\n"
+"https://doc.qt.i"
+                        "o/qt-5/qframe.html#-prop\n"
+"https://doc.qt.io/qt-5/qframe.html#details\n"
+"https://stackoverflow.com/questions/14581498/qt-stylesheet-for-hline-vline-color\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"/* (dot) .QFrame  fix #141, #126, #123 */\n"
+".QFrame {\n"
+"  border-radius: 4px;\n"
+"  border: 1px solid #455364;\n"
+"  /* No frame */\n"
+"  /* HLine */\n"
+"  /* HLine */\n"
+"}\n"
+"\n"
+".QFrame[frameShape=\"0\"] {\n"
+"  border-radius: 4px;\n"
+"  border: 1px transparent #455364;\n"
+"}\n"
+"\n"
+".QFrame[frameShape=\"4\"] {\n"
+"  max-height: 2px;\n"
+"  border: none;\n"
+"  background-color: #455364;\n"
+"}\n"
+"\n"
+".QFrame[frameShape=\"5\"] {\n"
+"  max-width: 2px;\n"
+"  border: none;\n"
+"  background-color: #455364;\n"
+"}\n"
+"\n"
+"/* QSplitter --------------------------------------------------------------\n"
+"\n"
+"https://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qsplitter\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+""
+                        "QSplitter {\n"
+"  background-color: #455364;\n"
+"  spacing: 0px;\n"
+"  padding: 0px;\n"
+"  margin: 0px;\n"
+"}\n"
+"\n"
+"QSplitter::handle {\n"
+"  background-color: #455364;\n"
+"  border: 0px solid #19232D;\n"
+"  spacing: 0px;\n"
+"  padding: 1px;\n"
+"  margin: 0px;\n"
+"}\n"
+"\n"
+"QSplitter::handle:hover {\n"
+"  background-color: #9DA9B5;\n"
+"}\n"
+"\n"
+"QSplitter::handle:horizontal {\n"
+"  width: 5px;\n"
+"  image: url(\":/qss_icons/dark/rc/line_vertical.png\");\n"
+"}\n"
+"\n"
+"QSplitter::handle:vertical {\n"
+"  height: 5px;\n"
+"  image: url(\":/qss_icons/dark/rc/line_horizontal.png\");\n"
+"}\n"
+"\n"
+"/* QDateEdit, QDateTimeEdit -----------------------------------------------\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QDateEdit, QDateTimeEdit {\n"
+"  selection-background-color: #346792;\n"
+"  border-style: solid;\n"
+"  border: 1px solid #455364;\n"
+"  border-radius: 4px;\n"
+"  /* This fixes 103, 111 */\n"
+"  padding-top: 2px;\n"
+"  /* This fixes 103, 111 */\n"
+"  pad"
+                        "ding-bottom: 2px;\n"
+"  padding-left: 4px;\n"
+"  padding-right: 4px;\n"
+"  min-width: 10px;\n"
+"}\n"
+"\n"
+"QDateEdit:on, QDateTimeEdit:on {\n"
+"  selection-background-color: #346792;\n"
+"}\n"
+"\n"
+"QDateEdit::drop-down, QDateTimeEdit::drop-down {\n"
+"  subcontrol-origin: padding;\n"
+"  subcontrol-position: top right;\n"
+"  width: 12px;\n"
+"  border-left: 1px solid #455364;\n"
+"}\n"
+"\n"
+"QDateEdit::down-arrow, QDateTimeEdit::down-arrow {\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_down_disabled.png\");\n"
+"  height: 8px;\n"
+"  width: 8px;\n"
+"}\n"
+"\n"
+"QDateEdit::down-arrow:on, QDateEdit::down-arrow:hover, QDateEdit::down-arrow:focus, QDateTimeEdit::down-arrow:on, QDateTimeEdit::down-arrow:hover, QDateTimeEdit::down-arrow:focus {\n"
+"  image: url(\":/qss_icons/dark/rc/arrow_down.png\");\n"
+"}\n"
+"\n"
+"QDateEdit QAbstractItemView, QDateTimeEdit QAbstractItemView {\n"
+"  background-color: #19232D;\n"
+"  border-radius: 4px;\n"
+"  border: 1px solid #455364;\n"
+"  selection-background-color: #346792;\n"
+"}\n"
+"\n"
+""
+                        "/* QAbstractView ----------------------------------------------------------\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"QAbstractView:hover {\n"
+"  border: 1px solid #346792;\n"
+"  color: #DFE1E2;\n"
+"}\n"
+"\n"
+"QAbstractView:selected {\n"
+"  background: #346792;\n"
+"  color: #455364;\n"
+"}\n"
+"\n"
+"/* PlotWidget -------------------------------------------------------------\n"
+"\n"
+"--------------------------------------------------------------------------- */\n"
+"PlotWidget {\n"
+"  /* Fix cut labels in plots #134 */\n"
+"  padding: 0px;\n"
+"}")
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.verticalLayout_2 = QVBoxLayout(self.centralwidget)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(6, 6, 6, 6)
+        self.verticalWidget = QWidget(self.centralwidget)
+        self.verticalWidget.setObjectName(u"verticalWidget")
+        self.verticalLayout_3 = QVBoxLayout(self.verticalWidget)
+        self.verticalLayout_3.setSpacing(0)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(6, 6, 6, 0)
+        self.imageFrame = QFrame(self.verticalWidget)
+        self.imageFrame.setObjectName(u"imageFrame")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.imageFrame.sizePolicy().hasHeightForWidth())
+        self.imageFrame.setSizePolicy(sizePolicy)
+        self.imageFrame.setMinimumSize(QSize(0, 606))
+        self.imageFrame.setFrameShape(QFrame.Shape.StyledPanel)
+        self.imageFrame.setFrameShadow(QFrame.Shadow.Sunken)
+        self.gridLayout = QGridLayout(self.imageFrame)
+#ifndef Q_OS_MACOS
+        self.gridLayout.setSpacing(-1)
+#endif
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
+        self.gridLayout.setContentsMargins(0, 5, 0, 5)
+        self.inputViewPort4 = QWidget(self.imageFrame)
+        self.inputViewPort4.setObjectName(u"inputViewPort4")
+        self.inputViewPort4.setMinimumSize(QSize(0, 260))
+        self.inputViewPort4.setMaximumSize(QSize(16777215, 260))
+        self.inputViewPort4_layout = QGridLayout(self.inputViewPort4)
+        self.inputViewPort4_layout.setObjectName(u"inputViewPort4_layout")
+
+        self.gridLayout.addWidget(self.inputViewPort4, 1, 1, 1, 1)
+
+        self.inputViewPort3 = QWidget(self.imageFrame)
+        self.inputViewPort3.setObjectName(u"inputViewPort3")
+        self.inputViewPort3.setMinimumSize(QSize(0, 260))
+        self.inputViewPort3.setMaximumSize(QSize(16777215, 260))
+        self.inputViewPort2_layout = QGridLayout(self.inputViewPort3)
+        self.inputViewPort2_layout.setObjectName(u"inputViewPort2_layout")
+
+        self.gridLayout.addWidget(self.inputViewPort3, 1, 0, 1, 1)
+
+        self.inputViewPort1 = QWidget(self.imageFrame)
+        self.inputViewPort1.setObjectName(u"inputViewPort1")
+        self.inputViewPort1.setMinimumSize(QSize(520, 260))
+        self.inputViewPort1.setMaximumSize(QSize(7000, 260))
+        self.inputViewPort1_layout = QGridLayout(self.inputViewPort1)
+        self.inputViewPort1_layout.setObjectName(u"inputViewPort1_layout")
+
+        self.gridLayout.addWidget(self.inputViewPort1, 0, 0, 1, 1)
+
+        self.inputViewPort2 = QWidget(self.imageFrame)
+        self.inputViewPort2.setObjectName(u"inputViewPort2")
+        self.inputViewPort2.setMinimumSize(QSize(520, 260))
+        self.inputViewPort2.setMaximumSize(QSize(70000, 260))
+        self.inputViewPort3_layout = QGridLayout(self.inputViewPort2)
+        self.inputViewPort3_layout.setObjectName(u"inputViewPort3_layout")
+
+        self.gridLayout.addWidget(self.inputViewPort2, 0, 1, 1, 1)
+
+        self.outputViewPort1 = QWidget(self.imageFrame)
+        self.outputViewPort1.setObjectName(u"outputViewPort1")
+        self.outputViewPort1.setMinimumSize(QSize(520, 260))
+        self.outputViewPort1.setMaximumSize(QSize(70000, 260))
+        self.outputViewPort1_layout = QGridLayout(self.outputViewPort1)
+        self.outputViewPort1_layout.setObjectName(u"outputViewPort1_layout")
+
+        self.gridLayout.addWidget(self.outputViewPort1, 0, 3, 1, 1)
+
+        self.outputViewPort2 = QWidget(self.imageFrame)
+        self.outputViewPort2.setObjectName(u"outputViewPort2")
+        self.outputViewPort2.setMinimumSize(QSize(0, 260))
+        self.outputViewPort2.setMaximumSize(QSize(16777215, 260))
+        self.outputViewPort2_layout = QGridLayout(self.outputViewPort2)
+        self.outputViewPort2_layout.setObjectName(u"outputViewPort2_layout")
+
+        self.gridLayout.addWidget(self.outputViewPort2, 1, 3, 1, 1)
+
+        self.inputOutputDivider = QFrame(self.imageFrame)
+        self.inputOutputDivider.setObjectName(u"inputOutputDivider")
+        self.inputOutputDivider.setFrameShadow(QFrame.Shadow.Sunken)
+        self.inputOutputDivider.setFrameShape(QFrame.Shape.VLine)
+
+        self.gridLayout.addWidget(self.inputOutputDivider, 0, 2, 2, 1)
+
+
+        self.verticalLayout_3.addWidget(self.imageFrame)
+
+        self.mixerFrame = QFrame(self.verticalWidget)
+        self.mixerFrame.setObjectName(u"mixerFrame")
+        self.mixerFrame.setMaximumSize(QSize(16777215, 232))
+        self.mixerFrame.setFrameShape(QFrame.Shape.Panel)
+        self.mixerFrame.setFrameShadow(QFrame.Shadow.Raised)
+        self.mixerFrame.setLineWidth(4)
+        self.verticalLayout = QVBoxLayout(self.mixerFrame)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.slidersSpace = QVBoxLayout()
+        self.slidersSpace.setSpacing(15)
+        self.slidersSpace.setObjectName(u"slidersSpace")
+        self.slidersLabelLayout = QHBoxLayout()
+        self.slidersLabelLayout.setObjectName(u"slidersLabelLayout")
+        self.leftSlidersLabel = QLabel(self.mixerFrame)
+        self.leftSlidersLabel.setObjectName(u"leftSlidersLabel")
+        self.leftSlidersLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.slidersLabelLayout.addWidget(self.leftSlidersLabel)
+
+        self.rightSlidersLabel = QLabel(self.mixerFrame)
+        self.rightSlidersLabel.setObjectName(u"rightSlidersLabel")
+        self.rightSlidersLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.slidersLabelLayout.addWidget(self.rightSlidersLabel)
+
+
+        self.slidersSpace.addLayout(self.slidersLabelLayout)
+
+        self.image1SlidersLayout = QHBoxLayout()
+#ifndef Q_OS_MACOS
+        self.image1SlidersLayout.setSpacing(-1)
+#endif
+        self.image1SlidersLayout.setObjectName(u"image1SlidersLayout")
+        self.image1SlidersLabel = QLabel(self.mixerFrame)
+        self.image1SlidersLabel.setObjectName(u"image1SlidersLabel")
+        self.image1SlidersLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.image1SlidersLayout.addWidget(self.image1SlidersLabel)
+
+        self.image1LeftSlider = QSlider(self.mixerFrame)
+        self.image1LeftSlider.setObjectName(u"image1LeftSlider")
+        self.image1LeftSlider.setMinimum(1)
+        self.image1LeftSlider.setMaximum(100)
+        self.image1LeftSlider.setValue(50)
+        self.image1LeftSlider.setOrientation(Qt.Orientation.Horizontal)
+        self.image1LeftSlider.setTickPosition(QSlider.TickPosition.NoTicks)
+        self.image1LeftSlider.setTickInterval(0)
+
+        self.image1SlidersLayout.addWidget(self.image1LeftSlider)
+
+        self.image1RightSlider = QSlider(self.mixerFrame)
+        self.image1RightSlider.setObjectName(u"image1RightSlider")
+        self.image1RightSlider.setMinimum(1)
+        self.image1RightSlider.setMaximum(100)
+        self.image1RightSlider.setValue(50)
+        self.image1RightSlider.setOrientation(Qt.Orientation.Horizontal)
+
+        self.image1SlidersLayout.addWidget(self.image1RightSlider)
+
+
+        self.slidersSpace.addLayout(self.image1SlidersLayout)
+
+        self.image2SlidersLayout = QHBoxLayout()
+        self.image2SlidersLayout.setObjectName(u"image2SlidersLayout")
+        self.image2Sliderslabel = QLabel(self.mixerFrame)
+        self.image2Sliderslabel.setObjectName(u"image2Sliderslabel")
+        self.image2Sliderslabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.image2SlidersLayout.addWidget(self.image2Sliderslabel)
+
+        self.image2LeftSlider = QSlider(self.mixerFrame)
+        self.image2LeftSlider.setObjectName(u"image2LeftSlider")
+        self.image2LeftSlider.setMinimum(1)
+        self.image2LeftSlider.setMaximum(100)
+        self.image2LeftSlider.setValue(50)
+        self.image2LeftSlider.setOrientation(Qt.Orientation.Horizontal)
+
+        self.image2SlidersLayout.addWidget(self.image2LeftSlider)
+
+        self.image2RightSlider = QSlider(self.mixerFrame)
+        self.image2RightSlider.setObjectName(u"image2RightSlider")
+        self.image2RightSlider.setMinimum(1)
+        self.image2RightSlider.setMaximum(100)
+        self.image2RightSlider.setValue(50)
+        self.image2RightSlider.setOrientation(Qt.Orientation.Horizontal)
+
+        self.image2SlidersLayout.addWidget(self.image2RightSlider)
+
+
+        self.slidersSpace.addLayout(self.image2SlidersLayout)
+
+        self.image3SlidersLayout = QHBoxLayout()
+        self.image3SlidersLayout.setObjectName(u"image3SlidersLayout")
+        self.image3SlidersLabel = QLabel(self.mixerFrame)
+        self.image3SlidersLabel.setObjectName(u"image3SlidersLabel")
+        self.image3SlidersLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.image3SlidersLayout.addWidget(self.image3SlidersLabel)
+
+        self.image3LeftSlider = QSlider(self.mixerFrame)
+        self.image3LeftSlider.setObjectName(u"image3LeftSlider")
+        self.image3LeftSlider.setMinimum(1)
+        self.image3LeftSlider.setMaximum(100)
+        self.image3LeftSlider.setValue(50)
+        self.image3LeftSlider.setOrientation(Qt.Orientation.Horizontal)
+
+        self.image3SlidersLayout.addWidget(self.image3LeftSlider)
+
+        self.image3RightSlider = QSlider(self.mixerFrame)
+        self.image3RightSlider.setObjectName(u"image3RightSlider")
+        self.image3RightSlider.setMinimum(1)
+        self.image3RightSlider.setMaximum(100)
+        self.image3RightSlider.setValue(50)
+        self.image3RightSlider.setOrientation(Qt.Orientation.Horizontal)
+
+        self.image3SlidersLayout.addWidget(self.image3RightSlider)
+
+
+        self.slidersSpace.addLayout(self.image3SlidersLayout)
+
+        self.image4SlidersLayout = QHBoxLayout()
+        self.image4SlidersLayout.setObjectName(u"image4SlidersLayout")
+        self.image4SlidersLabel = QLabel(self.mixerFrame)
+        self.image4SlidersLabel.setObjectName(u"image4SlidersLabel")
+        self.image4SlidersLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.image4SlidersLayout.addWidget(self.image4SlidersLabel)
+
+        self.image4LeftSlider = QSlider(self.mixerFrame)
+        self.image4LeftSlider.setObjectName(u"image4LeftSlider")
+        self.image4LeftSlider.setMinimum(1)
+        self.image4LeftSlider.setMaximum(100)
+        self.image4LeftSlider.setValue(50)
+        self.image4LeftSlider.setOrientation(Qt.Orientation.Horizontal)
+
+        self.image4SlidersLayout.addWidget(self.image4LeftSlider)
+
+        self.image4RightSlider = QSlider(self.mixerFrame)
+        self.image4RightSlider.setObjectName(u"image4RightSlider")
+        self.image4RightSlider.setMinimum(1)
+        self.image4RightSlider.setMaximum(100)
+        self.image4RightSlider.setValue(50)
+        self.image4RightSlider.setOrientation(Qt.Orientation.Horizontal)
+
+        self.image4SlidersLayout.addWidget(self.image4RightSlider)
+
+
+        self.slidersSpace.addLayout(self.image4SlidersLayout)
+
+        self.slidersAxisLayout = QHBoxLayout()
+        self.slidersAxisLayout.setObjectName(u"slidersAxisLayout")
+        self.leftSlidersAxis = QLabel(self.mixerFrame)
+        self.leftSlidersAxis.setObjectName(u"leftSlidersAxis")
+
+        self.slidersAxisLayout.addWidget(self.leftSlidersAxis)
+
+        self.rightSlidersAxis = QLabel(self.mixerFrame)
+        self.rightSlidersAxis.setObjectName(u"rightSlidersAxis")
+
+        self.slidersAxisLayout.addWidget(self.rightSlidersAxis)
+
+
+        self.slidersSpace.addLayout(self.slidersAxisLayout)
+
+        self.slidersSpace.setStretch(0, 1)
+        self.slidersSpace.setStretch(1, 7)
+        self.slidersSpace.setStretch(2, 7)
+        self.slidersSpace.setStretch(3, 7)
+        self.slidersSpace.setStretch(4, 7)
+        self.slidersSpace.setStretch(5, 1)
+
+        self.horizontalLayout.addLayout(self.slidersSpace)
+
+        self.ComboBoxSpace = QVBoxLayout()
+        self.ComboBoxSpace.setObjectName(u"ComboBoxSpace")
+        self.mixingComboBoxLabel = QLabel(self.mixerFrame)
+        self.mixingComboBoxLabel.setObjectName(u"mixingComboBoxLabel")
+
+        self.ComboBoxSpace.addWidget(self.mixingComboBoxLabel)
+
+        self.compsSelectionComboBox = QComboBox(self.mixerFrame)
+        self.compsSelectionComboBox.addItem("")
+        self.compsSelectionComboBox.addItem("")
+        self.compsSelectionComboBox.setObjectName(u"compsSelectionComboBox")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(1)
+        sizePolicy1.setHeightForWidth(self.compsSelectionComboBox.sizePolicy().hasHeightForWidth())
+        self.compsSelectionComboBox.setSizePolicy(sizePolicy1)
+        self.compsSelectionComboBox.setMinimumSize(QSize(200, 26))
+
+        self.ComboBoxSpace.addWidget(self.compsSelectionComboBox)
+
+        self.outputComboBoxLabel = QLabel(self.mixerFrame)
+        self.outputComboBoxLabel.setObjectName(u"outputComboBoxLabel")
+
+        self.ComboBoxSpace.addWidget(self.outputComboBoxLabel)
+
+        self.outputSelectionComboBox = QComboBox(self.mixerFrame)
+        self.outputSelectionComboBox.addItem("")
+        self.outputSelectionComboBox.addItem("")
+        self.outputSelectionComboBox.setObjectName(u"outputSelectionComboBox")
+        sizePolicy1.setHeightForWidth(self.outputSelectionComboBox.sizePolicy().hasHeightForWidth())
+        self.outputSelectionComboBox.setSizePolicy(sizePolicy1)
+
+        self.ComboBoxSpace.addWidget(self.outputSelectionComboBox)
+
+
+        self.horizontalLayout.addLayout(self.ComboBoxSpace)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.horizontalWidget_2 = QWidget(self.mixerFrame)
+        self.horizontalWidget_2.setObjectName(u"horizontalWidget_2")
+        self.horizontalWidget_2.setMinimumSize(QSize(0, 23))
+        self.horizontalLayout_2 = QHBoxLayout(self.horizontalWidget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.mixingProgressBar = QProgressBar(self.horizontalWidget_2)
+        self.mixingProgressBar.setObjectName(u"mixingProgressBar")
+        self.mixingProgressBar.setValue(0)
+
+        self.horizontalLayout_2.addWidget(self.mixingProgressBar)
+
+        self.livePreviewCheckBox = QCheckBox(self.horizontalWidget_2)
+        self.livePreviewCheckBox.setObjectName(u"livePreviewCheckBox")
+
+        self.horizontalLayout_2.addWidget(self.livePreviewCheckBox)
+
+        self.colorCheckBox = QCheckBox(self.horizontalWidget_2)
+        self.colorCheckBox.setObjectName(u"colorCheckBox")
+
+        self.horizontalLayout_2.addWidget(self.colorCheckBox)
+
+        self.mixBtn = QPushButton(self.horizontalWidget_2)
+        self.mixBtn.setObjectName(u"mixBtn")
+        self.mixBtn.setMinimumSize(QSize(195, 16))
+
+        self.horizontalLayout_2.addWidget(self.mixBtn)
+
+
+        self.verticalLayout.addWidget(self.horizontalWidget_2)
+
+
+        self.verticalLayout_3.addWidget(self.mixerFrame)
+
+
+        self.verticalLayout_2.addWidget(self.verticalWidget)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 1305, 31))
+        MainWindow.setMenuBar(self.menubar)
+
+        self.retranslateUi(MainWindow)
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"MainWindow", None))
+        self.leftSlidersLabel.setText(QCoreApplication.translate("MainWindow", u"Magnitude", None))
+        self.rightSlidersLabel.setText(QCoreApplication.translate("MainWindow", u"Phase", None))
+        self.image1SlidersLabel.setText(QCoreApplication.translate("MainWindow", u"Image 1", None))
+        self.image2Sliderslabel.setText(QCoreApplication.translate("MainWindow", u"Image 2", None))
+        self.image3SlidersLabel.setText(QCoreApplication.translate("MainWindow", u"Image 3", None))
+        self.image4SlidersLabel.setText(QCoreApplication.translate("MainWindow", u"Image 4", None))
+        self.leftSlidersAxis.setText(QCoreApplication.translate("MainWindow", u"              0          10          20          30          40", None))
+        self.rightSlidersAxis.setText(QCoreApplication.translate("MainWindow", u"      0          10          20          30          40", None))
+        self.mixingComboBoxLabel.setText(QCoreApplication.translate("MainWindow", u"Mixing Mode", None))
+        self.compsSelectionComboBox.setItemText(0, QCoreApplication.translate("MainWindow", u"Magnitude and Phase", None))
+        self.compsSelectionComboBox.setItemText(1, QCoreApplication.translate("MainWindow", u"Real and Imaginary", None))
+
+        self.compsSelectionComboBox.setPlaceholderText("")
+        self.outputComboBoxLabel.setText(QCoreApplication.translate("MainWindow", u"Output Port", None))
+        self.outputSelectionComboBox.setItemText(0, QCoreApplication.translate("MainWindow", u"Output View Port 1", None))
+        self.outputSelectionComboBox.setItemText(1, QCoreApplication.translate("MainWindow", u"Output View Port 2", None))
+
+        self.outputSelectionComboBox.setPlaceholderText("")
+        self.livePreviewCheckBox.setText(QCoreApplication.translate("MainWindow", u"Live Preview", None))
+#if QT_CONFIG(tooltip)
+        self.colorCheckBox.setToolTip(QCoreApplication.translate("MainWindow", u"Mix the RGB channels of the images instead of their gray levels", None))
+#endif // QT_CONFIG(tooltip)
+        self.colorCheckBox.setText(QCoreApplication.translate("MainWindow", u"Color", None))
+        self.mixBtn.setText(QCoreApplication.translate("MainWindow", u"Mix Images", None))
+    # retranslateUi
+
+
+
+# hash of the UI/main_window.ui this module was generated from, see compile_ui.py
+UI_SOURCE_HASH = "4502ad09ca8c04666b032d3c220ffcf6"
@@ -0,0 +1,519 @@
+"""
+Long-running local mixing service over HTTP, no Qt involved.
+
+Tools that need Fourier mixing post jobs here instead of embedding the app and cold-starting NumPy and the
+spectra on every call. Loaded images and their spectra stay in memory (ImageStore), so do the Mixers of recent
+image sets with their magnitude and phase planes, and the mixed components (MixCache).
+
+Requests are handed to a single batching thread. It waits up to --max-wait milliseconds for concurrent requests,
+then runs one batched forward FFT per shape over every image that isn't in memory yet, mixes every request, and
+runs one batched inverse FFT per output shape.
+
+    POST /mix       a batch_mix job as JSON (images, weights, mode, region, mask_type, softness, size, real_fft,
+                    color), plus an optional "format": "png" (default) or "npy". Returns the mixed image.
+    GET /metrics    queue depth, batch sizes, cache hit rates and per-stage latency percentiles, as JSON
+    GET /health     200 once the server is up
+
+Usage:
+    python mix_server.py --port 8765
+    curl -s localhost:8765/mix -d '{"images": ["Images/cat.jpg", "Images/roses.jpg"],
+                                    "weights": [[0.3, 0.7], [0.7, 0.3]]}' -o mixed.png
+"""
+import argparse
+import io
+import json
+import math
+import os
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+import FFTBackend
+from Image import Image
+from Instrumentation import HistogramSink, JsonLinesSink, get_instrumentation
+from Mixer import MASK_TYPES, MixCache, Mixer
+from logger_config import set_quiet, setup_logger
+
+logger = setup_logger(__name__)
+
+MODES = {"mag_phase": 0, "real_imaginary": 1}
+FORMATS = {"png": "image/png", "npy": "application/octet-stream"}
+
+
+class RequestTooLarge(Exception):
+    """A mix over the memory budget, which the server doesn't do"""
+
+
+class MixRequest:
+    stages = ("queued", "transformed", "mixed", "inverted", "encoded")
+
+    def __init__(self, images, weights, mode=0, region=None, size=None, real_fft=False, color=False,
+                 mask_type="hard", softness=None, output_format="png"):
+        """
+        Same fields as a batch_mix MixJob, the mixed image is returned instead of written
+        :param output_format: "png" or "npy"
+        """
+        if not images:
+            raise ValueError("A mix needs at least one image")
+        if len(images) != len(weights):
+            raise ValueError(f"Got {len(images)} images but {len(weights)} weights")
+        if mask_type not in MASK_TYPES:
+            raise ValueError(f"Unknown mask type {mask_type!r}, expected one of {MASK_TYPES}")
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown format {output_format!r}, expected one of {list(FORMATS)}")
+        self.images = images
+        self.weights = weights
+        self.mode = mode
+        self.region = region
+        self.size = size
+        self.real_fft = real_fft
+        self.color = color
+        self.mask_type = mask_type
+        self.softness = softness
+        self.output_format = output_format
+        # filled by the handler thread: the stored Image, or the decoded pixels and store key of a new one
+        self.loaded = []
+        self.future = Future()
+        self.span = None
+
+    @staticmethod
+    def from_dict(job):
+        """
+        Parse and validate a request body, every malformed field raises ValueError so the client gets a 400
+        """
+        if not isinstance(job, dict):
+            raise ValueError(f"Expected a JSON object, got {type(job).__name__}")
+        mode = job.get("mode", 0)
+        if isinstance(mode, str):
+            if mode not in MODES:
+                raise ValueError(f"Unknown mode {mode!r}, expected one of {list(MODES)}")
+            mode = MODES[mode]
+        if mode not in MODES.values():
+            raise ValueError(f"Unknown mode {mode!r}, expected one of {list(MODES)}")
+        images = job["images"]
+        if not isinstance(images, list) or not all(isinstance(path, str) for path in images):
+            raise ValueError("'images' must be a list of file paths")
+        weights = MixRequest.__parse_weights(job["weights"], len(images))
+        region = MixRequest.__parse_region(job.get("region"))
+        size = MixRequest.__parse_size(job.get("size"))
+        return MixRequest(images, weights, mode, region, size, job.get("real_fft", False), job.get("color", False),
+                          job.get("mask_type", "hard"), job.get("softness"), job.get("format", "png"))
+
+    @staticmethod
+    def __parse_weights(weights, count):
+        """
+        :return: the weights as a list of (float, float) pairs, one per image
+        """
+        if not isinstance(weights, list) or len(weights) != count:
+            raise ValueError(f"'weights' must be a list of {count} [first, second] pairs, one per image")
+        pairs = []
+        for pair in weights:
+            if (not isinstance(pair, list) or len(pair) != 2
+                    or not all(isinstance(weight, (int, float)) and not isinstance(weight, bool)
+                               and math.isfinite(weight) for weight in pair)):
+                raise ValueError(f"Every weight must be a pair of finite numbers, got {json.dumps(pair)[:100]}")
+            pairs.append((float(pair[0]), float(pair[1])))
+        for component in (0, 1):
+            if sum(pair[component] for pair in pairs) == 0:
+                raise ValueError("The weights of a component must not all be zero")
+        return pairs
+
+    @staticmethod
+    def __parse_region(region):
+        """
+        :return: the region as (inside_is_selected, x, y, width, height), None for no region
+        """
+        if region is None:
+            return None
+        if (not isinstance(region, list) or len(region) != 5 or not isinstance(region[0], bool)
+                or not all(isinstance(value, int) and not isinstance(value, bool) for value in region[1:])
+                or region[3] < 0 or region[4] < 0):
+            raise ValueError(f"'region' must be [inside_is_selected, x, y, width, height] with a boolean and "
+                             f"integers, the width and height not negative, got {json.dumps(region)[:100]}")
+        return tuple(region)
+
+    @staticmethod
+    def __parse_size(size):
+        """
+        :return: the size as (width, height), None for the first image's size
+        """
+        if size is None:
+            return None
+        if (not isinstance(size, list) or len(size) != 2
+                or not all(isinstance(value, int) and not isinstance(value, bool) and value > 0 for value in size)):
+            raise ValueError(f"'size' must be [width, height] with positive integers, got {json.dumps(size)[:100]}")
+        return tuple(size)
+
+    @property
+    def mixer_key(self):
+        return tuple(key for _, key in self.loaded), self.region, self.mask_type, self.softness
+
+
+class ImageStore:
+    """
+    Bounded LRU of loaded Images with their spectra, keyed by file, modification time, size and FFT settings.
+    The Images are shared by every request and are never edited.
+    """
+
+    def __init__(self, max_bytes=1024 ** 3):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(file_path, size, real_fft, color):
+        fft = FFTBackend.get_backend()
+        return (os.path.realpath(file_path), os.stat(file_path).st_mtime_ns, size, real_fft, color,
+                fft.name, fft.precision)
+
+    def get(self, key):
+        with self.lock:
+            image = self.entries.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key, image):
+        nbytes = image.image_data.nbytes + image.stored_ft.nbytes
+        with self.lock:
+            if key in self.entries or nbytes > self.max_bytes:
+                return
+            self.entries[key] = image
+            self.bytes += nbytes
+            while self.bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.bytes -= evicted.image_data.nbytes + evicted.stored_ft.nbytes
+
+    def stats(self):
+        with self.lock:
+            return {"images": len(self.entries), "bytes": self.bytes, "hits": self.hits, "misses": self.misses}
+
+
+class MixBatcher:
+    """
+    Runs the FFTs and mixes of every request on one thread, coalescing the requests that arrive together.
+    Mixers (and so their magnitude and phase planes) are only ever touched by this thread.
+    """
+
+    def __init__(self, store: ImageStore, max_batch=16, max_wait=0.005, max_queue=256, mixer_bytes=512 * 1024 ** 2,
+                 instrumentation=None):
+        """
+        :param max_batch: requests processed together at most
+        :param max_wait: seconds to wait for more requests once one arrived
+        :param max_queue: requests that may wait, further ones are rejected
+        :param mixer_bytes: memory kept by the Mixers of recent image sets
+        """
+        self.store = store
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue = queue.Queue(max_queue)
+        self.mixer_bytes = mixer_bytes
+        self.mixers = OrderedDict()
+        self.mixers_bytes = 0
+        self.mix_cache = MixCache()
+        self.histogram = HistogramSink()
+        self.instrumentation = (instrumentation or get_instrumentation()).with_sinks(self.histogram)
+        self.lock = threading.Lock()
+        self.counters = dict.fromkeys(("requests", "failed", "rejected", "batches", "batched_requests",
+                                       "max_queue_depth", "forward_fft_calls", "forward_ffts",
+                                       "inverse_fft_calls", "inverse_ffts", "mixer_hits", "mixer_misses"), 0)
+        self.thread = threading.Thread(target=self.__run, name="mix-batcher", daemon=True)
+        self.thread.start()
+
+    def submit(self, request: MixRequest):
+        """
+        :return: the Future of the mixed Image
+        :raises queue.Full: when max_queue requests are already waiting
+        """
+        request.span = self.instrumentation.span("request", MixRequest.stages, images=len(request.images),
+                                                 mode=request.mode, real_fft=request.real_fft, color=request.color)
+        try:
+            self.queue.put_nowait(request)
+        except queue.Full:
+            request.span.finish("queue full")
+            self.__count("rejected")
+            raise
+        with self.lock:
+            self.counters["requests"] += 1
+            self.counters["max_queue_depth"] = max(self.counters["max_queue_depth"], self.queue.qsize())
+        return request.future
+
+    def __count(self, counter, amount=1):
+        with self.lock:
+            self.counters[counter] += amount
+
+    def __run(self):
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.perf_counter() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self.__count("batches")
+            self.__count("batched_requests", len(batch))
+            for request in batch:
+                request.span.stage("queued")
+            try:
+                self.__process(batch)
+            except Exception as e:
+                logger.error(f"Batch of {len(batch)} requests failed: {e}")
+                self.__fail(batch, e)
+
+    def __fail(self, requests, error):
+        for request in requests:
+            if not request.future.done():
+                request.span.finish(f"{type(error).__name__}: {error}")
+                request.future.set_exception(error)
+                self.__count("failed")
+
+    def __process(self, batch):
+        self.__transform(batch)
+        spectra = {}
+        for request in batch:
+            try:
+                mixer = self.__mixer(request)
+                spectrum = mixer.mixed_spectrum(request.weights, request.mode)
+            except Exception as e:
+                self.__fail([request], e)
+                continue
+            request.span.stage("mixed", spectrum.nbytes)
+            real_shape = mixer.shape if mixer.real_fft else None
+            spectra.setdefault((spectrum.shape, spectrum.dtype.str, real_shape), []).append((request, spectrum))
+        for (_, _, real_shape), group in spectra.items():
+            requests = [request for request, _ in group]
+            try:
+                images = Mixer.inverse_batch([spectrum for _, spectrum in group], real_shape)
+            except Exception as e:
+                self.__fail(requests, e)
+                continue
+            self.__count("inverse_fft_calls")
+            self.__count("inverse_ffts", len(group))
+            for request, image in zip(requests, images):
+                request.span.stage("inverted", image.image_data.nbytes)
+                request.future.set_result(image)
+
+    def __transform(self, batch):
+        """One batched forward FFT per pixel shape over the images of the batch that aren't in the store yet"""
+        pending = {}
+        transformed = {}
+        for request in batch:
+            for loaded, key in request.loaded:
+                if isinstance(loaded, Image) or key in transformed:
+                    continue
+                # decoded by a request that raced the one which stored it
+                stored = self.store.get(key)
+                if stored is not None:
+                    transformed[key] = stored
+                    continue
+                # the same new image in several requests is transformed once
+                pending.setdefault((loaded.shape, request.real_fft), {}).setdefault(key, loaded)
+        fft = FFTBackend.get_backend()
+        for (_, real_fft), images in pending.items():
+            stack = np.stack(list(images.values()))
+            if real_fft:
+                spectra = fft.rfft2(stack)
+            else:
+                spectra = np.fft.fftshift(fft.fft2(stack), axes=(-2, -1))
+            self.__count("forward_fft_calls")
+            self.__count("forward_ffts", len(images))
+            for (key, pixels), spectrum in zip(images.items(), spectra):
+                # a copy, so evicting one image frees its spectrum whatever happens to the rest of the batch
+                image = Image(pixels, real_fft, spectrum=spectrum.copy())
+                image.image_data.setflags(write=False)
+                image.stored_ft.setflags(write=False)
+                self.store.put(key, image)
+                transformed[key] = image
+        for request in batch:
+            request.loaded = [(transformed.get(key, loaded), key) for loaded, key in request.loaded]
+            request.span.stage("transformed")
+
+    def __mixer(self, request):
+        """The Mixer of the request's images and region, reused while its images stay the same"""
+        key = request.mixer_key
+        mixer = self.mixers.get(key)
+        if mixer is not None:
+            self.mixers.move_to_end(key)
+            self.__count("mixer_hits")
+            return mixer
+        self.__count("mixer_misses")
+        mixer = Mixer([image for image, _ in request.loaded], request.region, cache=self.mix_cache,
+                      mask_type=request.mask_type, softness=request.softness,
+                      instrumentation=self.instrumentation)
+        if mixer.tiled:
+            # the server mixes and inverts in memory, in batches, while a tiled mix is done on disk
+            raise RequestTooLarge(f"Mixing {len(request.images)} images of {mixer.shape} exceeds the memory budget "
+                                  f"of {mixer.memory_budget} bytes, use batch_mix.py --large")
+        # the stack, then magnitude and phase vector planes as large as it once they're computed
+        nbytes = 3 * mixer.spectra.nbytes
+        if nbytes <= self.mixer_bytes:
+            self.mixers[key] = mixer
+            self.mixers_bytes += nbytes
+            while self.mixers_bytes > self.mixer_bytes:
+                _, evicted = self.mixers.popitem(last=False)
+                self.mixers_bytes -= 3 * evicted.spectra.nbytes
+        return mixer
+
+    def metrics(self):
+        with self.lock:
+            counters = dict(self.counters)
+        counters["queue_depth"] = self.queue.qsize()
+        counters["mean_batch_size"] = counters["batched_requests"] / counters["batches"] if counters["batches"] else 0.0
+        return {
+            **counters,
+            "image_store": self.store.stats(),
+            "mixers": {"mixers": len(self.mixers), "bytes": self.mixers_bytes},
+            "mix_cache": {"hits": self.mix_cache.hits, "misses": self.mix_cache.misses, "bytes": self.mix_cache.bytes},
+            "latency": {name: summary for name, summary in self.histogram.summary().items()
+                        if name.startswith("request/")},
+        }
+
+
+def load_request(request: MixRequest, store: ImageStore):
+    """
+    Look the request's images up in the store, and decode the missing ones, on the calling (handler) thread so
+    concurrent requests decode in parallel. Images are resized to the first one's size, as in batch_mix.
+    """
+    size = request.size
+    for path in request.images:
+        key = ImageStore.key(path, size, request.real_fft, request.color)
+        image = store.get(key)
+        if image is None:
+            image = Image.decode(path, size, request.color)
+        request.loaded.append((image, key))
+        if size is None:
+            height, width = image.size if isinstance(image, Image) else image.shape[-2:]
+            size = (width, height)
+
+
+def encode(image: Image, output_format):
+    buffer = io.BytesIO()
+    if output_format == "npy":
+        np.save(buffer, image.get_image_data())
+    else:
+        image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class MixRequestHandler(BaseHTTPRequestHandler):
+    timeout_seconds = 60
+
+    def do_GET(self):
+        if self.path == "/health":
+            self.__send(200, "application/json", b'{"status": "ok"}')
+        elif self.path == "/metrics":
+            self.__send(200, "application/json", json.dumps(self.server.batcher.metrics()).encode())
+        else:
+            self.__send_error(404, f"No such endpoint {self.path}")
+
+    def do_POST(self):
+        if self.path != "/mix":
+            self.__send_error(404, f"No such endpoint {self.path}")
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = MixRequest.from_dict(json.loads(self.rfile.read(length)))
+            load_request(request, self.server.store)
+        except FileNotFoundError as e:
+            self.__send_error(404, str(e))
+            return
+        except (KeyError, TypeError, ValueError, OSError) as e:
+            self.__send_error(400, f"Invalid mix request: {e}")
+            return
+        try:
+            image = self.server.batcher.submit(request).result(self.timeout_seconds)
+        except queue.Full:
+            self.__send_error(503, "Too many pending requests")
+            return
+        except RequestTooLarge as e:
+            self.__send_error(413, str(e))
+            return
+        except Exception as e:
+            self.__send_error(500, f"{type(e).__name__}: {e}")
+            return
+        body = encode(image, request.output_format)
+        request.span.stage("encoded", len(body))
+        request.span.finish()
+        self.__send(200, FORMATS[request.output_format], body)
+
+    def __send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def __send_error(self, status, message):
+        logger.warning(f"{self.command} {self.path}: {status} {message}")
+        self.__send(status, "application/json", json.dumps({"error": message}).encode())
+
+    def log_message(self, format, *args):
+        logger.debug("%s - " + format, self.address_string(), *args)
+
+
+class MixServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 8765), batcher: MixBatcher = None):
+        """
+        :param address: (host, port), port 0 picks a free one
+        :param batcher: defaults to a MixBatcher with its default settings
+        """
+        self.batcher = batcher or MixBatcher(ImageStore())
+        # where the handlers look images up, the one the batcher fills
+        self.store = self.batcher.store
+        super().__init__(address, MixRequestHandler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Fourier mixes over HTTP with warm caches")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch", type=int, default=16, help="requests processed together at most")
+    parser.add_argument("--max-wait", type=float, default=5, help="milliseconds to wait for requests to batch")
+    parser.add_argument("--max-queue", type=int, default=256, help="pending requests before rejecting new ones")
+    parser.add_argument("--store-bytes", type=int, default=1024 ** 3, help="memory for loaded images and spectra")
+    parser.add_argument("--fft-backend", choices=list(FFTBackend.BACKENDS), default=None)
+    parser.add_argument("--precision", choices=list(FFTBackend.PRECISIONS), default=None)
+    parser.add_argument("--metrics", default=None,
+                        help="append per-stage timings of every request, load, FFT and mix to this .jsonl file")
+    parser.add_argument("--quiet", action="store_true", help="log only warnings and errors")
+    args = parser.parse_args(argv)
+
+    if args.quiet:
+        set_quiet()
+    if args.fft_backend is not None or args.precision is not None:
+        FFTBackend.set_backend(args.fft_backend or FFTBackend.get_backend().name, args.precision or "double")
+    if args.metrics is not None:
+        get_instrumentation().add_sink(JsonLinesSink(args.metrics))
+    store = ImageStore(args.store_bytes)
+    batcher = MixBatcher(store, args.max_batch, args.max_wait / 1000, args.max_queue)
+    server = MixServer((args.host, args.port), batcher)
+    logger.info(f"Serving mixes on http://{server.server_address[0]}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Accuracy of single precision (float32/complex64) mixing against double precision, no Qt involved.
+
+Every image set is mixed in both precisions for each mode and region and the 8-bit outputs are compared.
+The report is printed as JSON, one entry per mix plus a summary:
+
+    max_abs_error       largest difference of an output pixel, in gray levels
+    mean_abs_error      mean difference of the output pixels, in gray levels
+    differing_pixels    fraction of output pixels that differ at all
+    psnr                peak signal-to-noise ratio of the single precision output, in dB (null when identical)
+    spectra_bytes       memory of the stacked spectra in each precision
+
+Usage:
+    python precision_report.py Images/cat.jpg Images/roses.jpg --size 512 512
+"""
+import argparse
+import json
+import sys
+
+import numpy as np
+
+import FFTBackend
+from Mixer import MASK_TYPES, Mixer
+from batch_mix import MODES, load_images
+from logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_REGIONS = {
+    "full": None,
+    "inside": (True, 0.25, 0.25, 0.5, 0.5),
+    "outside": (False, 0.25, 0.25, 0.5, 0.5),
+}
+
+
+def scale_region(region, shape):
+    """Turn a region given in fractions of the spectrum into pixels"""
+    if region is None:
+        return None
+    inside_is_selected, x, y, w, h = region
+    height, width = shape
+    return inside_is_selected, int(x * width), int(y * height), int(w * width), int(h * height)
+
+
+def mix(paths, size, weights, mode, region, real_fft, mask_type, precision, backend):
+    FFTBackend.set_backend(backend, precision)
+    images = load_images(paths, size, real_fft)
+    mixer = Mixer(images, scale_region(region, images[0].size), mask_type=mask_type)
+    if mode == 0:
+        result = mixer.mix_mag_phase(weights)
+    else:
+        result = mixer.mix_real_imaginary(weights)
+    return result.image_data, mixer.spectra.nbytes
+
+
+def compare(double, single):
+    error = np.abs(double.astype(np.int16) - single.astype(np.int16))
+    mse = np.mean(error.astype(np.float64) ** 2)
+    return {
+        "max_abs_error": int(error.max()),
+        "mean_abs_error": float(error.mean()),
+        "differing_pixels": float(np.count_nonzero(error) / error.size),
+        # infinite for identical outputs, which JSON can't hold
+        "psnr": float(10 * np.log10(255 ** 2 / mse)) if mse else None,
+    }
+
+
+def precision_report(paths, size=None, weights=None, real_fft=False, mask_type="hard", backend="numpy"):
+    """
+    :param paths: image file paths, mixed together
+    :param size: (width, height) the images are resized to, None to use the first image's size
+    :param weights: list of (first component weight, second component weight) tuples, defaults to a ramp
+    :return: a dict with one entry per (mode, region) and the worst case over all of them
+    """
+    if weights is None:
+        ramp = np.linspace(1, 2, len(paths))
+        weights = list(zip(ramp.tolist(), ramp[::-1].tolist()))
+    entries = []
+    for mode_name, mode in MODES.items():
+        for region_name, region in DEFAULT_REGIONS.items():
+            double, double_bytes = mix(paths, size, weights, mode, region, real_fft, mask_type, "double", backend)
+            single, single_bytes = mix(paths, size, weights, mode, region, real_fft, mask_type, "single", backend)
+            entry = {"mode": mode_name, "region": region_name, **compare(double, single),
+                     "spectra_bytes": {"double": double_bytes, "single": single_bytes}}
+            psnr = "identical" if entry["psnr"] is None else f"PSNR {entry['psnr']:.1f} dB"
+            logger.info(f"{mode_name}/{region_name}: max error {entry['max_abs_error']}, {psnr}")
+            entries.append(entry)
+    summary = {
+        "max_abs_error": max(entry["max_abs_error"] for entry in entries),
+        "mean_abs_error": max(entry["mean_abs_error"] for entry in entries),
+        "differing_pixels": max(entry["differing_pixels"] for entry in entries),
+        "psnr": min((entry["psnr"] for entry in entries if entry["psnr"] is not None), default=None),
+    }
+    return {"images": list(paths), "backend": backend, "real_fft": real_fft, "mask_type": mask_type,
+            "mixes": entries, "worst": summary}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare single and double precision mixing")
+    parser.add_argument("images", nargs="+", help="image files mixed together")
+    parser.add_argument("--size", type=int, nargs=2, metavar=("WIDTH", "HEIGHT"), default=None,
+                        help="resize the images to this size (default: the first image's size)")
+    parser.add_argument("--real-fft", action="store_true", help="mix the rfft2 half spectra")
+    parser.add_argument("--mask-type", choices=list(MASK_TYPES), default="hard",
+                        help="how the inside/outside regions are cut out")
+    parser.add_argument("--fft-backend", choices=list(FFTBackend.BACKENDS), default="numpy",
+                        help="FFT implementation, falls back to numpy when not installed")
+    args = parser.parse_args(argv)
+
+    report = precision_report(args.images, tuple(args.size) if args.size else None, real_fft=args.real_fft,
+                              mask_type=args.mask_type, backend=args.fft_backend)
+    print(json.dumps(report, indent=2, allow_nan=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,365 @@
+"""
+Streaming mixing of a frame sequence (video frames or numbered stills) against fixed reference images, no Qt involved.
+
+The spectra of the references are computed once. Every frame only goes through its own FFT: it replaces the
+previous frame in a single Mixer (see Mixer.replace_image), so the stacked spectra and the magnitude and phase
+planes of the references are reused. Decoding, FFT, mixing and encoding run on their own threads, connected by
+bounded queues, so consecutive frames overlap and memory stays the same whatever the length of the sequence.
+
+Usage:
+    python stream_mix.py "frames/*.png" Images/cat.jpg --weights 0.7,0.3 0.3,0.7 --output "out/{index:06d}.png"
+    python stream_mix.py clip.mp4 Images/cat.jpg Images/roses.jpg --weights 0.5,0.5 0.3,0.3 0.2,0.2 \\
+        --mode real_imaginary --output mixed.mp4 --fps 30
+"""
+import argparse
+import glob
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+import numpy as np
+from PIL import Image as PILImage
+
+import FFTBackend
+from Image import Image
+from Instrumentation import JsonLinesSink, get_instrumentation
+from Mixer import MASK_TYPES, Mixer
+from logger_config import set_quiet, setup_logger
+
+logger = setup_logger(__name__)
+
+MODES = {"mag_phase": 0, "real_imaginary": 1}
+
+# seconds a blocked stage waits before checking whether the stream was stopped
+_POLL_SECONDS = 0.1
+_END = object()
+
+
+class _Failed:
+    """Passed down the pipeline in place of a frame when a stage failed"""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def _put(outbox, item, stop):
+    """:return: False if the stream was stopped before the item could be queued"""
+    while not stop.is_set():
+        try:
+            outbox.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _drain(inbox, stop):
+    """Items of a queue up to the end of the stream, raising the error of a failed upstream stage"""
+    while not stop.is_set():
+        try:
+            item = inbox.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            continue
+        if item is _END:
+            return
+        if isinstance(item, _Failed):
+            raise item.error
+        yield item
+
+
+def read_frames(source, color=False):
+    """
+    Decode the frames of a sequence one at a time
+    :param source: a directory or a glob pattern of still images (taken in file name order), a .npy stack of frames
+        in the layout of Image (memory-mapped, used as is), or a video file (decoded with OpenCV)
+    :param color: RGB frames, (3, height, width), instead of gray levels
+    :return: generator of uint8 frames
+    """
+    if os.path.isdir(source) or any(c in source for c in "*?["):
+        if os.path.isdir(source):
+            extensions = PILImage.registered_extensions()
+            paths = [os.path.join(source, name) for name in os.listdir(source)
+                     if os.path.splitext(name)[1].lower() in extensions]
+        else:
+            paths = glob.glob(source)
+        for path in sorted(paths):
+            yield Image.decode(path, color=color)
+    elif source.endswith(".npy"):
+        yield from np.load(source, mmap_mode='r')
+    else:
+        yield from _read_video(source, color)
+
+
+def _read_video(path, color):
+    import cv2
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        raise ValueError(f"Could not open the video {path}")
+    try:
+        while True:
+            ok, frame = capture.read()
+            if not ok:
+                return
+            if color:
+                # OpenCV decodes to BGR, height x width x channels
+                yield np.ascontiguousarray(np.moveaxis(frame[..., ::-1], -1, 0))
+            else:
+                yield cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    finally:
+        capture.release()
+
+
+class StillsWriter:
+    def __init__(self, pattern):
+        """
+        :param pattern: path of every output frame with an {index} field, eg: out/frame_{index:06d}.png
+        """
+        self.pattern = pattern
+
+    def __call__(self, index, image: Image):
+        path = self.pattern.format(index=index)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        image.save(path)
+
+    def close(self):
+        pass
+
+
+class VideoWriter:
+    fourcc = {".mp4": "mp4v", ".avi": "MJPG", ".mkv": "XVID"}
+
+    def __init__(self, path, fps=25):
+        """
+        :param path: video file, encoded with OpenCV, the codec is picked from the extension
+        """
+        import cv2
+        self.cv2 = cv2
+        self.path = path
+        self.fps = fps
+        self.writer = None
+
+    def __call__(self, index, image: Image):
+        pixels = Image.to_interleaved(image.get_image_data())
+        if pixels.ndim == 3:
+            pixels = np.ascontiguousarray(pixels[..., ::-1])
+        if self.writer is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            codec = VideoWriter.fourcc.get(os.path.splitext(self.path)[1].lower(), "mp4v")
+            height, width = pixels.shape[:2]
+            self.writer = self.cv2.VideoWriter(self.path, self.cv2.VideoWriter_fourcc(*codec), self.fps,
+                                               (width, height), pixels.ndim == 3)
+        self.writer.write(pixels)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.release()
+
+
+def open_writer(output, fps=25):
+    """StillsWriter for paths with an {index} field, else VideoWriter"""
+    if "{index" in output:
+        return StillsWriter(output)
+    return VideoWriter(output, fps)
+
+
+class StreamMixer:
+    stages = ("decoded", "transformed", "mixed", "encoded")
+
+    def __init__(self, references: [Image], weights, mode=0, region=None, frame_index=0, mask_type="hard",
+                 softness=None, queue_size=4):
+        """
+        :param references: the fixed images, frames are resized to the size of the first one
+        :param weights: list of (first component weight, second component weight) tuples, one per image of the mix:
+            the references with the frame inserted at frame_index
+        :param mode: 0 for magnitude/phase, 1 for real/imaginary (same as MixingThread)
+        :param region: a tuple containing (inside_is_selected, x, y, width, height), or None for the full spectrum
+        :param frame_index: position of the frame among the images of the mix
+        :param mask_type: how the region is cut out, see Mixer
+        :param softness: edge width or order of soft masks, see soft_mask
+        :param queue_size: frames that may wait between two stages
+        """
+        if len(weights) != len(references) + 1:
+            raise ValueError(f"Got {len(weights)} weights for {len(references)} references and the frame")
+        if mask_type not in MASK_TYPES:
+            raise ValueError(f"Unknown mask type {mask_type!r}, expected one of {MASK_TYPES}")
+        self.references = references
+        self.weights = weights
+        self.mode = mode
+        self.region = region
+        self.frame_index = frame_index
+        self.mask_type = mask_type
+        self.softness = softness
+        self.queue_size = queue_size
+        height, width = references[0].size
+        self.size = (width, height)
+        self.real_fft = all(image.real_fft for image in references)
+        for image in references:
+            image.stored_ft
+        # stage -> seconds its thread spent working rather than waiting on the queues
+        self.busy = dict.fromkeys(StreamMixer.stages, 0.0)
+        self.mixer = None
+
+    def mix(self, frames):
+        """
+        Mix every frame with the references, the stages of consecutive frames overlapping on their own threads
+        :param frames: iterable of uint8 frames (see read_frames), consumed lazily
+        :return: generator of (frame index, mixed Image), in order
+        """
+        self.mixer = None
+        stop = threading.Event()
+        decoded, transformed, mixed = (queue.Queue(self.queue_size) for _ in range(3))
+        threads = [
+            threading.Thread(target=self.__stage, args=("decoded", enumerate(frames), np.asarray, decoded, stop, True),
+                             name="stream-decode"),
+            threading.Thread(target=self.__stage, args=("transformed", _drain(decoded, stop), self.__transform,
+                                                        transformed, stop), name="stream-fft"),
+            threading.Thread(target=self.__stage, args=("mixed", _drain(transformed, stop), self.__mix_frame,
+                                                        mixed, stop), name="stream-mix"),
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            yield from _drain(mixed, stop)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def __stage(self, name, items, function, outbox, stop, timed_items=False):
+        """
+        Apply function to every (index, value) of items and queue the results, then the end of the stream
+        :param timed_items: count the time spent getting the items as work, for the stage that decodes them
+        """
+        try:
+            items = iter(items)
+            while True:
+                started = time.perf_counter()
+                item = next(items, _END)
+                if item is _END:
+                    break
+                if not timed_items:
+                    started = time.perf_counter()
+                index, value = item
+                value = function(value)
+                self.busy[name] += time.perf_counter() - started
+                if not _put(outbox, (index, value), stop):
+                    return
+        except Exception as e:
+            _put(outbox, _Failed(e), stop)
+            return
+        _put(outbox, _END, stop)
+
+    def __transform(self, pixels):
+        frame = Image(pixels, self.real_fft, size=self.size)
+        frame.stored_ft
+        return frame
+
+    def __mix_frame(self, frame):
+        if self.mixer is None:
+            images = list(self.references)
+            images.insert(self.frame_index, frame)
+            self.mixer = Mixer(images, self.region, mask_type=self.mask_type, softness=self.softness)
+        else:
+            self.mixer.replace_image(self.frame_index, frame)
+        if self.mode == 0:
+            return self.mixer.mix_mag_phase(self.weights)
+        return self.mixer.mix_real_imaginary(self.weights)
+
+    def run(self, frames, writer, report_every=100):
+        """
+        Mix the frames and write every result as soon as it is mixed
+        :param writer: callable taking (frame index, mixed Image), eg: StillsWriter or VideoWriter
+        :param report_every: log the throughput every that many frames
+        :return: a dict with the throughput statistics of the run
+        """
+        self.busy = dict.fromkeys(StreamMixer.stages, 0.0)
+        with get_instrumentation().span("stream", references=len(self.references), size=self.size,
+                                        mode=self.mode, real_fft=self.real_fft) as span:
+            start = time.perf_counter()
+            count = 0
+            for index, image in self.mix(frames):
+                started = time.perf_counter()
+                writer(index, image)
+                self.busy["encoded"] += time.perf_counter() - started
+                count += 1
+                if report_every and count % report_every == 0:
+                    elapsed = time.perf_counter() - start
+                    logger.info(f"{count} frames mixed in {elapsed:.1f}s ({count / elapsed:.1f} frames/s)")
+            elapsed = time.perf_counter() - start
+            stats = {
+                "fft_backend": FFTBackend.get_backend().name,
+                "precision": FFTBackend.get_backend().precision,
+                "frames": count,
+                "seconds": elapsed,
+                "frames_per_second": count / elapsed if elapsed else 0.0,
+                # the stage with the most busy seconds bounds the frame rate
+                "busy_seconds": dict(self.busy),
+            }
+            span.attributes.update(stats)
+        return stats
+
+
+def _parse_weights(text):
+    first, second = text.split(",")
+    return float(first), float(second)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mix a frame sequence with fixed reference images")
+    parser.add_argument("frames", help="directory or glob pattern of stills, .npy stack of frames, or video file")
+    parser.add_argument("references", nargs="+", help="image files mixed with every frame")
+    parser.add_argument("--weights", nargs="+", type=_parse_weights, required=True,
+                        help="FIRST,SECOND component weights of the frame, then of each reference")
+    parser.add_argument("--mode", choices=list(MODES), default="mag_phase")
+    parser.add_argument("--region", nargs=4, type=int, metavar=("X", "Y", "WIDTH", "HEIGHT"), default=None,
+                        help="rectangle of the shifted spectrum to keep")
+    parser.add_argument("--outside", action="store_true", help="keep the frequencies outside of --region instead")
+    parser.add_argument("--mask-type", choices=MASK_TYPES, default="hard")
+    parser.add_argument("--softness", type=float, default=None)
+    parser.add_argument("--size", nargs=2, type=int, metavar=("WIDTH", "HEIGHT"), default=None,
+                        help="resize the references and frames to this size, defaults to the first reference's")
+    parser.add_argument("--output", required=True,
+                        help="path with an {index} field for stills, eg: out/{index:06d}.png, else a video file")
+    parser.add_argument("--fps", type=float, default=25, help="frame rate of a video output")
+    parser.add_argument("--real-fft", action="store_true", help="use half spectra (rfft2/irfft2)")
+    parser.add_argument("--color", action="store_true", help="mix the RGB channels instead of gray levels")
+    parser.add_argument("--queue-size", type=int, default=4, help="frames that may wait between two stages")
+    parser.add_argument("--report-every", type=int, default=100, help="log the throughput every N frames")
+    parser.add_argument("--fft-backend", choices=list(FFTBackend.BACKENDS), default=None)
+    parser.add_argument("--precision", choices=list(FFTBackend.PRECISIONS), default=None)
+    parser.add_argument("--metrics", default=None,
+                        help="append per-stage timings of every load, FFT, mix and of the stream to this .jsonl file")
+    parser.add_argument("--quiet", action="store_true", help="log only warnings and errors")
+    args = parser.parse_args(argv)
+
+    if args.quiet:
+        set_quiet()
+    if args.fft_backend is not None or args.precision is not None:
+        FFTBackend.set_backend(args.fft_backend or FFTBackend.get_backend().name, args.precision or "double")
+    if args.metrics is not None:
+        get_instrumentation().add_sink(JsonLinesSink(args.metrics))
+    size = tuple(args.size) if args.size else None
+    references = [Image.from_file(args.references[0], args.real_fft, size, args.color)]
+    height, width = references[0].size
+    references += [Image.from_file(path, args.real_fft, (width, height), args.color) for path in args.references[1:]]
+    region = (not args.outside, *args.region) if args.region else None
+    stream = StreamMixer(references, args.weights, MODES[args.mode], region, mask_type=args.mask_type,
+                         softness=args.softness, queue_size=args.queue_size)
+    writer = open_writer(args.output, args.fps)
+    try:
+        stats = stream.run(read_frames(args.frames, args.color), writer, args.report_every)
+    finally:
+        writer.close()
+    print(json.dumps(stats))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
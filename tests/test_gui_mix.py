@@ -0,0 +1,40 @@
+import os
+import sys
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import Qt  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from Image import Image  # noqa: E402
+from LargeImage import LargeImage  # noqa: E402
+from MixingThread import MixingThread  # noqa: E402
+from Viewport import ViewPort  # noqa: E402
+
+
+def test_mix_over_the_memory_budget_is_displayed():
+    app = QApplication.instance() or QApplication([])
+    rng = np.random.default_rng(0)
+    images = [Image((rng.random((960, 1280)) * 255).astype(np.uint8)) for _ in range(2)]
+    output = ViewPort(is_input=False)
+
+    results, errors = [], []
+    thread = MixingThread(images, [(0.3, 0.7), (0.7, 0.3)], 0, (1280, 960), (True, 300, 200, 600, 500),
+                          edits=[(10, 1.2), (0, 1)], memory_budget=1 << 20)
+    thread.result_ready.connect(results.append, Qt.DirectConnection)
+    thread.error_occurred.connect(errors.append, Qt.DirectConnection)
+    thread.start()
+    assert thread.wait(30000)
+    app.processEvents()
+
+    assert not errors
+    assert isinstance(results[0], LargeImage)
+    output.set_image(results[0])
+    width, height = output.display_size
+    step = min(960 // height, 1280 // width)
+    assert step > 1
+    assert np.array_equal(output.source.image_data, results[0].image_data[::step, ::step])
+    assert output.image.size == (height, width)
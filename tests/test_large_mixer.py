@@ -0,0 +1,25 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Image import Image  # noqa: E402
+from LargeImage import LargeImage, ScratchSpace  # noqa: E402
+from Mixer import Mixer  # noqa: E402
+
+
+def test_large_images_mix_in_tiles_like_in_memory_images(tmp_path):
+    rng = np.random.default_rng(0)
+    pixels = [(rng.random((48, 64)) * 255).astype(np.uint8) for _ in range(2)]
+    scratch = ScratchSpace(str(tmp_path))
+    large = [LargeImage(data, scratch) for data in pixels]
+    weights = [(0.3, 0.7), (0.7, 0.3)]
+
+    mixer = Mixer(large, (True, 20, 14, 24, 20), memory_budget=4096)
+    assert mixer.tiled and mixer.channels == 1
+    tiled = np.asarray(mixer.mix_mag_phase(weights).get_image_data())
+
+    expected = Mixer([Image(data) for data in pixels], (True, 20, 14, 24, 20)).mix_mag_phase(weights)
+    assert np.abs(tiled.astype(int) - expected.get_image_data()).max() <= 1
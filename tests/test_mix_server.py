@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import LargeImage  # noqa: E402
+from mix_server import MixRequest, MixServer  # noqa: E402
+
+IMAGES = [os.path.join(ROOT, "Images", "cat.jpg"), os.path.join(ROOT, "Images", "roses.jpg")]
+WEIGHTS = [[0.3, 0.7], [0.7, 0.3]]
+
+
+@pytest.mark.parametrize("weights", [
+    [["a", 1], [1, 1]],
+    [[0.5, 0.5]],
+    [0.5, 0.5],
+    [[0, 1], [0, 1]],
+    [[True, 1], [1, 1]],
+    [[float("nan"), 1], [1, 1]],
+    "x",
+])
+def test_malformed_weights_are_rejected(weights):
+    with pytest.raises(ValueError):
+        MixRequest.from_dict({"images": IMAGES, "weights": weights})
+
+
+@pytest.mark.parametrize("region", [
+    [True, 10, 10, 20],
+    [1, 10, 10, 20, 20],
+    [True, 10.5, 10, 20, 20],
+    [True, 10, 10, -20, 20],
+    [True, 10, 10, 20, False],
+    "inside",
+    {"x": 10},
+])
+def test_malformed_regions_are_rejected(region):
+    with pytest.raises(ValueError):
+        MixRequest.from_dict({"images": IMAGES, "weights": WEIGHTS, "region": region})
+
+
+@pytest.mark.parametrize("size", [[64], [64, 0], [64, -1], [64.0, 64], [True, 64], "64x64", 64])
+def test_malformed_sizes_are_rejected(size):
+    with pytest.raises(ValueError):
+        MixRequest.from_dict({"images": IMAGES, "weights": WEIGHTS, "size": size})
+
+
+def test_well_formed_region_and_size_are_parsed():
+    request = MixRequest.from_dict({"images": IMAGES, "weights": WEIGHTS, "region": [False, -4, 10, 0, 20],
+                                    "size": [64, 48]})
+    assert request.region == (False, -4, 10, 0, 20)
+    assert request.size == (64, 48)
+
+
+@pytest.fixture
+def server():
+    server = MixServer(("127.0.0.1", 0))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def post(server, body):
+    """:return: the status and the body of the response"""
+    url = f"http://127.0.0.1:{server.server_address[1]}/mix"
+    request = urllib.request.Request(url, data=json.dumps(body).encode())
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def test_malformed_requests_get_a_400(server):
+    for job in ({"images": IMAGES, "weights": WEIGHTS, "region": [True, 10, 10, -1, 5]},
+                {"images": IMAGES, "weights": WEIGHTS, "size": [0, 64]},
+                {"images": IMAGES, "weights": [[0, 1], [0, 1]]}):
+        status, body = post(server, job)
+        assert status == 400
+        assert json.loads(body)["error"].startswith("Invalid mix request")
+
+
+def test_mix_over_the_memory_budget_gets_a_413(server, monkeypatch):
+    job = {"images": IMAGES, "weights": WEIGHTS, "size": [64, 64], "region": [True, 16, 16, 32, 32]}
+    assert post(server, job)[0] == 200
+    monkeypatch.setattr(LargeImage, "_memory_budget", 1024)
+    status, body = post(server, {**job, "size": [64, 48]})
+    assert status == 413
+    assert "memory budget" in json.loads(body)["error"]
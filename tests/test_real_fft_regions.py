@@ -0,0 +1,27 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Image import Image  # noqa: E402
+from Mixer import Mixer  # noqa: E402
+
+
+@pytest.mark.parametrize("region, half_spectra", [
+    ((True, 30, 22, 21, 21), True),   # centered on DC
+    ((True, 30, 22, 20, 20), False),  # one bin off
+    ((True, 2, 2, 20, 20), False),    # entirely left of and above DC
+    ((False, 10, 22, 20, 20), False),
+])
+def test_half_spectrum_regions_mix_like_full_spectra(region, half_spectra):
+    rng = np.random.default_rng(0)
+    pixels = [(rng.random((64, 80)) * 255).astype(np.uint8) for _ in range(2)]
+    weights = [(0.3, 0.7), (0.7, 0.3)]
+    full = Mixer([Image(data) for data in pixels], region)
+    half = Mixer([Image(data, real_fft=True) for data in pixels], region)
+    assert half.real_fft == half_spectra
+    expected = full.mix_real_imaginary(weights).get_image_data()
+    assert np.array_equal(half.mix_real_imaginary(weights).get_image_data(), expected)